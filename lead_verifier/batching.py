@@ -0,0 +1,189 @@
+"""Group single-lead calls into ``verify_many`` batches for scrapers that support them."""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import CancelledError, Future, TimeoutError as FutureTimeout
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from . import cancellation
+from .models import LeadInput, LeadVerification
+
+LOGGER = logging.getLogger(__name__)
+
+_CANCEL_POLL_SECONDS = 0.1
+
+
+def supports_verify_many(scraper: Any) -> bool:
+    """Return ``True`` when ``scraper`` can verify several leads in one call.
+
+    Wrappers advertise the capability of the scraper they wrap through a
+    ``supports_verify_many`` attribute; plain scrapers only need a callable
+    ``verify_many``.
+    """
+
+    declared = getattr(scraper, "supports_verify_many", None)
+    if declared is not None:
+        return bool(declared)
+    return callable(getattr(scraper, "verify_many", None))
+
+
+def verify_each(scraper: Any, leads: Sequence[LeadInput]) -> List[LeadVerification]:
+    """Call ``scraper.verify_many`` when supported, otherwise ``verify`` once per lead."""
+
+    if supports_verify_many(scraper):
+        results = list(scraper.verify_many(list(leads)))
+        if len(results) != len(leads):
+            raise RuntimeError(
+                f"Scraper {getattr(scraper, 'name', scraper)} returned {len(results)} results for {len(leads)} leads"
+            )
+        return results
+    return [scraper.verify(lead) for lead in leads]
+
+
+class MicroBatcher:
+    """Collect single-lead requests and hand them to ``scraper.verify_many`` in batches.
+
+    A batch is sent once ``batch_size`` leads are waiting or the oldest has
+    waited ``linger_seconds``.  :meth:`prefetch` queues a whole list up front
+    so full batches go out immediately; a later :meth:`verify` for one of
+    those leads waits for its prefetched result.  If ``verify_many`` raises,
+    every lead of that batch receives the exception.  Requests remember the
+    cancellation token they were submitted under: a batch is sent under that
+    token, and requests whose token is cancelled are dropped instead of sent.
+    A :meth:`verify` call made under a token stops waiting once it is
+    cancelled.
+    """
+
+    def __init__(self, scraper: Any, *, batch_size: int = 25, linger_seconds: float = 0.05) -> None:
+        self.scraper = scraper
+        self.batch_size = max(1, batch_size)
+        self.linger_seconds = max(0.0, linger_seconds)
+        self.batches_sent = 0
+        self._waiting: List[Tuple[LeadInput, Future, Optional[cancellation.CancellationToken]]] = []
+        self._oldest: Optional[float] = None
+        self._prefetched: Dict[int, List[Future]] = {}
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name=f"micro-batcher:{getattr(scraper, 'name', 'scraper')}", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def name(self) -> str:
+        return getattr(self.scraper, "name", self.scraper.__class__.__name__)
+
+    def submit(self, lead: LeadInput) -> "Future[LeadVerification]":
+        future: "Future[LeadVerification]" = Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("MicroBatcher is closed")
+            if not self._waiting:
+                self._oldest = time.monotonic()
+            self._waiting.append((lead, future, cancellation.current_token()))
+            self._condition.notify()
+        return future
+
+    def prefetch(self, leads: Iterable[LeadInput]) -> None:
+        """Queue ``leads`` now so their results are ready when :meth:`verify` asks for them."""
+
+        for lead in leads:
+            future = self.submit(lead)
+            with self._condition:
+                self._prefetched.setdefault(id(lead), []).append(future)
+
+    def verify(self, lead: LeadInput) -> LeadVerification:
+        with self._condition:
+            futures = self._prefetched.get(id(lead))
+            future = futures.pop(0) if futures else None
+            if futures is not None and not futures:
+                del self._prefetched[id(lead)]
+        if future is None:
+            future = self.submit(lead)
+        token = cancellation.current_token()
+        try:
+            while token is not None:
+                try:
+                    return future.result(timeout=_CANCEL_POLL_SECONDS)
+                except FutureTimeout:
+                    token.raise_if_cancelled()
+            return future.result()
+        except CancelledError:
+            cancellation.check_cancelled()
+            raise
+
+    def discard_prefetched(self, leads: Iterable[LeadInput]) -> None:
+        """Drop prefetched requests for ``leads`` that were never collected.
+
+        Requests still waiting for a batch are removed and their futures
+        cancelled, so an aborted run does not keep the scraper busy.
+        """
+
+        discarded: List[Future] = []
+        with self._condition:
+            for lead in leads:
+                discarded.extend(self._prefetched.pop(id(lead), []))
+            if discarded:
+                dropped = {id(future) for future in discarded}
+                self._waiting = [entry for entry in self._waiting if id(entry[1]) not in dropped]
+                if not self._waiting:
+                    self._oldest = None
+        for future in discarded:
+            future.cancel()
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+
+    # ------------------------------------------------------------------
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while True:
+                    if self._waiting and (
+                        len(self._waiting) >= self.batch_size
+                        or self._closed
+                        or time.monotonic() - (self._oldest or 0.0) >= self.linger_seconds
+                    ):
+                        break
+                    if self._closed:
+                        return
+                    timeout = None
+                    if self._waiting:
+                        timeout = self.linger_seconds - (time.monotonic() - (self._oldest or 0.0))
+                    self._condition.wait(timeout)
+                batch, self._waiting = self._waiting[: self.batch_size], self._waiting[self.batch_size:]
+                self._oldest = time.monotonic() if self._waiting else None
+            self._send(batch)
+
+    def _send(self, batch: List[Tuple[LeadInput, Future, Optional[cancellation.CancellationToken]]]) -> None:
+        live = []
+        for lead, future, token in batch:
+            if token is not None and token.cancelled:
+                future.cancel()
+            elif future.set_running_or_notify_cancel():
+                live.append((lead, future, token))
+        if not live:
+            return
+        leads = [lead for lead, _, _ in live]
+        tokens = {id(token): token for _, _, token in live}
+        # Scraper waits are cancellable when every lead of the batch shares one token.
+        token = live[0][2] if len(tokens) == 1 else None
+        LOGGER.debug("Sending batch of %s leads to %s", len(leads), self.name)
+        self.batches_sent += 1
+        try:
+            with cancellation.cancellation_scope(token):
+                results = verify_each(self.scraper, leads)
+        except BaseException as exc:
+            for _, future, _ in live:
+                future.set_exception(exc)
+            return
+        for (_, future, _), result in zip(live, results):
+            future.set_result(result)
+
+
+__all__ = ["MicroBatcher", "supports_verify_many", "verify_each"]
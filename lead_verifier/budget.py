@@ -0,0 +1,135 @@
+"""Job-level time budgets driven by observed per-scraper latency."""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from .gating import skipped_result
+from .models import LeadVerification
+
+
+class LatencyTracker:
+    """Exponentially weighted latency and hit rate for each scraper.
+
+    ``alpha`` is the weight of the newest observation.  The hit rate is the
+    share of calls that found at least one contact, smoothed so a scraper
+    with few calls is neither written off nor over-trusted.
+    """
+
+    def __init__(self, *, alpha: float = 0.3) -> None:
+        self.alpha = alpha
+        self._latency: Dict[str, float] = {}
+        self._calls: Dict[str, int] = {}
+        self._hits: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, seconds: float, *, found: bool) -> None:
+        with self._lock:
+            previous = self._latency.get(name)
+            self._latency[name] = seconds if previous is None else previous + self.alpha * (seconds - previous)
+            self._calls[name] = self._calls.get(name, 0) + 1
+            self._hits[name] = self._hits.get(name, 0) + int(found)
+
+    def latency(self, name: str) -> Optional[float]:
+        """Return the smoothed seconds per call, or ``None`` before the first call."""
+
+        with self._lock:
+            return self._latency.get(name)
+
+    def hit_rate(self, name: str) -> float:
+        with self._lock:
+            return (self._hits.get(name, 0) + 1) / (self._calls.get(name, 0) + 2)
+
+    def calls(self, name: str) -> int:
+        with self._lock:
+            return self._calls.get(name, 0)
+
+
+class TimeBudget:
+    """Wall-clock allowance for a whole job, starting when it is created.
+
+    :meth:`plan` decides which scrapers a lead can still afford.  Scrapers
+    are ranked by value per second (hit rate over latency); the best one
+    runs as long as it can finish before the deadline, and the others only
+    while their estimated latency fits the lead's share of the remaining
+    time.  Scrapers without a latency estimate yet always run so they get
+    measured.  Once the budget is spent every scraper is skipped.
+    """
+
+    def __init__(self, seconds: float, *, clock: Callable[[], float] = time.monotonic) -> None:
+        if seconds <= 0:
+            raise ValueError("time budget must be positive")
+        self.seconds = seconds
+        self._clock = clock
+        self.deadline = clock() + seconds
+
+    def remaining(self) -> float:
+        return max(0.0, self.deadline - self._clock())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def plan(
+        self,
+        names: Sequence[str],
+        tracker: LatencyTracker,
+        *,
+        leads_left: Optional[int] = None,
+        parallel_leads: int = 1,
+        concurrent: bool = False,
+    ) -> Dict[str, str]:
+        """Return ``{scraper name: reason}`` for the scrapers the next lead should skip.
+
+        ``leads_left`` (including this one) spreads the remaining time over
+        the leads still to start, ``parallel_leads`` of which run at once;
+        without it the lead may use all the remaining time.  ``concurrent``
+        means the lead's scrapers run in parallel, so their latencies overlap.
+        """
+
+        remaining = self.remaining()
+        if remaining <= 0:
+            return {name: "time budget exhausted" for name in names}
+        share = remaining
+        if leads_left:
+            share = remaining * max(1, parallel_leads) / max(1, leads_left)
+
+        measured: List[Tuple[float, int, str, float]] = []
+        for index, name in enumerate(names):
+            latency = tracker.latency(name)
+            if latency is not None:
+                measured.append((-tracker.hit_rate(name) / max(latency, 1e-6), index, name, latency))
+        measured.sort()
+
+        skip: Dict[str, str] = {}
+        spent = 0.0
+        kept = False
+        for _, _, name, latency in measured:
+            if latency > remaining:
+                skip[name] = f"time budget: needs ~{latency:.1f}s, {remaining:.1f}s left"
+                continue
+            cost = latency if concurrent else spent + latency
+            if kept and cost > share:
+                skip[name] = f"time budget: needs ~{latency:.1f}s, {share:.1f}s left per lead"
+                continue
+            spent = max(spent, latency) if concurrent else spent + latency
+            kept = True
+        return skip
+
+
+def budget_skipped_result(name: str, reason: str) -> LeadVerification:
+    """Return the placeholder result of a scraper skipped to stay within the time budget.
+
+    The ``time_budget`` flag drives :attr:`AggregatedLeadResult.status`.
+    """
+
+    result = skipped_result(name, reason)
+    result.raw_data["time_budget"] = True
+    return result
+
+
+__all__ = [
+    "LatencyTracker",
+    "TimeBudget",
+    "budget_skipped_result",
+]
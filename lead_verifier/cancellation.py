@@ -0,0 +1,117 @@
+"""Cooperative cancellation that reaches into scraper waits.
+
+A :class:`CancellationToken` is installed for a block of work with
+:func:`cancellation_scope`.  Scrapers and wrappers call :func:`sleep` and
+:func:`check_cancelled` instead of :func:`time.sleep`, so a cancel interrupts
+throttles, rate limits and page waits within a fraction of a second.  The
+token lives in a context variable; use :func:`submit_with_context` to carry it
+into executor threads.
+"""
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import threading
+import time
+from concurrent.futures import Executor, Future
+from typing import Any, Callable, Iterator, List, Optional
+
+
+class Cancelled(Exception):
+    """Raised inside work whose cancellation token was cancelled.
+
+    ``results`` carries whatever the cancelled call had already completed.
+    """
+
+    def __init__(self, message: str = "Cancelled", *, results: Optional[List[Any]] = None) -> None:
+        super().__init__(message)
+        self.results = list(results or [])
+
+
+class CancellationToken:
+    """Thread-safe cancellation flag whose waits end as soon as it is cancelled.
+
+    Pass an existing ``event`` to share it: setting the event cancels the
+    token, as used by the desktop UI's cancel button.
+    """
+
+    def __init__(self, event: Optional[threading.Event] = None) -> None:
+        self._event = event if event is not None else threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block up to ``timeout`` seconds; return ``True`` if the token was cancelled."""
+
+        return self._event.wait(timeout)
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise Cancelled()
+
+    def sleep(self, seconds: float) -> None:
+        """Sleep for ``seconds`` unless cancelled first, in which case raise :class:`Cancelled`."""
+
+        if self._event.wait(max(0.0, seconds)):
+            raise Cancelled()
+
+
+_CURRENT: contextvars.ContextVar[Optional[CancellationToken]] = contextvars.ContextVar(
+    "lead_verifier_cancellation", default=None
+)
+
+
+def current_token() -> Optional[CancellationToken]:
+    return _CURRENT.get()
+
+
+@contextlib.contextmanager
+def cancellation_scope(token: Optional[CancellationToken]) -> Iterator[Optional[CancellationToken]]:
+    """Make ``token`` the current token for the enclosed block."""
+
+    reset = _CURRENT.set(token)
+    try:
+        yield token
+    finally:
+        _CURRENT.reset(reset)
+
+
+def check_cancelled() -> None:
+    """Raise :class:`Cancelled` if the current token has been cancelled."""
+
+    token = _CURRENT.get()
+    if token is not None:
+        token.raise_if_cancelled()
+
+
+def sleep(seconds: float) -> None:
+    """:func:`time.sleep` that ends early with :class:`Cancelled` when the current token is cancelled."""
+
+    token = _CURRENT.get()
+    if token is None:
+        if seconds > 0:
+            time.sleep(seconds)
+        return
+    token.sleep(seconds)
+
+
+def submit_with_context(executor: Executor, func: Callable[..., Any], *args: Any) -> Future:
+    """Submit ``func`` so it runs with the caller's context, including its cancellation token."""
+
+    return executor.submit(contextvars.copy_context().run, func, *args)
+
+
+__all__ = [
+    "CancellationToken",
+    "Cancelled",
+    "cancellation_scope",
+    "check_cancelled",
+    "current_token",
+    "sleep",
+    "submit_with_context",
+]
@@ -0,0 +1,110 @@
+"""Deferred handling for leads blocked on a manual CAPTCHA challenge."""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Optional
+
+from .models import AggregatedLeadResult, LeadInput, LeadVerification
+
+LOGGER = logging.getLogger(__name__)
+
+
+class CaptchaDeferred(Exception):
+    """Raised by a scraper that hit a CAPTCHA and kept its browser state open.
+
+    ``resume`` finishes the interrupted call once a human has solved the
+    challenge, returning what that call would have returned, and may raise
+    :class:`CaptchaDeferred` again if it is still unsolved.
+    ``release`` discards the held browser state without finishing.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        resume: Callable[[], Any],
+        release: Optional[Callable[[], None]] = None,
+    ) -> None:
+        super().__init__(message)
+        self.resume = resume
+        self.release = release
+
+
+@dataclass
+class DeferredLead:
+    """A lead parked while one of its scrapers waits on a CAPTCHA.
+
+    ``retry`` is a fresh lookup that replaces ``resume`` whenever the entry
+    has to give up its browser state.
+    """
+
+    lead: LeadInput
+    scraper_name: str
+    resume: Callable[[], LeadVerification]
+    release: Optional[Callable[[], None]] = None
+    reason: str = ""
+    retry: Optional[Callable[[], LeadVerification]] = None
+    created_at: float = field(default_factory=time.time)
+    aggregated: Optional[AggregatedLeadResult] = None
+
+    @property
+    def holds_browser(self) -> bool:
+        return self.release is not None
+
+
+class AttentionQueue:
+    """Leads that need an operator, with a cap on how many keep a browser open.
+
+    Up to ``max_held`` entries keep their browser context so the operator can
+    solve the CAPTCHA in place.  Further entries release their context and are
+    retried with a fresh lookup when resolved.
+    """
+
+    def __init__(self, max_held: int = 5) -> None:
+        self.max_held = max(0, max_held)
+        self._entries: List[DeferredLead] = []
+        self._lock = threading.Lock()
+
+    def park(self, entry: DeferredLead, retry: Optional[Callable[[], LeadVerification]] = None) -> DeferredLead:
+        """Queue ``entry``; ``retry`` is kept as its fresh lookup unless it already has one."""
+
+        if entry.retry is None:
+            entry.retry = retry
+        with self._lock:
+            held = sum(1 for existing in self._entries if existing.holds_browser)
+            if entry.holds_browser and entry.retry is not None and held >= self.max_held:
+                release, entry.release = entry.release, None
+                entry.resume = entry.retry
+                try:
+                    release()
+                except Exception:  # pragma: no cover - defensive cleanup
+                    LOGGER.exception("Failed to release browser state for %s", entry.scraper_name)
+            self._entries.append(entry)
+        return entry
+
+    def attach(self, lead: LeadInput, aggregated: AggregatedLeadResult) -> None:
+        """Link parked entries for ``lead`` to its merged result."""
+
+        with self._lock:
+            for entry in self._entries:
+                if entry.lead is lead and entry.aggregated is None:
+                    entry.aggregated = aggregated
+
+    def pending(self) -> List[DeferredLead]:
+        with self._lock:
+            return list(self._entries)
+
+    def take_all(self) -> List[DeferredLead]:
+        with self._lock:
+            entries, self._entries = self._entries, []
+        return entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+__all__ = ["AttentionQueue", "CaptchaDeferred", "DeferredLead"]
@@ -2,15 +2,33 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
 import logging
+import multiprocessing
+import os
+import signal
 import sys
+import threading
+import time
+from collections import Counter
 from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple
 
 from lead_verifier.orchestrator import VerificationOrchestrator
 
-from .config import load_configuration
+from .cancellation import CancellationToken, Cancelled, cancellation_scope, current_token
+from .config import iter_enabled_scraper_configs, load_configuration
 from .factory import build_scrapers
-from .io import load_leads, write_results
+from .gating import build_execution_policy
+from .io import ResultWriter, iter_leads, load_leads, write_results
+from .jobqueue import DEFAULT_QUEUE_PATH, JobQueueBackend, open_queue, run_worker
+from .models import AggregatedLeadResult, LeadInput
+from .pipeline import VerificationPipeline
+from .planning import EtaReporter, build_run_plan, format_duration
+from .serialization import aggregated_from_dict, aggregated_to_dict
+from .scheduling import parse_priority
+from .server import VerificationServer
+from .sharding import ShardSpec, merge_in_input_order, parse_shard_spec, select_shard, shard_for
 
 
 def build_parser(*, prog: str | None = None) -> argparse.ArgumentParser:
@@ -26,6 +44,53 @@ def parse_args(argv: list[str] | None = None, *, prog: str | None = None) -> arg
     parser = build_parser(prog=prog)
     parser.add_argument("input", help="Path to the input spreadsheet (CSV or XLSX)")
     parser.add_argument("output", help="Path where the aggregated results should be written")
+    _add_orchestrator_arguments(parser)
+    parser.add_argument(
+        "--shard",
+        type=_shard_argument,
+        default=None,
+        metavar="I/N",
+        help="Only verify shard I of N (leads are assigned by a stable hash)",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=1,
+        help="Split the input into this many shards and verify them in parallel processes",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Read, verify and write leads as a bounded pipeline instead of holding the whole file in memory",
+    )
+    parser.add_argument(
+        "--queue-depth",
+        type=int,
+        default=64,
+        help="Capacity of each queue between pipeline stages with --stream",
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        default=None,
+        metavar="MINUTES",
+        help="Finish within this many minutes, skipping slow scrapers as the deadline nears "
+        "(defaults to the 'time_budget_minutes' config value)",
+    )
+    _add_log_level_argument(parser)
+    args = parser.parse_args(argv)
+    if args.time_budget is not None and args.time_budget <= 0:
+        parser.error("--time-budget must be positive")
+    if args.processes < 1:
+        parser.error("--processes must be at least 1")
+    if args.shard is not None and args.processes > 1:
+        parser.error("--shard and --processes cannot be combined")
+    if args.stream and args.processes > 1:
+        parser.error("--stream and --processes cannot be combined")
+    return args
+
+
+def _add_orchestrator_arguments(parser: argparse.ArgumentParser) -> None:
     parser.add_argument(
         "--config",
         required=True,
@@ -43,42 +108,530 @@ def parse_args(argv: list[str] | None = None, *, prog: str | None = None) -> arg
         default=None,
         help="Maximum number of workers to use in concurrent mode",
     )
+    parser.add_argument(
+        "--lead-concurrency",
+        type=int,
+        default=None,
+        help="Number of leads to verify at once (defaults to the 'lead_concurrency' config value or 1)",
+    )
     parser.add_argument(
         "--raise-on-error",
         action="store_true",
         help="Propagate scraper exceptions instead of recording them in the output",
     )
+
+
+def _add_log_level_argument(parser: argparse.ArgumentParser) -> None:
     parser.add_argument(
         "--log-level",
         default="INFO",
         help="Logging level (e.g. DEBUG, INFO, WARNING)",
     )
+
+
+def _add_queue_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--queue",
+        default=os.environ.get("LEAD_VERIFIER_QUEUE", DEFAULT_QUEUE_PATH),
+        help="Job queue location: a SQLite path or <backend>://<location> (default: $LEAD_VERIFIER_QUEUE)",
+    )
+
+
+SUBCOMMANDS = ("submit", "worker", "collect", "serve", "plan")
+
+
+def parse_command_args(argv: list[str], *, prog: str | None = None) -> argparse.Namespace:
+    """Parse the ``submit``/``worker``/``collect`` job queue commands, ``serve`` and ``plan``."""
+
+    parser = build_parser(prog=prog)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    submit = commands.add_parser("submit", help="Queue a spreadsheet for verification by workers")
+    submit.add_argument("input", help="Path to the input spreadsheet (CSV or XLSX)")
+    submit.add_argument("--batch-size", type=int, default=25, help="Leads per batch handed to a worker")
+    submit.add_argument("--job-id", default=None, help="Explicit job id (generated when omitted)")
+    submit.add_argument(
+        "--priority",
+        type=parse_priority,
+        default=0,
+        help="Job priority: a number or bulk/low/normal/high/urgent (a 'priority' column overrides it per lead)",
+    )
+    submit.add_argument(
+        "--weight",
+        type=float,
+        default=None,
+        help="Fair share of worker time relative to other jobs (defaults from --priority: normal=1, high=2)",
+    )
+    submit.add_argument(
+        "--deadline-minutes",
+        type=float,
+        default=None,
+        help="Serve the job ahead of other work once it is this close to being due",
+    )
+
+    worker = commands.add_parser("worker", help="Verify queued batches until stopped")
+    _add_orchestrator_arguments(worker)
+    worker.add_argument("--worker-id", default=None, help="Name recorded on leased batches (default: host:pid)")
+    worker.add_argument("--lease-seconds", type=float, default=1800.0, help="How long a batch stays leased")
+    worker.add_argument("--poll-interval", type=float, default=5.0, help="Seconds between polls when idle")
+    worker.add_argument("--exit-when-idle", action="store_true", help="Exit once the queue is empty")
+
+    collect = commands.add_parser("collect", help="Write a job's results in input order")
+    collect.add_argument("job_id", help="Job id printed by 'submit'")
+    collect.add_argument("output", help="Path where the aggregated results should be written")
+    collect.add_argument("--wait", action="store_true", help="Wait for outstanding batches to finish")
+    collect.add_argument("--poll-interval", type=float, default=10.0, help="Seconds between checks with --wait")
+    collect.add_argument(
+        "--allow-partial",
+        action="store_true",
+        help="Write whatever has completed even if batches are outstanding or failed",
+    )
+
+    for command in (submit, worker, collect):
+        _add_queue_argument(command)
+        _add_log_level_argument(command)
+
+    serve = commands.add_parser("serve", help="Run a local HTTP API for submitting and streaming jobs")
+    _add_orchestrator_arguments(serve)
+    serve.add_argument("--host", default="127.0.0.1", help="Interface to listen on")
+    serve.add_argument("--port", type=int, default=8765, help="Port to listen on")
+    _add_log_level_argument(serve)
+
+    plan = commands.add_parser("plan", help="Estimate scraper calls and run time without verifying anything")
+    plan.add_argument("input", help="Path to the input spreadsheet (CSV or XLSX)")
+    _add_orchestrator_arguments(plan)
+    plan.add_argument(
+        "--hit-rate",
+        action="append",
+        default=[],
+        type=_hit_rate_argument,
+        metavar="NAME=RATE",
+        help="Expected share of leads scraper NAME finds contacts for, used to estimate gated scrapers' calls",
+    )
+    plan.add_argument(
+        "--time-budget",
+        type=float,
+        default=None,
+        metavar="MINUTES",
+        help="Exit with status 1 if the minimum run time exceeds this many minutes",
+    )
+    _add_log_level_argument(plan)
     return parser.parse_args(argv)
 
 
+def _hit_rate_argument(value: str) -> Tuple[str, float]:
+    name, _, rate = value.rpartition("=")
+    try:
+        parsed = float(rate)
+    except ValueError:
+        parsed = -1.0
+    if not name or not 0.0 <= parsed <= 1.0:
+        raise argparse.ArgumentTypeError(f"expected NAME=RATE with RATE between 0 and 1, got '{value}'")
+    return name, parsed
+
+
+def _shard_argument(value: str) -> ShardSpec:
+    try:
+        return parse_shard_spec(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from exc
+
+
+@contextlib.contextmanager
+def _cancel_on_interrupt() -> Iterator[CancellationToken]:
+    """Turn the first Ctrl-C into a cooperative cancel of the enclosed run.
+
+    Scrapers stop at their next wait and completed results are still
+    written.  A second Ctrl-C falls back to the default behaviour and aborts
+    immediately.
+    """
+
+    token = CancellationToken()
+    if threading.current_thread() is not threading.main_thread():
+        with cancellation_scope(token):
+            yield token
+        return
+
+    def handle(signum, frame) -> None:
+        logging.warning("Interrupted - finishing up and writing completed results (Ctrl-C again to abort)")
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        token.cancel()
+
+    previous = signal.signal(signal.SIGINT, handle)
+    try:
+        with cancellation_scope(token):
+            yield token
+    finally:
+        signal.signal(signal.SIGINT, previous)
+
+
+def _resolve_deferred_captchas(orchestrator: VerificationOrchestrator) -> None:
+    """Let an operator clear parked CAPTCHAs in bulk before results are written."""
+
+    while len(orchestrator.attention_queue):
+        pending = len(orchestrator.attention_queue)
+        if not sys.stdin.isatty():
+            logging.warning("%s leads are still waiting on a CAPTCHA; their results are incomplete", pending)
+            return
+        answer = input(
+            f"{pending} lead(s) are waiting on a CAPTCHA in the open browser windows. "
+            "Solve them and press Enter to continue, or type 'skip': "
+        )
+        if answer.strip().lower() == "skip":
+            return
+        orchestrator.resolve_deferred()
+
+
+def _orchestrator_options(args: argparse.Namespace, config: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "concurrent": args.mode == "concurrent",
+        "max_workers": args.max_workers,
+        "raise_on_error": args.raise_on_error,
+        "lead_concurrency": args.lead_concurrency or int(config.get("lead_concurrency", 1) or 1),
+        "batch_size": int(config.get("verify_batch_size", 25) or 1),
+        "batch_linger_seconds": float(config.get("verify_batch_linger_seconds", 0.05) or 0),
+        "time_budget": _time_budget_seconds(args, config),
+    }
+
+
+def _time_budget_seconds(args: argparse.Namespace, config: Dict[str, Any]) -> float | None:
+    minutes = getattr(args, "time_budget", None)
+    if minutes is None:
+        minutes = config.get("time_budget_minutes")
+    return float(minutes) * 60 if minutes else None
+
+
+def _log_budget_summary(statuses: Iterable[str]) -> None:
+    counts = Counter(statuses)
+    if counts["partial"] or counts["unprocessed"]:
+        logging.warning(
+            "Time budget reached: %s leads were verified by only some scrapers and %s were not processed "
+            "(see the 'status' column)",
+            counts["partial"],
+            counts["unprocessed"],
+        )
+
+
+def _new_orchestrator(config: Dict[str, Any], options: Dict[str, Any]) -> VerificationOrchestrator:
+    return VerificationOrchestrator(build_scrapers(config), execution_policy=build_execution_policy(config), **options)
+
+
+def _build_orchestrator(config: Dict[str, Any], options: Dict[str, Any]) -> VerificationOrchestrator:
+    orchestrator = _new_orchestrator(config, options)
+    orchestrator.start_warm_up()
+    return orchestrator
+
+
+def _verify_leads(
+    orchestrator: VerificationOrchestrator,
+    config: Dict[str, Any],
+    leads: Sequence[LeadInput],
+    options: Dict[str, Any],
+    *,
+    report_eta: bool = False,
+) -> List[AggregatedLeadResult]:
+    """Verify ``leads`` with ``orchestrator``, which the caller built (and started warming up) before loading them."""
+
+    progress = None
+    if report_eta:
+        plan = build_run_plan(
+            config, leads, concurrent=options["concurrent"], lead_concurrency=options["lead_concurrency"]
+        )
+        logging.info("Expecting at least %s for %s leads", format_duration(plan.min_seconds), plan.leads)
+        progress = EtaReporter(plan, orchestrator.latency).update
+    aggregated_results = orchestrator.verify(leads, progress_callback=progress)
+    _resolve_deferred_captchas(orchestrator)
+    return aggregated_results
+
+
+def _run_streaming(args: argparse.Namespace, config: Dict[str, Any]) -> int:
+    """Verify the input as a bounded pipeline, writing each result as soon as its turn comes."""
+
+    options = _orchestrator_options(args, config)
+
+    def read_leads() -> Iterable[LeadInput]:
+        leads: Iterable[LeadInput] = iter_leads(args.input)
+        if args.shard is not None:
+            shard = args.shard
+            leads = (lead for lead in leads if shard_for(lead, shard.count) == shard.index)
+        return leads
+
+    orchestrator = _build_orchestrator(config, options)
+    statuses: List[str] = []
+
+    def write(result: AggregatedLeadResult) -> None:
+        writer.write(result)
+        statuses.append(result.status)
+
+    try:
+        # The time budget shares what is left across the remaining leads, so count them while the browsers warm up.
+        total = sum(1 for _ in read_leads()) if options["time_budget"] else None
+        pipeline = VerificationPipeline(
+            orchestrator, workers=options["lead_concurrency"], queue_size=args.queue_depth, total=total
+        )
+        with ResultWriter(args.output) as writer:
+            written = pipeline.run(read_leads(), write)
+    finally:
+        _log_budget_summary(statuses)
+        parked = orchestrator.attention_queue.take_all()
+        if parked:
+            logging.warning("%s leads were parked on a CAPTCHA and written without that scraper's results", len(parked))
+        for entry in parked:
+            if entry.release is not None:
+                entry.release()
+        orchestrator.close()
+    return written
+
+
+_SHARD_CANCEL_EVENT = None
+
+
+def _init_shard_worker(cancel_event) -> None:
+    """Leave Ctrl-C to the parent process, which cancels every shard through ``cancel_event``."""
+
+    global _SHARD_CANCEL_EVENT
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _SHARD_CANCEL_EVENT = cancel_event
+
+
+def _run_shard(
+    config_path: str, input_path: str, shard: ShardSpec, options: Dict[str, Any], log_level: str
+) -> List[Tuple[int, Dict[str, Any]]]:
+    """Worker process entry point: verify one shard and return results keyed by input position.
+
+    When the parent cancels the run, the leads completed so far are returned.
+    """
+
+    logging.basicConfig(level=getattr(logging, log_level.upper(), logging.INFO))
+    config = load_configuration(config_path)
+    orchestrator = _build_orchestrator(config, options)
+    token = CancellationToken(event=_SHARD_CANCEL_EVENT) if _SHARD_CANCEL_EVENT is not None else None
+    try:
+        selected = select_shard(load_leads(input_path), shard)
+        logging.info("Shard %s verifying %s leads", shard, len(selected))
+        with cancellation_scope(token):
+            results = _verify_leads(orchestrator, config, [lead for _, lead in selected], options)
+    except Cancelled as exc:
+        logging.info("Shard %s cancelled after %s leads", shard, len(exc.results))
+        results = exc.results
+    finally:
+        orchestrator.close()
+    positions = {id(lead): position for position, lead in selected}
+    return [(positions[id(result.lead)], aggregated_to_dict(result)) for result in results]
+
+
+def _run_sharded(args: argparse.Namespace, config: Dict[str, Any]) -> List[AggregatedLeadResult]:
+    """Verify the input in ``args.processes`` shards, each with its own orchestrator and browsers.
+
+    Run it under :func:`_cancel_on_interrupt`: a cancel is passed on to every
+    shard, each returns the leads it completed, and :class:`Cancelled` is
+    raised with their merged results.
+    """
+
+    options = _orchestrator_options(args, config)
+    tasks = [
+        (args.config, args.input, ShardSpec(index=index, count=args.processes), options, args.log_level)
+        for index in range(args.processes)
+    ]
+    context = multiprocessing.get_context("spawn")
+    cancel_event = context.Event()
+    token = current_token()
+    with context.Pool(processes=args.processes, initializer=_init_shard_worker, initargs=(cancel_event,)) as pool:
+        pending = pool.starmap_async(_run_shard, tasks)
+        while not pending.ready():
+            if token is not None and token.wait(0.2):
+                cancel_event.set()
+                break
+            pending.wait(0.2)
+        parts = pending.get()
+    results = [aggregated_from_dict(item) for item in merge_in_input_order(parts)]
+    if cancel_event.is_set():
+        raise Cancelled(results=results)
+    return results
+
+
+def _submit(args: argparse.Namespace, queue: JobQueueBackend) -> int:
+    leads = load_leads(args.input)
+    deadline = time.time() + args.deadline_minutes * 60 if args.deadline_minutes is not None else None
+    job_id = queue.submit(
+        leads,
+        batch_size=args.batch_size,
+        job_id=args.job_id,
+        priority=args.priority,
+        deadline=deadline,
+        weight=args.weight,
+        input=str(Path(args.input).resolve()),
+    )
+    logging.info("Queued %s leads as job %s", len(leads), job_id)
+    print(job_id)
+    return 0
+
+
+def _work(args: argparse.Namespace, queue: JobQueueBackend) -> int:
+    config = load_configuration(args.config)
+    orchestrator = _build_orchestrator(config, _orchestrator_options(args, config))
+
+    def verify(leads: List[LeadInput]) -> List[AggregatedLeadResult]:
+        results = orchestrator.verify(leads)
+        _resolve_deferred_captchas(orchestrator)
+        for entry in orchestrator.attention_queue.take_all():
+            if entry.release is not None:
+                entry.release()
+        return results
+
+    try:
+        processed = run_worker(
+            queue,
+            verify,
+            worker_id=args.worker_id,
+            lease_seconds=args.lease_seconds,
+            poll_interval=args.poll_interval,
+            exit_when_idle=args.exit_when_idle,
+        )
+    except KeyboardInterrupt:
+        logging.info("Worker interrupted")
+        return 130
+    finally:
+        orchestrator.close()
+    logging.info("Worker finished %s batches", processed)
+    return 0
+
+
+def _collect(args: argparse.Namespace, queue: JobQueueBackend) -> int:
+    try:
+        status = queue.status(args.job_id)
+    except KeyError:
+        logging.error("Unknown job %s", args.job_id)
+        return 1
+    while args.wait and not status.finished:
+        eta = status.eta_seconds
+        logging.info(
+            "Job %s: %s/%s leads verified%s",
+            args.job_id,
+            status.completed,
+            status.total,
+            f", about {eta / 60:.1f} minutes left" if eta is not None else "",
+        )
+        time.sleep(args.poll_interval)
+        status = queue.status(args.job_id)
+
+    if not args.allow_partial and (not status.finished or status.failed_batches):
+        logging.error(
+            "Job %s is incomplete (%s/%s leads, %s failed batches); use --wait or --allow-partial",
+            args.job_id,
+            status.completed,
+            status.total,
+            status.failed_batches,
+        )
+        return 1
+    results = [result for _, result in queue.results(args.job_id)]
+    write_results(args.output, results)
+    logging.info(
+        "Wrote %s of %s results for job %s to %s", len(results), status.total, args.job_id, Path(args.output).resolve()
+    )
+    return 0
+
+
+def _serve(args: argparse.Namespace) -> int:
+    config = load_configuration(args.config)
+    options = _orchestrator_options(args, config)
+    orchestrator = _new_orchestrator(config, options)
+    server = VerificationServer(orchestrator, host=args.host, port=args.port, workers=options["lead_concurrency"])
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logging.info("Shutting down verification service")
+    finally:
+        server.stop()
+        orchestrator.close()
+    return 0
+
+
+def _plan(args: argparse.Namespace) -> int:
+    config = load_configuration(args.config)
+    options = _orchestrator_options(args, config)
+    plan = build_run_plan(
+        config,
+        load_leads(args.input),
+        concurrent=options["concurrent"],
+        lead_concurrency=options["lead_concurrency"],
+        hit_rates=dict(args.hit_rate),
+    )
+    print(plan.describe())
+    budget = options["time_budget"]
+    if budget is not None and plan.min_seconds > budget:
+        logging.error(
+            "The run needs at least %s, more than the %s time budget",
+            format_duration(plan.min_seconds),
+            format_duration(budget),
+        )
+        return 1
+    return 0
+
+
+def _command_main(argv: list[str]) -> int:
+    args = parse_command_args(argv)
+    logging.basicConfig(level=getattr(logging, args.log_level.upper(), logging.INFO))
+    if args.command == "serve":
+        return _serve(args)
+    if args.command == "plan":
+        return _plan(args)
+    queue = open_queue(args.queue)
+    try:
+        return {"submit": _submit, "worker": _work, "collect": _collect}[args.command](args, queue)
+    finally:
+        queue.close()
+
+
 def main(argv: list[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv and argv[0] in SUBCOMMANDS:
+        return _command_main(argv)
+
     args = parse_args(argv)
     logging.basicConfig(level=getattr(logging, args.log_level.upper(), logging.INFO))
 
     config = load_configuration(args.config)
-    scrapers = build_scrapers(config)
-    if not scrapers:
+    scraper_count = len(list(iter_enabled_scraper_configs(config)))
+    if not scraper_count:
         logging.warning("No scrapers are enabled - nothing to do")
         return 0
 
-    leads = load_leads(args.input)
-    orchestrator = VerificationOrchestrator(
-        scrapers,
-        concurrent=args.mode == "concurrent",
-        max_workers=args.max_workers,
-        raise_on_error=args.raise_on_error,
-    )
-
-    aggregated_results = orchestrator.verify(leads)
+    if args.stream:
+        try:
+            with _cancel_on_interrupt():
+                written = _run_streaming(args, config)
+        except Cancelled as exc:
+            logging.warning("%s; partial results written to %s", exc, Path(args.output).resolve())
+            return 130
+        logging.info("Processed %s leads with %s scrapers", written, scraper_count)
+        logging.info("Aggregated results written to %s", Path(args.output).resolve())
+        return 0
+    exit_code = 0
+    try:
+        with _cancel_on_interrupt():
+            if args.processes > 1:
+                aggregated_results = _run_sharded(args, config)
+            else:
+                options = _orchestrator_options(args, config)
+                orchestrator = _build_orchestrator(config, options)
+                try:
+                    leads = load_leads(args.input)
+                    if args.shard is not None:
+                        leads = [lead for _, lead in select_shard(leads, args.shard)]
+                        logging.info("Shard %s selected %s leads", args.shard, len(leads))
+                    aggregated_results = _verify_leads(orchestrator, config, leads, options, report_eta=True)
+                finally:
+                    orchestrator.close()
+    except Cancelled as exc:
+        logging.warning("%s; writing the completed results", exc)
+        aggregated_results, exit_code = exc.results, 130
     write_results(args.output, aggregated_results)
-    logging.info("Processed %s leads with %s scrapers", len(leads), len(scrapers))
+    _log_budget_summary(result.status for result in aggregated_results)
+    logging.info("Processed %s leads with %s scrapers", len(aggregated_results), scraper_count)
     logging.info("Aggregated results written to %s", Path(args.output).resolve())
-    return 0
+    return exit_code
 
 
 if __name__ == "__main__":  # pragma: no cover - CLI entry point
@@ -2,10 +2,12 @@
 from __future__ import annotations
 
 import importlib
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from .config import ConfigurationError, iter_enabled_scraper_configs
+from .isolation import ProcessIsolatedScraper
 from .rate_limit import DelayPolicy, RateLimitedScraper, RateLimiter
+from .result_cache import CachedScraper, ResultCache
 
 
 def _load_class(path: str):
@@ -19,30 +21,73 @@ def _load_class(path: str):
         raise ConfigurationError(f"Module '{module_name}' does not define '{attr}'") from exc
 
 
-def build_scrapers(config: Dict[str, Any]) -> List[RateLimitedScraper]:
-    """Instantiate scraper classes defined in the configuration file."""
+def _hours_to_seconds(value: Any) -> Optional[float]:
+    if value is None:
+        return None
+    return float(value) * 3600.0
 
-    scrapers: List[RateLimitedScraper] = []
+
+def build_result_cache(config: Dict[str, Any]) -> Optional[ResultCache]:
+    """Return the shared :class:`ResultCache` described by ``result_cache`` if configured."""
+
+    cache_cfg = config.get("result_cache")
+    if not cache_cfg:
+        return None
+    path = cache_cfg.get("path")
+    if not path:
+        raise ConfigurationError("result_cache configuration requires a 'path'")
+    return ResultCache(
+        path,
+        negative_ttl_seconds=_hours_to_seconds(cache_cfg.get("negative_ttl_hours", 24 * 30)),
+        positive_ttl_seconds=_hours_to_seconds(cache_cfg.get("positive_ttl_hours")),
+    )
+
+
+def build_scrapers(config: Dict[str, Any]) -> List[Any]:
+    """Instantiate scraper classes defined in the configuration file.
+
+    Each scraper is wrapped in a :class:`RateLimitedScraper`, and additionally
+    in a :class:`CachedScraper` when a ``result_cache`` section is present.
+    Scrapers configured with ``isolation: process`` run in a pool of
+    ``processes`` worker processes via :class:`ProcessIsolatedScraper`.
+    """
+
+    cache = build_result_cache(config)
+    scrapers: List[Any] = []
     for scraper_cfg in iter_enabled_scraper_configs(config):
         class_path = scraper_cfg.get("class")
         if not class_path:
             raise ConfigurationError("Scraper configuration missing required 'class' field")
 
         options = scraper_cfg.get("options", {})
-        scraper_cls = _load_class(class_path)
-        scraper_instance = scraper_cls(**options)
-
         display_name = scraper_cfg.get("name")
+        isolation = scraper_cfg.get("isolation", "thread")
+        if isolation == "process":
+            _load_class(class_path)
+            scraper_instance = ProcessIsolatedScraper(
+                class_path,
+                options,
+                name=display_name,
+                processes=int(scraper_cfg.get("processes", 1) or 1),
+                call_timeout=scraper_cfg.get("call_timeout_seconds"),
+            )
+        elif isolation == "thread":
+            scraper_cls = _load_class(class_path)
+            scraper_instance = scraper_cls(**options)
+        else:
+            raise ConfigurationError(f"Unknown isolation mode '{isolation}' for scraper {display_name or class_path}")
+
         delay_seconds = float(scraper_cfg.get("delay_seconds", 0) or 0)
         calls_per_minute = scraper_cfg.get("rate_limit_per_minute")
         rate_limiter = RateLimiter(float(calls_per_minute)) if calls_per_minute else RateLimiter(None)
 
-        scrapers.append(
-            RateLimitedScraper(
-                scraper_instance,
-                display_name=display_name,
-                delay_policy=DelayPolicy(delay_seconds=delay_seconds),
-                rate_limiter=rate_limiter,
-            )
+        scraper = RateLimitedScraper(
+            scraper_instance,
+            display_name=display_name,
+            delay_policy=DelayPolicy(delay_seconds=delay_seconds),
+            rate_limiter=rate_limiter,
         )
+        if cache is not None and scraper_cfg.get("cache", True):
+            scraper = CachedScraper(scraper, cache)
+        scrapers.append(scraper)
     return scrapers
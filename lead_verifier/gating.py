@@ -0,0 +1,257 @@
+"""Cost ordering, run conditions and dependencies for the scrapers applied to each lead."""
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field, replace
+from typing import Any, Collection, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple, TypeVar
+
+from .config import ConfigurationError, iter_enabled_scraper_configs
+from .merge import merge_lead_results
+from .models import LeadInput, LeadVerification
+
+_S = TypeVar("_S")
+
+
+@dataclass(frozen=True)
+class ScraperPolicy:
+    """When and in which order one scraper runs.
+
+    Scrapers run in ascending ``cost``; scrapers with the same cost form one
+    tier and keep their configured order.  With ``run_if_missing`` the scraper
+    only runs while the earlier tiers have not found a contact of at least one
+    of those types.  A scraper waits for every scraper named in ``depends_on``
+    and receives a lead enriched with their findings (see :func:`enrich_lead`).
+    """
+
+    cost: float = 0.0
+    run_if_missing: Tuple[str, ...] = ()
+    depends_on: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class ExecutionPolicy:
+    """Per-scraper :class:`ScraperPolicy` rules plus an early-stop condition.
+
+    ``stop_when`` maps contact types to the number of distinct contacts that
+    resolve a lead, e.g. ``{"phone": 1}``; once every entry is met the
+    remaining tiers are skipped.
+    """
+
+    scrapers: Mapping[str, ScraperPolicy] = field(default_factory=dict)
+    stop_when: Mapping[str, int] = field(default_factory=dict)
+
+    def policy_for(self, name: str) -> ScraperPolicy:
+        return self.scrapers.get(name, ScraperPolicy())
+
+    def ready(self, pending: Sequence[_S], finished: Collection[str], running: Collection[str] = ()) -> List[_S]:
+        """Return the ``pending`` scrapers that may start now.
+
+        A scraper is ready once its dependencies have finished and every
+        unfinished scraper with a lower cost has finished too, except those
+        that depend on it.  Independent branches of equal cost are ready
+        together.
+        """
+
+        unfinished = {scraper.name for scraper in pending} | set(running)
+        ready = []
+        for scraper in pending:
+            policy = self.policy_for(scraper.name)
+            if any(dependency in unfinished for dependency in policy.depends_on):
+                continue
+            dependents = self._dependents(scraper.name)
+            if any(
+                self.policy_for(other).cost < policy.cost and other not in dependents
+                for other in unfinished
+                if other != scraper.name
+            ):
+                continue
+            ready.append(scraper)
+        return ready
+
+    def _dependents(self, name: str) -> Set[str]:
+        found: Set[str] = set()
+        frontier = [name]
+        while frontier:
+            current = frontier.pop()
+            for other, policy in self.scrapers.items():
+                if current in policy.depends_on and other not in found:
+                    found.add(other)
+                    frontier.append(other)
+        return found
+
+    def lead_for(self, name: str, lead: LeadInput, finished: Mapping[str, LeadVerification]) -> LeadInput:
+        """Return ``lead`` enriched with the results of the dependencies of scraper ``name``."""
+
+        upstream = [finished[dependency] for dependency in self.policy_for(name).depends_on if dependency in finished]
+        return enrich_lead(lead, upstream) if upstream else lead
+
+    def skip_reason(self, name: str, lead: LeadInput, results: Iterable[LeadVerification]) -> Optional[str]:
+        """Return why scraper ``name`` should not run given the ``results`` so far, or ``None``."""
+
+        counts = contact_counts(lead, results)
+        if self.stop_when and all(counts[kind] >= minimum for kind, minimum in self.stop_when.items()):
+            return "stop condition met: " + ", ".join(f"{kind}>={minimum}" for kind, minimum in self.stop_when.items())
+        missing = self.policy_for(name).run_if_missing
+        if missing and all(counts[kind] for kind in missing):
+            return "already found " + ", ".join(missing)
+        return None
+
+
+def contact_counts(lead: LeadInput, results: Iterable[LeadVerification]) -> Counter:
+    """Count distinct merged contacts per lower-case contact type."""
+
+    return Counter(contact.type.lower() for contact in merge_lead_results(lead, results).contacts)
+
+
+def skipped_result(name: str, reason: str) -> LeadVerification:
+    return LeadVerification(source=name, contacts=[], raw_data={"skipped": True, "reason": reason})
+
+
+_LOCATION_TYPES = ("zip", "postal_code", "city", "state", "address")
+
+
+def enrich_lead(lead: LeadInput, upstream: Iterable[LeadVerification]) -> LeadInput:
+    """Return a copy of ``lead`` carrying what ``upstream`` scrapers discovered.
+
+    Phone and email contacts are appended to the ``phones``/``emails``
+    metadata lists and fill ``phone``/``email`` when those are empty.
+    Contacts typed ``zip``, ``postal_code``, ``city``, ``state`` or
+    ``address``, and any ``raw_data["lead_updates"]`` mapping, fill metadata
+    keys the lead does not already have, so location-aware query builders
+    pick them up.  The names of the contributing sources are listed under
+    ``enriched_from``.
+    """
+
+    metadata = dict(lead.metadata)
+    phones, emails = list(lead.phones), list(lead.emails)
+    sources: List[str] = []
+
+    def fill(key: str, value: Any) -> bool:
+        if value in (None, "") or metadata.get(key) not in (None, ""):
+            return False
+        metadata[key] = value
+        return True
+
+    for result in upstream:
+        changed = False
+        updates = (result.raw_data or {}).get("lead_updates") or {}
+        for key, value in updates.items():
+            changed = fill(key, value) or changed
+        for contact in result.contacts:
+            kind = contact.type.lower()
+            if kind == "phone" and contact.value not in phones:
+                phones.append(contact.value)
+                changed = True
+            elif kind == "email" and contact.value not in emails:
+                emails.append(contact.value)
+                changed = True
+            elif kind in _LOCATION_TYPES:
+                changed = fill(kind, contact.value) or changed
+        if changed:
+            sources.append(result.source)
+
+    if not sources:
+        return lead
+    if phones:
+        metadata["phones"] = phones
+    if emails:
+        metadata["emails"] = emails
+    metadata["enriched_from"] = sources
+    return replace(
+        lead,
+        phone=lead.phone or (phones[0] if phones else None),
+        email=lead.email or (emails[0] if emails else None),
+        metadata=metadata,
+    )
+
+
+def _contact_types(value: Any, *, where: str) -> Tuple[str, ...]:
+    if value in (None, ""):
+        return ()
+    items = [value] if isinstance(value, str) else value
+    if not isinstance(items, (list, tuple)) or not all(isinstance(item, str) for item in items):
+        raise ConfigurationError(f"{where} must be a contact type or a list of contact types")
+    return tuple(item.lower() for item in items)
+
+
+def _dependencies(value: Any, *, name: str, known: Collection[Any]) -> Tuple[str, ...]:
+    if value in (None, ""):
+        return ()
+    items = [value] if isinstance(value, str) else value
+    if not isinstance(items, (list, tuple)):
+        raise ConfigurationError(f"depends_on of scraper {name} must be a scraper name or a list of names")
+    for dependency in items:
+        if dependency == name or dependency not in known:
+            raise ConfigurationError(f"Scraper {name} depends on unknown or disabled scraper '{dependency}'")
+    return tuple(items)
+
+
+def _check_acyclic(policies: Mapping[str, ScraperPolicy]) -> None:
+    visiting: Set[str] = set()
+    done: Set[str] = set()
+
+    def visit(name: str, path: Tuple[str, ...]) -> None:
+        if name in done:
+            return
+        if name in visiting:
+            raise ConfigurationError("Scraper dependencies form a cycle: " + " -> ".join(path + (name,)))
+        visiting.add(name)
+        for dependency in policies.get(name, ScraperPolicy()).depends_on:
+            visit(dependency, path + (name,))
+        visiting.discard(name)
+        done.add(name)
+
+    for name in policies:
+        visit(name, ())
+
+
+def build_execution_policy(config: Dict[str, Any]) -> Optional[ExecutionPolicy]:
+    """Return the :class:`ExecutionPolicy` described by ``config``, or ``None`` when no rules are set.
+
+    Reads ``cost``, ``run_if_missing`` and ``depends_on`` from each enabled
+    scraper entry and ``stop_when`` from the top level.
+    """
+
+    policies: Dict[str, ScraperPolicy] = {}
+    enabled = list(iter_enabled_scraper_configs(config))
+    names = {scraper_cfg.get("name") for scraper_cfg in enabled}
+    for scraper_cfg in enabled:
+        if not any(key in scraper_cfg for key in ("cost", "run_if_missing", "depends_on")):
+            continue
+        name = scraper_cfg.get("name")
+        if not name:
+            raise ConfigurationError(
+                f"Scraper {scraper_cfg.get('class')} needs a 'name' to use cost, run_if_missing or depends_on"
+            )
+        try:
+            cost = float(scraper_cfg.get("cost", 0) or 0)
+        except (TypeError, ValueError):
+            raise ConfigurationError(f"Scraper {name} has a non-numeric cost {scraper_cfg.get('cost')!r}") from None
+        policies[name] = ScraperPolicy(
+            cost=cost,
+            run_if_missing=_contact_types(scraper_cfg.get("run_if_missing"), where=f"run_if_missing of scraper {name}"),
+            depends_on=_dependencies(scraper_cfg.get("depends_on"), name=name, known=names),
+        )
+    _check_acyclic(policies)
+
+    stop_cfg = config.get("stop_when") or {}
+    if not isinstance(stop_cfg, Mapping):
+        raise ConfigurationError("stop_when must map contact types to minimum counts, e.g. {phone: 1}")
+    try:
+        stop_when = {str(kind).lower(): int(minimum) for kind, minimum in stop_cfg.items()}
+    except (TypeError, ValueError):
+        raise ConfigurationError("stop_when counts must be whole numbers") from None
+
+    if not policies and not stop_when:
+        return None
+    return ExecutionPolicy(scrapers=policies, stop_when=stop_when)
+
+
+__all__ = [
+    "ExecutionPolicy",
+    "ScraperPolicy",
+    "build_execution_policy",
+    "contact_counts",
+    "enrich_lead",
+    "skipped_result",
+]
@@ -4,7 +4,7 @@ from __future__ import annotations
 import csv
 import json
 from pathlib import Path
-from typing import Iterable, List
+from typing import Any, Iterable, Iterator, List
 
 from .models import AggregatedLeadResult, LeadInput
 
@@ -18,42 +18,46 @@ def _normalise_key(value: str) -> str:
 
 
 def load_leads(path: str | Path) -> List[LeadInput]:
+    return list(iter_leads(path))
+
+
+def iter_leads(path: str | Path) -> Iterator[LeadInput]:
+    """Yield leads one row at a time without loading the whole spreadsheet."""
+
     file_path = Path(path)
     if file_path.suffix.lower() in _CSV_SUFFIXES:
-        return _load_leads_from_csv(file_path)
+        return _iter_leads_from_csv(file_path)
     if file_path.suffix.lower() in _EXCEL_SUFFIXES:
-        return _load_leads_from_excel(file_path)
+        return _iter_leads_from_excel(file_path)
     raise ValueError(f"Unsupported input format '{file_path.suffix}'. Use CSV or Excel spreadsheet")
 
 
-def _load_leads_from_csv(path: Path) -> List[LeadInput]:
-    leads: List[LeadInput] = []
+def _iter_leads_from_csv(path: Path) -> Iterator[LeadInput]:
     with path.open(newline="", encoding="utf-8-sig") as handle:
         reader = csv.DictReader(handle)
         for row in reader:
-            leads.append(_row_to_lead(row))
-    return leads
+            yield _row_to_lead(row)
 
 
-def _load_leads_from_excel(path: Path) -> List[LeadInput]:
+def _iter_leads_from_excel(path: Path) -> Iterator[LeadInput]:
     try:
         from openpyxl import load_workbook  # type: ignore
     except ImportError as exc:  # pragma: no cover - dependency optional
         raise RuntimeError("Reading Excel files requires the 'openpyxl' package") from exc
 
     workbook = load_workbook(filename=path, read_only=True)
-    sheet = workbook.active
-    rows = sheet.iter_rows(values_only=True)
     try:
-        header_row = next(rows)
-    except StopIteration:
-        return []
-    header = [str(cell).strip() for cell in header_row if cell is not None]
-    leads: List[LeadInput] = []
-    for cells in rows:
-        row = {header[idx]: value for idx, value in enumerate(cells) if idx < len(header)}
-        leads.append(_row_to_lead(row))
-    return leads
+        rows = workbook.active.iter_rows(values_only=True)
+        try:
+            header_row = next(rows)
+        except StopIteration:
+            return
+        header = [str(cell).strip() for cell in header_row if cell is not None]
+        for cells in rows:
+            row = {header[idx]: value for idx, value in enumerate(cells) if idx < len(header)}
+            yield _row_to_lead(row)
+    finally:
+        workbook.close()
 
 
 def _row_to_lead(row: dict) -> LeadInput:
@@ -89,14 +93,22 @@ def _row_to_lead(row: dict) -> LeadInput:
 
 
 def write_results(path: str | Path, results: Iterable[AggregatedLeadResult]) -> None:
-    file_path = Path(path)
-    if file_path.suffix.lower() in _CSV_SUFFIXES:
-        _write_results_to_csv(file_path, results)
-        return
-    if file_path.suffix.lower() in _EXCEL_SUFFIXES:
-        _write_results_to_excel(file_path, results)
-        return
-    raise ValueError(f"Unsupported output format '{file_path.suffix}'. Use CSV or Excel spreadsheet")
+    with ResultWriter(path) as writer:
+        for result in results:
+            writer.write(result)
+
+
+_RESULT_COLUMNS = [
+    "first_name",
+    "last_name",
+    "city",
+    "state",
+    "input_phone",
+    "input_email",
+    "contacts",
+    "metadata",
+    "status",
+]
 
 
 def _format_contacts(result: AggregatedLeadResult) -> str:
@@ -107,64 +119,70 @@ def _format_contacts(result: AggregatedLeadResult) -> str:
     return "; ".join(formatted)
 
 
-def _write_results_to_csv(path: Path, results: Iterable[AggregatedLeadResult]) -> None:
-    fieldnames = [
-        "first_name",
-        "last_name",
-        "city",
-        "state",
-        "input_phone",
-        "input_email",
-        "contacts",
-        "metadata",
+def _result_row(result: AggregatedLeadResult) -> List[Any]:
+    return [
+        result.lead.first_name or "",
+        result.lead.last_name or "",
+        result.lead.city or "",
+        result.lead.state or "",
+        result.lead.phone or "",
+        result.lead.email or "",
+        _format_contacts(result),
+        json.dumps(result.lead.metadata, ensure_ascii=False),
+        result.status,
     ]
-    with path.open("w", newline="", encoding="utf-8") as handle:
-        writer = csv.DictWriter(handle, fieldnames=fieldnames)
-        writer.writeheader()
-        for result in results:
-            writer.writerow(
-                {
-                    "first_name": result.lead.first_name or "",
-                    "last_name": result.lead.last_name or "",
-                    "city": result.lead.city or "",
-                    "state": result.lead.state or "",
-                    "input_phone": result.lead.phone or "",
-                    "input_email": result.lead.email or "",
-                    "contacts": _format_contacts(result),
-                    "metadata": json.dumps(result.lead.metadata, ensure_ascii=False),
-                }
-            )
-
-
-def _write_results_to_excel(path: Path, results: Iterable[AggregatedLeadResult]) -> None:
-    try:
-        from openpyxl import Workbook  # type: ignore
-    except ImportError as exc:  # pragma: no cover - dependency optional
-        raise RuntimeError("Writing Excel files requires the 'openpyxl' package") from exc
-
-    workbook = Workbook()
-    sheet = workbook.active
-    sheet.append([
-        "first_name",
-        "last_name",
-        "city",
-        "state",
-        "input_phone",
-        "input_email",
-        "contacts",
-        "metadata",
-    ])
-    for result in results:
-        sheet.append(
-            [
-                result.lead.first_name or "",
-                result.lead.last_name or "",
-                result.lead.city or "",
-                result.lead.state or "",
-                result.lead.phone or "",
-                result.lead.email or "",
-                _format_contacts(result),
-                json.dumps(result.lead.metadata, ensure_ascii=False),
-            ]
-        )
-    workbook.save(path)
+
+
+class ResultWriter:
+    """Append aggregated results to a CSV or Excel file one row at a time.
+
+    CSV rows reach the file as they are written; Excel workbooks are built in
+    openpyxl's write-only mode and saved on :meth:`close`.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.count = 0
+        suffix = self.path.suffix.lower()
+        if suffix in _CSV_SUFFIXES:
+            self._handle = self.path.open("w", newline="", encoding="utf-8")
+            self._csv = csv.writer(self._handle)
+            self._csv.writerow(_RESULT_COLUMNS)
+            self._workbook = None
+        elif suffix in _EXCEL_SUFFIXES:
+            try:
+                from openpyxl import Workbook  # type: ignore
+            except ImportError as exc:  # pragma: no cover - dependency optional
+                raise RuntimeError("Writing Excel files requires the 'openpyxl' package") from exc
+            self._workbook = Workbook(write_only=True)
+            self._sheet = self._workbook.create_sheet()
+            self._sheet.append(_RESULT_COLUMNS)
+            self._handle = None
+        else:
+            raise ValueError(f"Unsupported output format '{self.path.suffix}'. Use CSV or Excel spreadsheet")
+
+    def write(self, result: AggregatedLeadResult) -> None:
+        if self._handle is not None:
+            self._csv.writerow(_result_row(result))
+        else:
+            self._sheet.append(_result_row(result))
+        self.count += 1
+
+    def flush(self) -> None:
+        if self._handle is not None:
+            self._handle.flush()
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+            self._csv = None
+        elif self._workbook is not None:
+            self._workbook.save(self.path)
+            self._workbook = None
+
+    def __enter__(self) -> "ResultWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, exc_tb) -> None:
+        self.close()
@@ -0,0 +1,274 @@
+"""Run scrapers in dedicated worker processes behind the usual ``verify`` contract."""
+from __future__ import annotations
+
+import importlib
+import itertools
+import logging
+import multiprocessing
+import queue
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from .captcha import CaptchaDeferred
+from .models import LeadInput, LeadVerification
+from .serialization import lead_from_dict, lead_to_dict, verification_from_dict, verification_to_dict
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _load_class(path: str):
+    module_name, _, attr = path.rpartition(".")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def _worker_main(conn, class_path: str, options: Dict[str, Any]) -> None:
+    """Entry point of a worker process: build the scraper and serve requests from ``conn``."""
+
+    try:
+        scraper = _load_class(class_path)(**options)
+    except Exception as exc:
+        conn.send(("fatal", f"{type(exc).__name__}: {exc}"))
+        return
+    conn.send(("ready",))
+
+    deferred: Dict[int, CaptchaDeferred] = {}
+    tokens = itertools.count(1)
+    try:
+        while True:
+            try:
+                command, *args = conn.recv()
+            except EOFError:
+                break
+            if command == "close":
+                break
+            try:
+                if command == "verify":
+                    result = scraper.verify(lead_from_dict(args[0]))
+                elif command == "resume":
+                    result = deferred.pop(args[0]).resume()
+                elif command == "release":
+                    entry = deferred.pop(args[0], None)
+                    result = entry.release() if entry is not None and entry.release is not None else None
+                elif command == "warm_up":
+                    warm_up = getattr(scraper, "warm_up", None)
+                    result = warm_up() if callable(warm_up) else None
+                else:
+                    raise ValueError(f"Unknown worker command '{command}'")
+            except CaptchaDeferred as exc:
+                token = next(tokens)
+                deferred[token] = exc
+                conn.send(("deferred", str(exc), token, exc.release is not None))
+                continue
+            except Exception as exc:
+                conn.send(("error", f"{type(exc).__name__}: {exc}", traceback.format_exc()))
+                continue
+            payload = verification_to_dict(result) if isinstance(result, LeadVerification) else None
+            conn.send(("ok", payload))
+    finally:
+        for entry in deferred.values():
+            if entry.release is not None:
+                try:
+                    entry.release()
+                except Exception:  # pragma: no cover - best effort cleanup
+                    pass
+        close = getattr(scraper, "close", None)
+        if callable(close):
+            close()
+
+
+class WorkerLost(RuntimeError):
+    """Raised when a worker process exits or stops responding mid-call."""
+
+
+class _Worker:
+    """Parent-side handle for one worker process."""
+
+    def __init__(self, context, class_path: str, options: Dict[str, Any], *, startup_timeout: float) -> None:
+        self._conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main,
+            args=(child_conn, class_path, options),
+            name=f"scraper-worker:{class_path.rpartition('.')[2]}",
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self._lock = threading.Lock()
+        reply = self._receive(startup_timeout)
+        if reply[0] != "ready":
+            self.stop()
+            raise RuntimeError(f"Worker for {class_path} failed to start: {reply[1]}")
+
+    @property
+    def alive(self) -> bool:
+        return self.process.is_alive()
+
+    def call(self, message: Tuple[Any, ...], timeout: Optional[float]) -> Tuple[Any, ...]:
+        with self._lock:
+            try:
+                self._conn.send(message)
+            except (OSError, ValueError) as exc:
+                raise WorkerLost(f"worker pipe closed: {exc}") from exc
+            return self._receive(timeout)
+
+    def _receive(self, timeout: Optional[float]) -> Tuple[Any, ...]:
+        try:
+            if not self._conn.poll(timeout):
+                raise WorkerLost(f"worker did not answer within {timeout:g}s")
+            return self._conn.recv()
+        except (EOFError, OSError) as exc:
+            self.process.join(1.0)
+            raise WorkerLost(f"worker exited with code {self.process.exitcode}") from exc
+
+    def stop(self, timeout: float = 10.0) -> None:
+        try:
+            self._conn.send(("close",))
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(timeout)
+        self._conn.close()
+
+
+class ProcessIsolatedScraper:
+    """Scraper proxy that runs ``processes`` instances of a scraper class in worker processes.
+
+    Each worker builds its own scraper from ``class_path`` and ``options`` and
+    answers ``verify`` calls over a pipe, so a browser crash only takes down
+    that worker and parsing runs on separate cores.  Calls from several threads
+    are spread across idle workers.  A worker that exits or exceeds
+    ``call_timeout`` is restarted and the lead retried up to ``max_retries``
+    times before an error result is returned.  CAPTCHA deferrals raised in a
+    worker are re-raised here and resume in the same worker process.
+    """
+
+    def __init__(
+        self,
+        class_path: str,
+        options: Optional[Dict[str, Any]] = None,
+        *,
+        name: Optional[str] = None,
+        processes: int = 1,
+        call_timeout: Optional[float] = None,
+        startup_timeout: float = 60.0,
+        max_retries: int = 1,
+        start_method: str = "spawn",
+    ) -> None:
+        scraper_cls = _load_class(class_path)
+        self.name = name or getattr(scraper_cls, "name", scraper_cls.__name__)
+        self.class_path = class_path
+        self.options = dict(options or {})
+        self.call_timeout = call_timeout
+        self.startup_timeout = startup_timeout
+        self.max_retries = max(0, max_retries)
+        self.restarts = 0
+        self._context = multiprocessing.get_context(start_method)
+        self._workers: List[Optional[_Worker]] = [None] * max(1, processes)
+        self._workers_lock = threading.Lock()
+        self._idle: "queue.Queue[int]" = queue.Queue()
+        for index in range(len(self._workers)):
+            self._idle.put(index)
+
+    @property
+    def processes(self) -> int:
+        return len(self._workers)
+
+    def warm_up(self) -> None:
+        """Start every worker process and warm up its scraper."""
+
+        with ThreadPoolExecutor(max_workers=self.processes, thread_name_prefix="scraper-worker-start") as executor:
+            for reply in executor.map(lambda index: self._call(index, ("warm_up",)), range(self.processes)):
+                self._unwrap(reply)
+
+    def verify(self, lead: LeadInput) -> LeadVerification:
+        index = self._idle.get()
+        try:
+            reply = self._call(index, ("verify", lead_to_dict(lead)), retries=self.max_retries)
+        except WorkerLost as exc:
+            return LeadVerification(source=self.name, contacts=[], raw_data={"error": f"Scraper worker failed: {exc}"})
+        finally:
+            self._idle.put(index)
+        return self._unwrap(reply, index)
+
+    def close(self) -> None:
+        with self._workers_lock:
+            workers, self._workers = self._workers, [None] * len(self._workers)
+        for worker in workers:
+            if worker is not None:
+                worker.stop()
+
+    def __enter__(self) -> "ProcessIsolatedScraper":
+        self.warm_up()
+        return self
+
+    def __exit__(self, exc_type, exc, exc_tb) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Worker management
+    def _worker(self, index: int) -> _Worker:
+        with self._workers_lock:
+            worker = self._workers[index]
+            if worker is not None and worker.alive:
+                return worker
+            if worker is not None:
+                LOGGER.warning("Scraper worker %s for %s exited; restarting", index, self.name)
+                worker.stop(timeout=1.0)
+                self.restarts += 1
+            worker = _Worker(self._context, self.class_path, self.options, startup_timeout=self.startup_timeout)
+            self._workers[index] = worker
+            return worker
+
+    def _discard(self, index: int, worker: _Worker) -> None:
+        with self._workers_lock:
+            if self._workers[index] is worker:
+                worker.process.kill()
+                worker.process.join(1.0)
+
+    def _call(self, index: int, message: Tuple[Any, ...], *, retries: int = 0) -> Tuple[Any, ...]:
+        for attempt in itertools.count():
+            worker = self._worker(index)
+            try:
+                return worker.call(message, self.call_timeout)
+            except WorkerLost:
+                self._discard(index, worker)
+                if attempt >= retries:
+                    raise
+                LOGGER.warning("Retrying %s call on a fresh %s worker", message[0], self.name)
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def _unwrap(self, reply: Tuple[Any, ...], index: Optional[int] = None) -> Any:
+        status = reply[0]
+        if status == "ok":
+            return verification_from_dict(reply[1]) if reply[1] is not None else None
+        if status == "deferred":
+            _, message, token, holds_browser = reply
+            raise self._deferred(index, message, token, holds_browser)
+        LOGGER.debug("Scraper worker traceback:\n%s", reply[2])
+        raise RuntimeError(reply[1])
+
+    def _deferred(self, index: Optional[int], message: str, token: int, holds_browser: bool) -> CaptchaDeferred:
+        assert index is not None
+        with self._workers_lock:
+            owner = self._workers[index]
+
+        def send(command: str) -> Tuple[Any, ...]:
+            with self._workers_lock:
+                if self._workers[index] is not owner:
+                    raise RuntimeError("Scraper worker restarted; the CAPTCHA page was lost")
+            return owner.call((command, token), self.call_timeout)
+
+        def resume() -> LeadVerification:
+            return self._unwrap(send("resume"), index)
+
+        def release() -> None:
+            self._unwrap(send("release"), index)
+
+        return CaptchaDeferred(message, resume=resume, release=release if holds_browser else None)
+
+
+__all__ = ["ProcessIsolatedScraper", "WorkerLost"]
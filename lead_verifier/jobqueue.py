@@ -0,0 +1,455 @@
+"""Durable queue of lead batches shared by submitters, workers, and collectors."""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Protocol, Sequence, Tuple
+
+from .models import AggregatedLeadResult, LeadInput
+from .scheduling import estimate_eta, parse_deadline, parse_priority, priority_weight
+from .serialization import aggregated_from_dict, aggregated_to_dict, lead_from_dict, lead_to_dict
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_QUEUE_PATH = "lead_verifier_queue.sqlite3"
+
+
+@dataclass
+class Batch:
+    """A leased slice of a job's leads, keyed by their position in the submitted input."""
+
+    id: int
+    job_id: str
+    leads: List[Tuple[int, LeadInput]]
+    lease_token: str
+
+
+@dataclass
+class JobStatus:
+    """Progress counters for a submitted job."""
+
+    job_id: str
+    total: int
+    completed: int
+    pending_batches: int
+    leased_batches: int
+    failed_batches: int
+    created_at: float
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    started_at: Optional[float] = None
+    weight: float = 1.0
+
+    @property
+    def finished(self) -> bool:
+        return self.pending_batches == 0 and self.leased_batches == 0
+
+    @property
+    def eta_seconds(self) -> Optional[float]:
+        """Seconds until the job finishes at its observed rate, ``None`` until the first result."""
+
+        return estimate_eta(self.completed, self.total, self.started_at)
+
+
+class JobQueueBackend(Protocol):
+    """Storage interface used by :func:`run_worker` and the queue CLI commands."""
+
+    def submit(
+        self,
+        leads: Sequence[LeadInput],
+        *,
+        batch_size: int = 25,
+        job_id: Optional[str] = None,
+        priority: int = 0,
+        deadline: Optional[float] = None,
+        weight: Optional[float] = None,
+        **metadata: Any,
+    ) -> str:  # pragma: no cover - protocol
+        ...
+
+    def claim(self, worker_id: str, *, lease_seconds: float) -> Optional[Batch]:  # pragma: no cover - protocol
+        ...
+
+    def complete(self, batch: Batch, results: Sequence[AggregatedLeadResult]) -> bool:  # pragma: no cover - protocol
+        ...
+
+    def release(self, batch: Batch, error: str) -> None:  # pragma: no cover - protocol
+        ...
+
+    def status(self, job_id: str) -> JobStatus:  # pragma: no cover - protocol
+        ...
+
+    def results(self, job_id: str) -> List[Tuple[int, AggregatedLeadResult]]:  # pragma: no cover - protocol
+        ...
+
+    def close(self) -> None:  # pragma: no cover - protocol
+        ...
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    created_at REAL NOT NULL,
+    total INTEGER NOT NULL,
+    metadata TEXT NOT NULL,
+    weight REAL NOT NULL DEFAULT 1,
+    served REAL NOT NULL DEFAULT 0,
+    started_at REAL
+);
+CREATE TABLE IF NOT EXISTS batches (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id TEXT NOT NULL REFERENCES jobs(id),
+    payload TEXT NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    deadline REAL,
+    created_at REAL NOT NULL DEFAULT 0,
+    state TEXT NOT NULL DEFAULT 'pending',
+    lease_owner TEXT,
+    lease_token TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS batches_by_state ON batches (state, id);
+CREATE TABLE IF NOT EXISTS results (
+    job_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (job_id, position)
+);
+"""
+
+# Columns added after the first release, so queue files created by an older
+# version are upgraded in place.  Bump _SCHEMA_VERSION when extending this.
+_SCHEMA_VERSION = 2
+_ADDED_COLUMNS = (
+    ("batches", "priority", "INTEGER NOT NULL DEFAULT 0"),
+    ("batches", "deadline", "REAL"),
+    ("batches", "created_at", "REAL NOT NULL DEFAULT 0"),
+    ("jobs", "weight", "REAL NOT NULL DEFAULT 1"),
+    ("jobs", "served", "REAL NOT NULL DEFAULT 0"),
+    ("jobs", "started_at", "REAL"),
+)
+
+
+class SQLiteJobQueue:
+    """:class:`JobQueueBackend` stored in one SQLite file, suitable for a shared volume.
+
+    Workers lease a batch for ``lease_seconds``; a batch whose lease expires
+    (for example because its worker died) is handed to the next worker, and a
+    batch that has been attempted ``max_attempts`` times is marked failed.
+    Results from a lease that has since been reassigned are discarded.
+
+    Claims follow :class:`~lead_verifier.scheduling.FairShareScheduler`:
+    batches due within ``deadline_slack_seconds`` come first, then jobs take
+    turns in proportion to their weight (leads claimed divided by weight, with
+    a new job starting level with the least-served active job), and within a
+    job batches are ordered by submission time less ``priority * aging_seconds``.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        max_attempts: int = 3,
+        timeout: float = 30.0,
+        aging_seconds: float = 60.0,
+        deadline_slack_seconds: float = 60.0,
+    ) -> None:
+        self.path = Path(path)
+        self.max_attempts = max(1, max_attempts)
+        self.aging_seconds = aging_seconds
+        self.deadline_slack_seconds = deadline_slack_seconds
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            str(self.path), timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        self._connection.executescript(_SCHEMA)
+        self._migrate()
+
+    def _migrate(self) -> None:
+        if self._connection.execute("PRAGMA user_version").fetchone()[0] >= _SCHEMA_VERSION:
+            return
+        with self._transaction() as cursor:
+            columns: Dict[str, set] = {}
+            for table, column, declaration in _ADDED_COLUMNS:
+                if table not in columns:
+                    columns[table] = {row[1] for row in cursor.execute(f"PRAGMA table_info({table})")}
+                if column not in columns[table]:
+                    LOGGER.info("Upgrading job queue %s: adding %s.%s", self.path, table, column)
+                    cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {declaration}")
+            cursor.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    def _transaction(self):
+        return _ImmediateTransaction(self._connection, self._lock)
+
+    def submit(
+        self,
+        leads: Sequence[LeadInput],
+        *,
+        batch_size: int = 25,
+        job_id: Optional[str] = None,
+        priority: int = 0,
+        deadline: Optional[float] = None,
+        weight: Optional[float] = None,
+        **metadata: Any,
+    ) -> str:
+        """Queue ``leads`` as a job and return its id.
+
+        Leads whose metadata carries its own ``priority`` or deadline are
+        batched separately from the rest of the job.  ``weight`` sets the job's
+        fair share and defaults to
+        :func:`~lead_verifier.scheduling.priority_weight` of ``priority``.
+        """
+
+        if weight is not None and weight <= 0:
+            raise ValueError("weight must be positive")
+        job_id = job_id or uuid.uuid4().hex[:12]
+        batch_size = max(1, batch_size)
+        groups: Dict[Tuple[int, Optional[float]], List[List[Any]]] = {}
+        for position, lead in enumerate(leads):
+            key = (parse_priority(lead.metadata.get("priority"), default=priority), parse_deadline(lead.metadata) or deadline)
+            groups.setdefault(key, []).append([position, lead_to_dict(lead)])
+        now = time.time()
+        with self._transaction() as cursor:
+            served = cursor.execute(
+                "SELECT MIN(served) FROM jobs WHERE id IN "
+                "(SELECT job_id FROM batches WHERE state IN ('pending', 'leased'))"
+            ).fetchone()[0]
+            cursor.execute(
+                "INSERT INTO jobs (id, created_at, total, metadata, weight, served) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    job_id,
+                    now,
+                    len(leads),
+                    json.dumps({**metadata, "priority": priority, "deadline": deadline}, default=str),
+                    weight if weight is not None else priority_weight(priority),
+                    served or 0.0,
+                ),
+            )
+            cursor.executemany(
+                "INSERT INTO batches (job_id, payload, priority, deadline, created_at) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (job_id, json.dumps(members[start:start + batch_size]), group_priority, group_deadline, now)
+                    for (group_priority, group_deadline), members in groups.items()
+                    for start in range(0, len(members), batch_size)
+                ],
+            )
+        return job_id
+
+    def claim(self, worker_id: str, *, lease_seconds: float) -> Optional[Batch]:
+        now = time.time()
+        with self._transaction() as cursor:
+            cursor.execute(
+                "UPDATE batches SET state = 'failed', last_error = COALESCE(last_error, 'lease expired') "
+                "WHERE state = 'leased' AND lease_expires < ? AND attempts >= ?",
+                (now, self.max_attempts),
+            )
+            row = cursor.execute(
+                "SELECT b.id, b.job_id, b.payload FROM batches AS b JOIN jobs AS j ON j.id = b.job_id "
+                "WHERE b.state = 'pending' OR (b.state = 'leased' AND b.lease_expires < :now) "
+                "ORDER BY CASE WHEN b.deadline <= :horizon THEN b.deadline END IS NULL, "
+                "CASE WHEN b.deadline <= :horizon THEN b.deadline END, "
+                "j.served, b.created_at - b.priority * :aging, b.id LIMIT 1",
+                {"now": now, "horizon": now + self.deadline_slack_seconds, "aging": self.aging_seconds},
+            ).fetchone()
+            if row is None:
+                return None
+            token = uuid.uuid4().hex
+            payload = json.loads(row[2])
+            cursor.execute(
+                "UPDATE batches SET state = 'leased', lease_owner = ?, lease_token = ?, lease_expires = ?, "
+                "attempts = attempts + 1 WHERE id = ?",
+                (worker_id, token, now + lease_seconds, row[0]),
+            )
+            cursor.execute(
+                "UPDATE jobs SET served = served + ? / weight, started_at = COALESCE(started_at, ?) WHERE id = ?",
+                (len(payload), now, row[1]),
+            )
+        leads = [(int(position), lead_from_dict(data)) for position, data in payload]
+        return Batch(id=row[0], job_id=row[1], leads=leads, lease_token=token)
+
+    def complete(self, batch: Batch, results: Sequence[AggregatedLeadResult]) -> bool:
+        with self._transaction() as cursor:
+            updated = cursor.execute(
+                "UPDATE batches SET state = 'done', lease_expires = NULL WHERE id = ? AND lease_token = ? "
+                "AND state = 'leased'",
+                (batch.id, batch.lease_token),
+            ).rowcount
+            if not updated:
+                LOGGER.warning("Lease on batch %s expired before it completed; discarding results", batch.id)
+                return False
+            cursor.executemany(
+                "INSERT OR REPLACE INTO results (job_id, position, payload) VALUES (?, ?, ?)",
+                [
+                    (batch.job_id, position, json.dumps(aggregated_to_dict(result), default=str))
+                    for (position, _), result in zip(batch.leads, results)
+                ],
+            )
+        return True
+
+    def release(self, batch: Batch, error: str) -> None:
+        """Return a batch the worker could not finish so it is retried (or failed) promptly."""
+
+        with self._transaction() as cursor:
+            cursor.execute(
+                "UPDATE batches SET state = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+                "lease_owner = NULL, lease_token = NULL, lease_expires = NULL, last_error = ? "
+                "WHERE id = ? AND lease_token = ?",
+                (self.max_attempts, error, batch.id, batch.lease_token),
+            )
+
+    def status(self, job_id: str) -> JobStatus:
+        with self._lock:
+            job = self._connection.execute(
+                "SELECT total, created_at, metadata, started_at, weight FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+            if job is None:
+                raise KeyError(job_id)
+            counts = dict(
+                self._connection.execute(
+                    "SELECT state, COUNT(*) FROM batches WHERE job_id = ? GROUP BY state", (job_id,)
+                ).fetchall()
+            )
+            completed = self._connection.execute(
+                "SELECT COUNT(*) FROM results WHERE job_id = ?", (job_id,)
+            ).fetchone()[0]
+        return JobStatus(
+            job_id=job_id,
+            total=job[0],
+            completed=completed,
+            pending_batches=counts.get("pending", 0),
+            leased_batches=counts.get("leased", 0),
+            failed_batches=counts.get("failed", 0),
+            created_at=job[1],
+            metadata=json.loads(job[2]),
+            started_at=job[3],
+            weight=job[4],
+        )
+
+    def results(self, job_id: str) -> List[Tuple[int, AggregatedLeadResult]]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT position, payload FROM results WHERE job_id = ? ORDER BY position", (job_id,)
+            ).fetchall()
+        return [(position, aggregated_from_dict(json.loads(payload))) for position, payload in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class _ImmediateTransaction:
+    """Serialise writers across processes with ``BEGIN IMMEDIATE``."""
+
+    def __init__(self, connection: sqlite3.Connection, lock: threading.Lock) -> None:
+        self._connection = connection
+        self._lock = lock
+
+    def __enter__(self) -> sqlite3.Cursor:
+        self._lock.acquire()
+        try:
+            self._connection.execute("BEGIN IMMEDIATE")
+        except Exception:
+            self._lock.release()
+            raise
+        return self._connection.cursor()
+
+    def __exit__(self, exc_type, exc, exc_tb) -> None:
+        try:
+            self._connection.execute("ROLLBACK" if exc_type else "COMMIT")
+        finally:
+            self._lock.release()
+
+
+_BACKENDS: Dict[str, Callable[[str], JobQueueBackend]] = {"sqlite": SQLiteJobQueue}
+
+
+def register_backend(scheme: str, factory: Callable[[str], JobQueueBackend]) -> None:
+    """Make ``<scheme>://<location>`` queue URLs open with ``factory(location)``."""
+
+    _BACKENDS[scheme] = factory
+
+
+def open_queue(url: str | Path) -> JobQueueBackend:
+    """Open a queue from ``<scheme>://<location>``; bare paths use SQLite."""
+
+    text = str(url)
+    scheme, separator, location = text.partition("://")
+    if not separator:
+        return SQLiteJobQueue(text)
+    try:
+        factory = _BACKENDS[scheme]
+    except KeyError:
+        raise ValueError(f"Unknown job queue backend '{scheme}'. Registered: {sorted(_BACKENDS)}") from None
+    return factory(location)
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def run_worker(
+    queue: JobQueueBackend,
+    verify: Callable[[List[LeadInput]], List[AggregatedLeadResult]],
+    *,
+    worker_id: Optional[str] = None,
+    lease_seconds: float = 1800.0,
+    poll_interval: float = 5.0,
+    exit_when_idle: bool = False,
+    should_stop: Callable[[], bool] = lambda: False,
+) -> int:
+    """Claim batches and push their results back until stopped; return the number of batches done.
+
+    ``verify`` is typically :meth:`VerificationOrchestrator.verify`.  With
+    ``exit_when_idle`` the worker returns as soon as no batch is available
+    instead of polling every ``poll_interval`` seconds.
+    """
+
+    worker_id = worker_id or default_worker_id()
+    processed = 0
+    while not should_stop():
+        batch = queue.claim(worker_id, lease_seconds=lease_seconds)
+        if batch is None:
+            if exit_when_idle:
+                break
+            time.sleep(poll_interval)
+            continue
+        LOGGER.info("Worker %s verifying batch %s of job %s (%s leads)", worker_id, batch.id, batch.job_id, len(batch.leads))
+        try:
+            results = verify([lead for _, lead in batch.leads])
+        except Exception as exc:
+            LOGGER.exception("Batch %s failed", batch.id)
+            queue.release(batch, str(exc))
+            continue
+        if queue.complete(batch, results):
+            processed += 1
+    return processed
+
+
+def collect_results(queue: JobQueueBackend, job_id: str) -> List[AggregatedLeadResult]:
+    """Return the job's completed results in input order."""
+
+    return [result for _, result in queue.results(job_id)]
+
+
+__all__ = [
+    "Batch",
+    "DEFAULT_QUEUE_PATH",
+    "JobQueueBackend",
+    "JobStatus",
+    "SQLiteJobQueue",
+    "collect_results",
+    "default_worker_id",
+    "open_queue",
+    "register_backend",
+    "run_worker",
+]
@@ -12,6 +12,7 @@ try:
 except ImportError:  # pragma: no cover - pandas is optional at runtime
     pd = None  # type: ignore
 
+from .cancellation import CancellationToken, Cancelled, cancellation_scope
 from .models import LeadInput, LeadVerificationResult
 
 ProgressCallback = Callable[[int, int], None]
@@ -22,14 +23,26 @@ CompletionCallback = Callable[[List[LeadVerificationResult]], None]
 class LeadVerificationTask:
     """Container representing an ongoing verification job."""
 
-    def __init__(self, future: Future[List[LeadVerificationResult]]) -> None:
+    def __init__(
+        self, future: Future[List[LeadVerificationResult]], token: Optional[CancellationToken] = None
+    ) -> None:
         self._future = future
+        self._token = token or CancellationToken()
 
     def cancel(self) -> None:
-        """Attempt to cancel the underlying task."""
+        """Stop the task, keeping the results it already produced.
 
+        A task that has not started is dropped; a running task stops at its
+        next scraper wait and reports its partial results to the completion
+        callback.
+        """
+
+        self._token.cancel()
         self._future.cancel()
 
+    def cancelled(self) -> bool:
+        return self._token.cancelled
+
     def done(self) -> bool:
         return self._future.done()
 
@@ -106,6 +119,7 @@ class LeadVerifierOrchestrator:
 
         self._validate_mapping(mapping)
         leads_list = list(leads)
+        token = CancellationToken()
 
         future = self._executor.submit(
             self._run_verification,
@@ -114,8 +128,9 @@ class LeadVerifierOrchestrator:
             progress_callback,
             result_callback,
             completion_callback,
+            token,
         )
-        return LeadVerificationTask(future)
+        return LeadVerificationTask(future, token)
 
     # ------------------------------------------------------------------
     def _run_verification(
@@ -125,19 +140,26 @@ class LeadVerifierOrchestrator:
         progress_callback: Optional[ProgressCallback],
         result_callback: Optional[ResultCallback],
         completion_callback: Optional[CompletionCallback],
+        token: Optional[CancellationToken] = None,
     ) -> List[LeadVerificationResult]:
         total = len(leads)
         results: List[LeadVerificationResult] = []
 
-        for index, lead_row in enumerate(leads, start=1):
-            lead = self._normalise_lead(lead_row, mapping)
-            for scraper in self.scrapers:
-                result = scraper.verify(lead)
-                results.append(result)
-                if result_callback:
-                    result_callback(result)
-            if progress_callback:
-                progress_callback(index, total)
+        with cancellation_scope(token):
+            try:
+                for index, lead_row in enumerate(leads, start=1):
+                    lead = self._normalise_lead(lead_row, mapping)
+                    for scraper in self.scrapers:
+                        if token is not None:
+                            token.raise_if_cancelled()
+                        result = scraper.verify(lead)
+                        results.append(result)
+                        if result_callback:
+                            result_callback(result)
+                    if progress_callback:
+                        progress_callback(index, total)
+            except Cancelled:
+                pass
 
         if completion_callback:
             completion_callback(results)
@@ -1,19 +1,72 @@
 """Utility helpers for merging verification results from multiple scrapers."""
 from __future__ import annotations
 
-from typing import Iterable, List
+import threading
+from typing import Dict, Iterable, List, Optional
 
-from .models import AggregatedContact, AggregatedLeadResult, ContactDetail, LeadInput, LeadVerification
+from .models import AggregatedContact, AggregatedLeadResult, LeadInput, LeadVerification
+from .normalise import normalise_contacts
 
 
-def _normalise_contact(detail: ContactDetail) -> str:
-    value = detail.value.strip()
-    if detail.type.lower() == "email":
-        return value.lower()
-    if detail.type.lower() == "phone":
-        digits = [c for c in value if c.isdigit()]
-        return "".join(digits)
-    return value.lower()
+class IncrementalMerger:
+    """Fold one lead's scraper results into merged contacts as they arrive.
+
+    Each :meth:`add` updates the deduplicated contact map in place instead of
+    re-merging every result so far, so callers can show contacts as soon as
+    the first scraper returns.  :meth:`snapshot` returns a copy that is safe
+    to hand to another thread while results keep arriving.
+    """
+
+    def __init__(self, lead: LeadInput) -> None:
+        self.lead = lead
+        self._contacts: Dict[str, AggregatedContact] = {}
+        self._results: List[LeadVerification] = []
+        self._lock = threading.Lock()
+
+    def add(self, result: Optional[LeadVerification]) -> List[AggregatedContact]:
+        """Merge ``result`` and return the contacts it added that were not known before."""
+
+        if result is None:
+            return []
+        added: List[AggregatedContact] = []
+        keys = normalise_contacts((contact.type, contact.value) for contact in result.contacts)
+        with self._lock:
+            self._results.append(result)
+            for contact, value in zip(result.contacts, keys):
+                key = f"{contact.type.lower()}::{value}"
+                merged = self._contacts.get(key)
+                if merged is None:
+                    merged = AggregatedContact(type=contact.type, value=contact.value, sources=[result.source])
+                    self._contacts[key] = merged
+                    added.append(merged)
+                elif result.source not in merged.sources:
+                    merged.sources.append(result.source)
+        return added
+
+    def add_all(self, results: Iterable[Optional[LeadVerification]]) -> "IncrementalMerger":
+        for result in results:
+            self.add(result)
+        return self
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def result(self) -> AggregatedLeadResult:
+        """Return the merged result, sharing this merger's contact objects."""
+
+        with self._lock:
+            contacts = list(self._contacts.values())
+            return AggregatedLeadResult(lead=self.lead, contacts=contacts, raw_results=list(self._results))
+
+    def snapshot(self) -> AggregatedLeadResult:
+        """Return an independent copy of the contacts and results merged so far."""
+
+        with self._lock:
+            contacts = [
+                AggregatedContact(type=contact.type, value=contact.value, sources=list(contact.sources))
+                for contact in self._contacts.values()
+            ]
+            return AggregatedLeadResult(lead=self.lead, contacts=contacts, raw_results=list(self._results))
 
 
 def merge_lead_results(
@@ -21,30 +74,7 @@ def merge_lead_results(
 ) -> AggregatedLeadResult:
     """Merge contact details from multiple scrapers, deduplicating by value."""
 
-    aggregated: dict[str, AggregatedContact] = {}
-    ordered_keys: List[str] = []
-    result_list: List[LeadVerification] = [result for result in results if result is not None]
-
-    for result in result_list:
-        for contact in result.contacts:
-            key = f"{contact.type.lower()}::{_normalise_contact(contact)}"
-            if not key:
-                continue
-            if key not in aggregated:
-                aggregated[key] = AggregatedContact(
-                    type=contact.type,
-                    value=contact.value,
-                    sources=[result.source],
-                )
-                ordered_keys.append(key)
-            else:
-                merged = aggregated[key]
-                if result.source not in merged.sources:
-                    merged.sources.append(result.source)
+    return IncrementalMerger(lead).add_all(results).result()
+
 
-    ordered_contacts = [aggregated[key] for key in ordered_keys]
-    return AggregatedLeadResult(
-        lead=lead,
-        contacts=ordered_contacts,
-        raw_results=result_list,
-    )
+__all__ = ["IncrementalMerger", "merge_lead_results"]
@@ -150,6 +150,15 @@ class AggregatedLeadResult:
     contacts: List[AggregatedContact] = field(default_factory=list)
     raw_results: List[LeadVerification] = field(default_factory=list)
 
+    @property
+    def status(self) -> str:
+        """``complete``, or ``partial``/``unprocessed`` when a time budget skipped some/all scrapers."""
+
+        skipped = sum(1 for result in self.raw_results if result.raw_data and result.raw_data.get("time_budget"))
+        if not skipped:
+            return "complete"
+        return "unprocessed" if skipped == len(self.raw_results) else "partial"
+
 
 # --- Scraper Results (for individual site responses) ---
 
@@ -221,6 +230,8 @@ class ScraperResult:
     found: bool
     emails: List[EmailRecord] = field(default_factory=list)
     notes: ScraperNotes = field(default_factory=ScraperNotes)
+    not_found: bool = False
+    reparse_miss: bool = False
 
     def add_email(self, address: str, label: Optional[str] = None, **metadata: str) -> None:
         self.emails.append(EmailRecord(address=address, label=label, metadata=metadata))
@@ -0,0 +1,234 @@
+"""Canonical forms of phone numbers and email addresses used as merge keys.
+
+Phones become E.164 (``+13035550100``) when the country can be told, with an
+extension kept as ``;ext=12``; US numbers are recognised with or without the
+leading ``1``.  Emails are lower-cased and, for providers that ignore them,
+lose dots and ``+tag`` sub-addresses in the local part.  Every pattern and
+translation table is compiled once at import, the common digits-and-
+separators phone shape skips the regular expressions entirely, and the batch
+helpers transform a whole batch per string call so merging millions of
+contacts stays cheap.
+"""
+from __future__ import annotations
+
+import re
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+_SEPARATORS = str.maketrans("", "", " ()-./\t")
+_ASCII_NON_DIGITS = str.maketrans("", "", "".join(chr(code) for code in range(128) if not chr(code).isdigit()))
+_NON_DIGITS = re.compile(r"\D+")
+_LETTERS = re.compile(r"[A-Za-z]")
+_EXTENSION = re.compile(r"(?:;ext=|ext\.?|extension|#|(?<=[\d\s)])x)\s*(\d{1,6})\s*$", re.IGNORECASE)
+_COMPACT_EXTENSION = re.compile(r"(\+?\d+),?(?:;?ext=?|extension|x|#)(\d{1,6})", re.IGNORECASE)
+_INTERNATIONAL_PREFIX = re.compile(r"^\s*(?:\+|00|011)")
+_VANITY = str.maketrans(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz",
+    "2223334445556667777888999922233344455566677778889999",
+)
+# A number with a full seven-digit local part before its letters is a number plus a label, not a vanity number.
+_MAX_VANITY_PREFIX_DIGITS = 6
+
+# Per provider: the canonical domain, whether "+tag" is dropped and whether dots are ignored.
+_EMAIL_PROVIDERS: Dict[str, Tuple[str, bool, bool]] = {
+    "gmail.com": ("gmail.com", True, True),
+    "googlemail.com": ("gmail.com", True, True),
+    **{
+        domain: (domain, True, False)
+        for domain in (
+            "outlook.com",
+            "hotmail.com",
+            "live.com",
+            "msn.com",
+            "icloud.com",
+            "me.com",
+            "mac.com",
+            "fastmail.com",
+            "protonmail.com",
+            "proton.me",
+        )
+    },
+}
+
+
+def _digits(value: str) -> str:
+    if value.isascii():
+        return value.translate(_ASCII_NON_DIGITS)
+    return _NON_DIGITS.sub("", value)
+
+
+def _vanity_digits(value: str) -> str:
+    """Return ``value`` with keypad letters turned into digits when it looks like ``1-800-FLOWERS``."""
+
+    first_letter = _LETTERS.search(value)
+    if first_letter is None:
+        return value
+    prefix = _digits(value[: first_letter.start()])
+    if prefix.startswith("1"):
+        prefix = prefix[1:]
+    if not prefix or len(prefix) > _MAX_VANITY_PREFIX_DIGITS:
+        return value
+    return value.translate(_VANITY)
+
+
+def normalise_phone(value: str) -> str:
+    """Return ``value`` in E.164 form, or its bare digits when the country is unknown.
+
+    >>> normalise_phone("1 (303) 555-0100 ext. 12")
+    '+13035550100;ext=12'
+    """
+
+    key = _compact_phone(value.translate(_SEPARATORS))
+    if key is not None:
+        return key
+
+    value = value.strip()
+    extension = ""
+    match = _EXTENSION.search(value)
+    if match is not None:
+        extension = f";ext={match.group(1)}"
+        value = value[: match.start()].rstrip(" ,")
+    international = _INTERNATIONAL_PREFIX.match(value)
+    digits = _digits(_vanity_digits(value))
+    if international is not None:
+        prefix = international.group(0).strip()
+        if prefix != "+":
+            digits = digits[len(prefix) :]
+        return f"+{digits}{extension}" if digits else ""
+    return _with_country(digits, extension)
+
+
+def _compact_phone(compact: str) -> Optional[str]:
+    """Return the key of a number stripped of separators, or ``None`` when it needs the full parser.
+
+    This covers digits with an optional ``+`` and extension, the shape almost
+    every scraped number has, without the regular expressions of the full path.
+    """
+
+    if not compact.isascii():
+        return None
+    if compact.isdigit():
+        return None if compact.startswith(("00", "011")) else _with_country(compact, "")
+    if compact[:1] == "+" and compact[1:].isdigit():
+        return compact
+    match = _COMPACT_EXTENSION.fullmatch(compact)
+    if match is not None:
+        number = _compact_phone(match.group(1))
+        if number is not None:
+            return f"{number};ext={match.group(2)}"
+    return None
+
+
+def _with_country(digits: str, extension: str) -> str:
+    """Prefix a US number with ``+1``; other national numbers keep their bare digits."""
+
+    if len(digits) == 11 and digits[0] == "1" and digits[1] not in "01":
+        return f"+{digits}{extension}"
+    if len(digits) == 10 and digits[0] not in "01":
+        return f"+1{digits}{extension}"
+    return f"{digits}{extension}"
+
+
+def normalise_email(value: str) -> str:
+    """Return the lower-cased address with provider-specific aliases folded.
+
+    >>> normalise_email(" J.Doe+news@GoogleMail.com ")
+    'jdoe@gmail.com'
+    """
+
+    return _fold_email(value.strip().lower())
+
+
+def _fold_email(value: str) -> str:
+    """Fold provider aliases out of a lower-cased address; one left without a local part is kept as is."""
+
+    local, at, domain = value.rpartition("@")
+    provider = _EMAIL_PROVIDERS.get(domain)
+    if provider is None or not at:
+        return value
+    domain, drop_tag, drop_dots = provider
+    if drop_tag:
+        local = local.partition("+")[0]
+    if drop_dots:
+        local = local.replace(".", "")
+    if not local:
+        return value
+    return f"{local}@{domain}"
+
+
+def _normalise_other(value: str) -> str:
+    return value.strip().lower()
+
+
+def normalise_contact_value(contact_type: str, value: str) -> str:
+    """Return the canonical form of a contact ``value`` of ``contact_type``."""
+
+    return _NORMALISERS.get(contact_type.lower(), _normalise_other)(value)
+
+
+_NORMALISERS: Dict[str, Callable[[str], str]] = {"phone": normalise_phone, "email": normalise_email}
+
+
+def _joined(values: List[str], transform: Callable[[str], str]) -> List[str]:
+    """Apply a string-wide ``transform`` to all ``values`` in one call instead of one call each."""
+
+    parts = transform("\n".join(values)).split("\n")
+    return parts if len(parts) == len(values) else [transform(value) for value in values]
+
+
+def normalise_phones(values: Iterable[str]) -> List[str]:
+    """Batch form of :func:`normalise_phone`.
+
+    Separators are removed from the whole batch at once and only numbers that
+    are not plain digits afterwards go through the per-value path.
+    """
+
+    values = list(values)
+    keys: List[str] = []
+    append = keys.append
+    for value, compact in zip(values, _joined(values, lambda text: text.translate(_SEPARATORS))):
+        key = _compact_phone(compact)
+        append(key if key is not None else normalise_phone(value))
+    return keys
+
+
+def normalise_emails(values: Iterable[str]) -> List[str]:
+    """Batch form of :func:`normalise_email`; the batch is lower-cased in one call."""
+
+    return [_fold_email(value.strip()) for value in _joined(list(values), str.lower)]
+
+
+_BATCH_NORMALISERS: Dict[str, Callable[[Iterable[str]], List[str]]] = {
+    "phone": normalise_phones,
+    "email": normalise_emails,
+}
+
+
+def normalise_contacts(contacts: Iterable[Tuple[str, str]]) -> List[str]:
+    """Normalise ``(type, value)`` pairs, running each contact type as one batch."""
+
+    groups: Dict[str, Tuple[List[int], List[str]]] = {}
+    count = 0
+    for count, (contact_type, value) in enumerate(contacts, start=1):
+        group = groups.get(contact_type)
+        if group is None:
+            group = groups[contact_type] = ([], [])
+        group[0].append(count - 1)
+        group[1].append(value)
+
+    keys: List[str] = [""] * count
+    for contact_type, (indexes, values) in groups.items():
+        batch = _BATCH_NORMALISERS.get(contact_type.lower())
+        normalised = batch(values) if batch is not None else [_normalise_other(value) for value in values]
+        for index, key in zip(indexes, normalised):
+            keys[index] = key
+    return keys
+
+
+__all__ = [
+    "normalise_contact_value",
+    "normalise_contacts",
+    "normalise_email",
+    "normalise_emails",
+    "normalise_phone",
+    "normalise_phones",
+]
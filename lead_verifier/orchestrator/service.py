@@ -2,10 +2,17 @@
 from __future__ import annotations
 
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Callable, Iterable, List, Optional, Protocol, Sequence
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from typing import Callable, Dict, Iterable, List, Optional, Protocol, Sequence
 
-from ..merge import merge_lead_results
+from ..batching import MicroBatcher, supports_verify_many
+from ..budget import LatencyTracker, TimeBudget, budget_skipped_result
+from ..cancellation import Cancelled, check_cancelled, submit_with_context
+from ..captcha import AttentionQueue, CaptchaDeferred, DeferredLead
+from ..gating import ExecutionPolicy, skipped_result
+from ..merge import IncrementalMerger, merge_lead_results
 from ..models import AggregatedLeadResult, LeadInput, LeadVerification
 
 LOGGER = logging.getLogger(__name__)
@@ -17,11 +24,51 @@ class ScraperProtocol(Protocol):
     name: str
 
     def verify(self, lead: LeadInput) -> LeadVerification:  # pragma: no cover - runtime protocol
-        """Return contact details for the supplied lead."""
+        """Return contact details for the supplied lead.
+
+        Scrapers may also define ``verify_many(leads)`` returning one result
+        per lead, in order, when a batch is cheaper than separate calls.
+        """
 
 
 class VerificationOrchestrator:
-    """Runs a collection of scrapers for each lead and merges the results."""
+    """Runs a collection of scrapers for each lead and merges the results.
+
+    ``lead_concurrency`` verifies that many leads at once.  Only use it with
+    scrapers that tolerate concurrent calls, such as
+    :class:`~lead_verifier.isolation.ProcessIsolatedScraper` pools with at
+    least as many processes.
+
+    With an ``execution_policy`` scrapers run in cost tiers, cheapest first,
+    and a scraper whose run condition is not met (or every scraper after the
+    policy's stop condition is met) is skipped.  Skipped scrapers appear in
+    ``raw_results`` with ``raw_data={"skipped": True, "reason": ...}``.
+    Scrapers with dependencies wait for them and receive the enriched lead;
+    in ``concurrent`` mode independent branches run in parallel.
+
+    Scrapers that implement ``verify_many`` are called through a
+    :class:`~lead_verifier.batching.MicroBatcher` sending up to
+    ``batch_size`` leads per call, lingering ``batch_linger_seconds`` for
+    stragglers.  Without an execution policy every lead passed to
+    :meth:`verify` is queued up front, so full batches go out immediately.
+    ``batch_size=1`` disables batching.
+
+    Work runs under the caller's
+    :func:`~lead_verifier.cancellation.cancellation_scope`, including the
+    worker threads.  Once that token is cancelled no further scraper starts,
+    waiting scrapers are interrupted and :meth:`verify` raises
+    :class:`~lead_verifier.cancellation.Cancelled` carrying the merged
+    results of the leads that had finished.
+
+    With a ``time_budget`` in seconds, counted from the first lead, each lead
+    runs only the scrapers that its share of the remaining time can afford
+    according to :attr:`latency` (see :class:`~lead_verifier.budget.TimeBudget`).
+    Scrapers left out are recorded like skipped ones with
+    ``raw_data["time_budget"] = True``, which makes the merged result's
+    ``status`` ``partial``, or ``unprocessed`` once the budget is spent.
+    Prefetching for batches is disabled so no scraper starts ahead of that
+    decision.
+    """
 
     def __init__(
         self,
@@ -31,45 +78,364 @@ class VerificationOrchestrator:
         concurrent: bool = False,
         max_workers: Optional[int] = None,
         raise_on_error: bool = False,
+        attention_queue: Optional[AttentionQueue] = None,
+        lead_concurrency: int = 1,
+        execution_policy: Optional[ExecutionPolicy] = None,
+        batch_size: int = 25,
+        batch_linger_seconds: float = 0.05,
+        time_budget: Optional[float] = None,
     ) -> None:
         self._scrapers = list(scrapers)
         self._merge_function = merge_function
         self._concurrent = concurrent
         self._max_workers = max_workers
         self._raise_on_error = raise_on_error
+        self._lead_concurrency = max(1, lead_concurrency)
+        self._execution_policy = execution_policy
+        self._batchers: Dict[int, MicroBatcher] = {}
+        if batch_size > 1:
+            self._batchers = {
+                id(scraper): MicroBatcher(scraper, batch_size=batch_size, linger_seconds=batch_linger_seconds)
+                for scraper in self._scrapers
+                if supports_verify_many(scraper)
+            }
+        self._warm_up_futures: Dict[int, Future] = {}
+        self._time_budget_seconds = time_budget
+        self._time_budget: Optional[TimeBudget] = None
+        self._leads_left: Optional[int] = None
+        self._budget_lock = threading.Lock()
+        self.latency = LatencyTracker()
+        self.attention_queue = attention_queue if attention_queue is not None else AttentionQueue()
 
     @property
     def scrapers(self) -> List[ScraperProtocol]:
         return list(self._scrapers)
 
-    def verify(self, leads: Iterable[LeadInput]) -> List[AggregatedLeadResult]:
-        """Run all configured scrapers for every lead provided."""
+    @property
+    def time_budget(self) -> Optional[TimeBudget]:
+        """The running :class:`~lead_verifier.budget.TimeBudget`, once the first lead has started."""
+
+        return self._time_budget
+
+    def start_warm_up(self) -> None:
+        """Launch every scraper's browser in the background.
+
+        Scrapers exposing a ``warm_up()`` method are started in parallel so the
+        cost of launching Chrome/Chromium overlaps with loading the input file.
+        Each scraper's first call waits only for its own warm-up to finish.
+        """
+
+        if self._warm_up_futures:
+            return
+        candidates = [scraper for scraper in self._scrapers if callable(getattr(scraper, "warm_up", None))]
+        if not candidates:
+            return
+        executor = ThreadPoolExecutor(max_workers=len(candidates), thread_name_prefix="scraper-warm-up")
+        for scraper in candidates:
+            LOGGER.debug("Warming up scraper %s", scraper.name)
+            self._warm_up_futures[id(scraper)] = executor.submit(scraper.warm_up)
+        executor.shutdown(wait=False)
+
+    def close(self) -> None:
+        """Release browser resources held by the configured scrapers."""
+
+        for batcher in self._batchers.values():
+            batcher.close()
+        for scraper in self._scrapers:
+            close = getattr(scraper, "close", None)
+            if callable(close):
+                try:
+                    close()
+                except Exception:  # pragma: no cover - defensive cleanup
+                    LOGGER.exception("Failed to close scraper %s", scraper.name)
 
-        aggregated: List[AggregatedLeadResult] = []
-        for lead in leads:
-            raw_results = self._run_scrapers_for_lead(lead)
-            aggregated.append(self._merge_function(lead, raw_results))
+    def verify(
+        self,
+        leads: Iterable[LeadInput],
+        *,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        partial_callback: Optional[Callable[[AggregatedLeadResult], None]] = None,
+    ) -> List[AggregatedLeadResult]:
+        """Run all configured scrapers for every lead provided.
+
+        ``progress_callback(completed, total)`` is called as leads finish.
+        ``partial_callback`` receives a snapshot of a lead's contacts from an
+        :class:`~lead_verifier.merge.IncrementalMerger` each time one of its
+        scrapers returns, before the lead's final merge.
+        """
+
+        leads = list(leads)
+        results_per_lead: List[Optional[List[LeadVerification]]] = [None] * len(leads)
+        cancelled = False
+        prefetching = list(self._batchers.values())
+        if self._execution_policy is not None or self._time_budget_seconds is not None:
+            prefetching = []
+        for batcher in prefetching:
+            batcher.prefetch(leads)
+        self.expect_leads(len(leads))
+        try:
+            if self._lead_concurrency > 1:
+                with ThreadPoolExecutor(max_workers=self._lead_concurrency, thread_name_prefix="lead") as executor:
+                    futures = [
+                        submit_with_context(executor, self.run_scrapers, lead, partial_callback) for lead in leads
+                    ]
+                    for index, future in enumerate(futures):
+                        try:
+                            results_per_lead[index] = future.result()
+                        except Cancelled:
+                            cancelled = True
+                        if progress_callback is not None and not cancelled:
+                            progress_callback(index + 1, len(leads))
+            else:
+                for index, lead in enumerate(leads):
+                    results_per_lead[index] = self.run_scrapers(lead, partial_callback)
+                    if progress_callback is not None:
+                        progress_callback(index + 1, len(leads))
+        except Cancelled:
+            cancelled = True
+        finally:
+            for batcher in prefetching:
+                batcher.discard_prefetched(leads)
+            self.expect_leads(None)
+        aggregated = [
+            self.merge(lead, raw_results)
+            for lead, raw_results in zip(leads, results_per_lead)
+            if raw_results is not None
+        ]
+        if cancelled:
+            raise Cancelled(f"Cancelled after {len(aggregated)} of {len(leads)} leads", results=aggregated)
         return aggregated
 
-    def _run_scrapers_for_lead(self, lead: LeadInput) -> List[LeadVerification]:
-        results: List[LeadVerification] = []
+    def run_scrapers(
+        self, lead: LeadInput, partial_callback: Optional[Callable[[AggregatedLeadResult], None]] = None
+    ) -> List[LeadVerification]:
+        """Run the configured scrapers for one lead and return their unmerged results.
+
+        With a ``partial_callback``, see :meth:`verify`.
+        """
+
+        if partial_callback is None:
+            return self._run_scrapers_for_lead(lead)
+        merger = IncrementalMerger(lead)
+
+        def on_result(result: LeadVerification) -> None:
+            merger.add(result)
+            partial_callback(merger.snapshot())
+
+        return self._run_scrapers_for_lead(lead, on_result)
+
+    def merge(self, lead: LeadInput, raw_results: List[LeadVerification]) -> AggregatedLeadResult:
+        """Merge one lead's scraper results, registering it for :meth:`resolve_deferred` if parked."""
+
+        merged = self._merge_function(lead, raw_results)
+        if any(self._is_deferred(result) for result in raw_results):
+            self.attention_queue.attach(lead, merged)
+        return merged
+
+    def resolve_deferred(self) -> List[AggregatedLeadResult]:
+        """Finish every lead parked on a CAPTCHA and re-merge its result.
+
+        Call this once an operator has cleared the challenges.  Leads whose
+        CAPTCHA is still unsolved are parked again.  The merged results
+        returned by :meth:`verify` are updated in place and also returned.
+        """
+
+        updated: List[AggregatedLeadResult] = []
+        for entry in self.attention_queue.take_all():
+            try:
+                verification = entry.resume()
+            except CaptchaDeferred as exc:
+                entry.resume, entry.release = exc.resume, exc.release
+                self.attention_queue.park(entry)
+                continue
+            except Exception as exc:  # pragma: no cover - defensive programming
+                LOGGER.exception("Deferred scraper %s failed for lead %s", entry.scraper_name, entry.lead)
+                verification = LeadVerification(source=entry.scraper_name, contacts=[], raw_data={"error": str(exc)})
+            verification.source = entry.scraper_name
+
+            aggregated = entry.aggregated
+            if aggregated is None:
+                continue
+            raw_results = [
+                verification if result.source == entry.scraper_name and self._is_deferred(result) else result
+                for result in aggregated.raw_results
+            ]
+            merged = self._merge_function(aggregated.lead, raw_results)
+            aggregated.contacts = merged.contacts
+            aggregated.raw_results = merged.raw_results
+            if aggregated not in updated:
+                updated.append(aggregated)
+        return updated
+
+    def _run_scrapers_for_lead(
+        self, lead: LeadInput, on_result: Optional[Callable[[LeadVerification], None]] = None
+    ) -> List[LeadVerification]:
+        over_budget = self._budget_skips()
+        if self._execution_policy is None:
+            if not over_budget:
+                return self._run_scrapers(self._scrapers, lead, on_result)
+            results = [budget_skipped_result(name, reason) for name, reason in over_budget.items()]
+            for result in results:
+                self._notify(on_result, result)
+            affordable = [scraper for scraper in self._scrapers if scraper.name not in over_budget]
+            results += self._run_scrapers(affordable, lead, on_result)
+            return self._in_configured_order(results)
         if not self._concurrent or len(self._scrapers) <= 1:
-            for scraper in self._scrapers:
-                results.append(self._execute_scraper(scraper, lead))
+            return self._run_policy(lead, None, over_budget, on_result)
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            return self._run_policy(lead, executor, over_budget, on_result)
+
+    @staticmethod
+    def _notify(on_result: Optional[Callable[[LeadVerification], None]], result: LeadVerification) -> LeadVerification:
+        if on_result is not None:
+            on_result(result)
+        return result
+
+    def expect_leads(self, count: Optional[int]) -> None:
+        """Tell the time budget how many leads are still to come, or ``None`` when unknown.
+
+        :meth:`verify` does this itself; callers that drive :meth:`run_scrapers`
+        one lead at a time use it so each lead gets its share of the budget
+        rather than all of what remains.
+        """
+
+        with self._budget_lock:
+            self._leads_left = count
+
+    def _budget_skips(self) -> Dict[str, str]:
+        """Return the scrapers the next lead cannot afford under the time budget, with reasons."""
+
+        if self._time_budget_seconds is None:
+            return {}
+        with self._budget_lock:
+            if self._time_budget is None:
+                self._time_budget = TimeBudget(self._time_budget_seconds)
+            leads_left = self._leads_left
+            if self._leads_left:
+                self._leads_left -= 1
+        return self._time_budget.plan(
+            [scraper.name for scraper in self._scrapers],
+            self.latency,
+            leads_left=leads_left,
+            parallel_leads=self._lead_concurrency,
+            concurrent=self._concurrent,
+        )
+
+    def _run_policy(
+        self,
+        lead: LeadInput,
+        executor: Optional[ThreadPoolExecutor],
+        over_budget: Dict[str, str],
+        on_result: Optional[Callable[[LeadVerification], None]] = None,
+    ) -> List[LeadVerification]:
+        """Run the scrapers as the execution policy's cost tiers and dependency graph allow."""
+
+        policy = self._execution_policy
+        assert policy is not None
+        pending = list(self._scrapers)
+        finished: Dict[str, LeadVerification] = {}
+        running: Dict[Future, ScraperProtocol] = {}
+        while pending or running:
+            ready = policy.ready(pending, finished, [scraper.name for scraper in running.values()])
+            if not ready and not running:
+                raise RuntimeError(f"Scrapers {[scraper.name for scraper in pending]} can never become ready")
+            for scraper in ready:
+                pending.remove(scraper)
+                reason = policy.skip_reason(scraper.name, lead, finished.values())
+                if reason is not None:
+                    LOGGER.debug("Skipping scraper %s for lead %s: %s", scraper.name, lead, reason)
+                    finished[scraper.name] = self._notify(on_result, skipped_result(scraper.name, reason))
+                    continue
+                if scraper.name in over_budget:
+                    LOGGER.debug("Skipping scraper %s for lead %s: %s", scraper.name, lead, over_budget[scraper.name])
+                    skipped = budget_skipped_result(scraper.name, over_budget[scraper.name])
+                    finished[scraper.name] = self._notify(on_result, skipped)
+                    continue
+                scraper_lead = policy.lead_for(scraper.name, lead, finished)
+                if executor is None:
+                    finished[scraper.name] = self._notify(on_result, self._execute_scraper(scraper, scraper_lead, lead))
+                else:
+                    running[submit_with_context(executor, self._execute_scraper, scraper, scraper_lead, lead)] = scraper
+            if running:
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    finished[running.pop(future).name] = self._notify(on_result, future.result())
+        return self._in_configured_order(list(finished.values()))
+
+    def _run_scrapers(
+        self,
+        scrapers: Sequence[ScraperProtocol],
+        lead: LeadInput,
+        on_result: Optional[Callable[[LeadVerification], None]] = None,
+    ) -> List[LeadVerification]:
+        results: List[LeadVerification] = []
+        if not self._concurrent or len(scrapers) <= 1:
+            for scraper in scrapers:
+                results.append(self._notify(on_result, self._execute_scraper(scraper, lead)))
             return results
 
         with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
-            futures = [executor.submit(self._execute_scraper, scraper, lead) for scraper in self._scrapers]
+            futures = [submit_with_context(executor, self._execute_scraper, scraper, lead) for scraper in scrapers]
             for future in as_completed(futures):
-                results.append(future.result())
+                results.append(self._notify(on_result, future.result()))
+        return self._in_configured_order(results)
+
+    def _in_configured_order(self, results: List[LeadVerification]) -> List[LeadVerification]:
         order_map = {scraper.name: index for index, scraper in enumerate(self._scrapers)}
-        results.sort(key=lambda result: order_map.get(result.source, len(self._scrapers)))
-        return results
+        return sorted(results, key=lambda result: order_map.get(result.source, len(self._scrapers)))
+
+    @staticmethod
+    def _is_deferred(result: LeadVerification) -> bool:
+        return bool(result.raw_data and result.raw_data.get("deferred"))
+
+    def _await_ready(self, scraper: ScraperProtocol) -> None:
+        future = self._warm_up_futures.get(id(scraper))
+        if future is None:
+            return
+        try:
+            future.result()
+        except Exception:  # pragma: no cover - scraper starts lazily instead
+            LOGGER.warning("Warm-up failed for scraper %s; starting on first use", scraper.name, exc_info=True)
+        self._warm_up_futures.pop(id(scraper), None)
+
+    def _execute_scraper(
+        self, scraper: ScraperProtocol, lead: LeadInput, origin: Optional[LeadInput] = None
+    ) -> LeadVerification:
+        """Run ``scraper`` on ``lead``.
+
+        ``origin`` is the lead as the caller merges it when ``lead`` is a copy
+        enriched for a dependent scraper; a CAPTCHA parks it under ``origin``
+        so :meth:`resolve_deferred` finds the merged result, while retries
+        still search with ``lead``.
+        """
 
-    def _execute_scraper(self, scraper: ScraperProtocol, lead: LeadInput) -> LeadVerification:
+        check_cancelled()
+        self._await_ready(scraper)
         try:
             LOGGER.debug("Running scraper %s for lead %s", scraper.name, lead)
-            return scraper.verify(lead)
+            started = time.perf_counter()
+            result = self._batchers.get(id(scraper), scraper).verify(lead)
+            self.latency.record(scraper.name, time.perf_counter() - started, found=bool(result.contacts))
+            return result
+        except CaptchaDeferred as exc:
+            LOGGER.info("Scraper %s parked lead %s on a CAPTCHA", scraper.name, lead)
+            self.attention_queue.park(
+                DeferredLead(
+                    lead=origin if origin is not None else lead,
+                    scraper_name=scraper.name,
+                    resume=exc.resume,
+                    release=exc.release,
+                    reason=str(exc),
+                ),
+                retry=lambda: scraper.verify(lead),
+            )
+            return LeadVerification(
+                source=scraper.name,
+                contacts=[],
+                raw_data={"deferred": True, "reason": str(exc)},
+            )
+        except Cancelled:
+            raise
         except Exception as exc:  # pragma: no cover - defensive programming
             LOGGER.exception("Scraper %s failed for lead %s", scraper.name, lead)
             if self._raise_on_error:
@@ -0,0 +1,72 @@
+"""On-disk cache of raw search result pages keyed by URL hash."""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+
+@dataclass
+class CachedPage:
+    """Raw HTML captured for a search URL."""
+
+    url: str
+    html: str
+    fetched_at: float
+
+
+class PageCache:
+    """Store gzip-compressed HTML for visited URLs so results can be re-parsed offline.
+
+    Pages live at ``<directory>/<hash[:2]>/<hash>.json.gz`` where ``hash`` is the
+    SHA-256 of the URL.  Each entry records the URL and the time it was fetched;
+    a newer visit to the same URL replaces the previous entry.
+    """
+
+    def __init__(self, directory: str | Path, *, max_age_seconds: Optional[float] = None) -> None:
+        self.directory = Path(directory)
+        self.max_age_seconds = max_age_seconds
+
+    @staticmethod
+    def key_for(url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def path_for(self, url: str) -> Path:
+        key = self.key_for(url)
+        return self.directory / key[:2] / f"{key}.json.gz"
+
+    def store(self, url: str, html: str, *, fetched_at: Optional[float] = None) -> CachedPage:
+        page = CachedPage(url=url, html=html, fetched_at=fetched_at if fetched_at is not None else time.time())
+        path = self.path_for(url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps({"url": page.url, "fetched_at": page.fetched_at, "html": page.html})
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with gzip.open(temp_path, "wt", encoding="utf-8") as handle:
+            handle.write(payload)
+        os.replace(temp_path, path)
+        return page
+
+    def load(self, url: str) -> Optional[CachedPage]:
+        path = self.path_for(url)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as handle:
+                payload = json.load(handle)
+        except (OSError, ValueError):
+            return None
+        if payload.get("url") != url:
+            return None
+        page = CachedPage(url=payload["url"], html=payload["html"], fetched_at=float(payload["fetched_at"]))
+        if self.max_age_seconds is not None and time.time() - page.fetched_at > self.max_age_seconds:
+            return None
+        return page
+
+    def __contains__(self, url: object) -> bool:
+        return isinstance(url, str) and self.load(url) is not None
+
+
+__all__ = ["CachedPage", "PageCache"]
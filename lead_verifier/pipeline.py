@@ -0,0 +1,248 @@
+"""Staged verification with bounded queues: read → dispatch → merge → write."""
+from __future__ import annotations
+
+import contextvars
+import logging
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .cancellation import Cancelled, current_token
+from .models import AggregatedLeadResult, LeadInput
+from .orchestrator import VerificationOrchestrator
+
+LOGGER = logging.getLogger(__name__)
+
+_DONE = object()
+_POLL_SECONDS = 0.1
+
+
+class _Stopped(Exception):
+    """Raised inside a stage when another stage failed."""
+
+
+@dataclass
+class PipelineStats:
+    """Counters updated while a pipeline runs."""
+
+    read: int = 0
+    verified: int = 0
+    written: int = 0
+    max_in_flight: int = 0
+    cancelled: bool = False
+
+
+class VerificationPipeline:
+    """Stream leads through an orchestrator with memory bounded by queue depth.
+
+    A reader thread pulls leads from the input iterable, ``workers`` dispatch
+    threads run the scrapers for one lead each, a merge thread folds their
+    results with the orchestrator's merge function, and the calling thread
+    writes merged results in input order.  The stages are connected by queues
+    of ``queue_size`` items, and at most ``window`` leads may be between the
+    reader and the writer at once.  A slow lead therefore stalls the reader
+    rather than growing the reorder buffer.  If any stage raises, the other
+    stages stop and :meth:`run` re-raises the first error.
+
+    When the caller's cancellation token is cancelled the reader stops, leads
+    still being verified are dropped, and every lead that finished is merged
+    and written (in input order, skipping the dropped ones) before :meth:`run`
+    raises :class:`~lead_verifier.cancellation.Cancelled`.
+
+    ``total`` is the number of leads the input will yield, when known; it
+    lets the orchestrator's time budget give each lead its share of the time
+    left instead of all of it.
+
+    ``partial_callback`` is passed to
+    :meth:`~lead_verifier.orchestrator.VerificationOrchestrator.run_scrapers`,
+    so it sees each lead's contacts grow from the dispatch threads while the
+    ordered results are still waiting for the writer.
+    """
+
+    def __init__(
+        self,
+        orchestrator: VerificationOrchestrator,
+        *,
+        workers: int = 1,
+        queue_size: int = 64,
+        window: Optional[int] = None,
+        partial_callback: Optional[Callable[[AggregatedLeadResult], None]] = None,
+        total: Optional[int] = None,
+    ) -> None:
+        self.orchestrator = orchestrator
+        self.partial_callback = partial_callback
+        self.total = total
+        self.workers = max(1, workers)
+        self.queue_size = max(1, queue_size)
+        self.window = window if window is not None else 2 * self.queue_size + self.workers
+        self.stats = PipelineStats()
+
+    def run(self, leads: Iterable[LeadInput], write: Callable[[AggregatedLeadResult], None]) -> int:
+        """Verify ``leads`` and pass each merged result to ``write`` in input order; return the count."""
+
+        self.stats = PipelineStats()
+        self._stop = threading.Event()
+        self._errors: List[BaseException] = []
+        self._window = threading.Semaphore(self.window)
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        dispatch_queue: "queue.Queue[Any]" = queue.Queue(self.queue_size)
+        merge_queue: "queue.Queue[Any]" = queue.Queue(self.queue_size)
+        write_queue: "queue.Queue[Any]" = queue.Queue(self.queue_size)
+
+        self._token = current_token()
+
+        threads = [self._thread("pipeline-read", self._read, leads, dispatch_queue)]
+        threads += [
+            self._thread(f"pipeline-dispatch-{index}", self._dispatch, dispatch_queue, merge_queue)
+            for index in range(self.workers)
+        ]
+        threads.append(self._thread("pipeline-merge", self._merge, merge_queue, write_queue))
+        self.orchestrator.expect_leads(self.total)
+        try:
+            for thread in threads:
+                thread.start()
+            self._stage(self._write, write_queue, write)
+            for thread in threads:
+                thread.join()
+        finally:
+            self.orchestrator.expect_leads(None)
+        if self._errors:
+            raise self._errors[0]
+        if self.stats.cancelled:
+            raise Cancelled(f"Cancelled after writing {self.stats.written} of {self.stats.read} leads")
+        return self.stats.written
+
+    def _thread(self, name: str, target: Callable[..., None], *args: Any) -> threading.Thread:
+        # Each stage gets its own copy of the caller's context so scrapers see its cancellation token.
+        context = contextvars.copy_context()
+        return threading.Thread(target=context.run, args=(self._stage, target, *args), name=name, daemon=True)
+
+    # ------------------------------------------------------------------
+    # Stages
+    def _stage(self, target: Callable[..., None], *args: Any) -> None:
+        try:
+            target(*args)
+        except _Stopped:
+            pass
+        except BaseException as exc:
+            LOGGER.error("Pipeline stage %s failed: %s", threading.current_thread().name, exc)
+            self._errors.append(exc)
+            self._stop.set()
+
+    def _read(self, leads: Iterable[LeadInput], output: "queue.Queue[Any]") -> None:
+        try:
+            for position, lead in enumerate(leads):
+                if self._cancelled():
+                    break
+                self._acquire_slot()
+                self.stats.read += 1
+                self._put(output, (position, lead))
+        finally:
+            for _ in range(self.workers):
+                self._put(output, _DONE, force=True)
+
+    def _dispatch(self, source: "queue.Queue[Any]", output: "queue.Queue[Any]") -> None:
+        while True:
+            item = self._get(source)
+            if item is _DONE:
+                self._put(output, _DONE, force=True)
+                return
+            position, lead = item
+            try:
+                raw_results = self.orchestrator.run_scrapers(lead, self.partial_callback)
+            except Cancelled:
+                self.stats.cancelled = True
+                self._release_slot()
+                continue
+            self._put(output, (position, lead, raw_results))
+
+    def _merge(self, source: "queue.Queue[Any]", output: "queue.Queue[Any]") -> None:
+        remaining = self.workers
+        try:
+            while remaining:
+                item = self._get(source)
+                if item is _DONE:
+                    remaining -= 1
+                    continue
+                position, lead, raw_results = item
+                self._put(output, (position, self.orchestrator.merge(lead, raw_results)))
+                self.stats.verified += 1
+        finally:
+            self._put(output, _DONE, force=True)
+
+    def _write(self, source: "queue.Queue[Any]", write: Callable[[AggregatedLeadResult], None]) -> None:
+        pending: Dict[int, AggregatedLeadResult] = {}
+        next_position = 0
+        while True:
+            item = self._get(source)
+            if item is _DONE:
+                break
+            position, result = item
+            pending[position] = result
+            while next_position in pending:
+                write(pending.pop(next_position))
+                next_position += 1
+                self.stats.written += 1
+                self._release_slot()
+        if pending and self.stats.cancelled and not self._stop.is_set():
+            for position in sorted(pending):
+                write(pending.pop(position))
+                self.stats.written += 1
+                self._release_slot()
+        if pending and not self._stop.is_set():
+            raise RuntimeError(f"Pipeline finished with {len(pending)} results out of order")
+
+    def _cancelled(self) -> bool:
+        if self._token is not None and self._token.cancelled:
+            self.stats.cancelled = True
+        return self.stats.cancelled
+
+    # ------------------------------------------------------------------
+    # Queue helpers that give up once another stage has failed
+    def _acquire_slot(self) -> None:
+        while not self._window.acquire(timeout=_POLL_SECONDS):
+            if self._stop.is_set():
+                raise _Stopped
+        with self._lock:
+            self._in_flight += 1
+            self.stats.max_in_flight = max(self.stats.max_in_flight, self._in_flight)
+
+    def _release_slot(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+        self._window.release()
+
+    def _put(self, target: "queue.Queue[Any]", item: Any, *, force: bool = False) -> None:
+        while True:
+            try:
+                target.put(item, timeout=_POLL_SECONDS)
+                return
+            except queue.Full:
+                if self._stop.is_set():
+                    if force:
+                        self._drain(target)
+                        continue
+                    raise _Stopped from None
+
+    def _get(self, source: "queue.Queue[Any]") -> Any:
+        while True:
+            if self._stop.is_set():
+                raise _Stopped
+            try:
+                return source.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                if self._stop.is_set():
+                    raise _Stopped from None
+
+    @staticmethod
+    def _drain(target: "queue.Queue[Any]") -> None:
+        try:
+            while True:
+                target.get_nowait()
+        except queue.Empty:
+            pass
+
+
+__all__ = ["PipelineStats", "VerificationPipeline"]
@@ -0,0 +1,245 @@
+"""Pre-run estimates of scraper calls and wall-clock time, reused for live ETAs."""
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+from .budget import LatencyTracker
+from .config import iter_enabled_scraper_configs
+from .factory import build_result_cache
+from .gating import build_execution_policy
+from .models import LeadInput
+from .result_cache import normalise_query
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class ScraperPlan:
+    """Expected work for one scraper.
+
+    ``max_calls`` counts every lead the cache cannot answer; ``expected_calls``
+    discounts gated scrapers by the chance that cheaper tiers already found
+    what they look for.  ``rate_interval`` is the gap its rate limit enforces
+    between calls and ``pause_seconds`` the delay plus throttle spent on each
+    call.
+    """
+
+    name: str
+    cache_hits: int = 0
+    max_calls: int = 0
+    expected_calls: float = 0.0
+    rate_interval: float = 0.0
+    pause_seconds: float = 0.0
+    gated: bool = False
+    parallel: int = 1
+
+    @property
+    def seconds_per_call(self) -> float:
+        """Lower bound on the time each call adds once several leads share the scraper."""
+
+        return max(self.rate_interval, self.pause_seconds / max(1, self.parallel))
+
+    @property
+    def min_seconds(self) -> float:
+        return self.expected_calls * self.seconds_per_call
+
+
+@dataclass
+class RunPlan:
+    """What a run over a lead file is expected to cost.
+
+    With scrapers running one after another for a single lead at a time the
+    minimum wall time is the sum of the scrapers' minimums; otherwise their
+    work overlaps and the slowest scraper sets the floor.
+    """
+
+    leads: int
+    unique_leads: int
+    scrapers: List[ScraperPlan] = field(default_factory=list)
+    overlapping: bool = False
+
+    @property
+    def duplicates(self) -> int:
+        return self.leads - self.unique_leads
+
+    @property
+    def cache_hits(self) -> int:
+        return sum(scraper.cache_hits for scraper in self.scrapers)
+
+    @property
+    def min_seconds(self) -> float:
+        return self._combine(scraper.min_seconds for scraper in self.scrapers)
+
+    def remaining_seconds(self, completed: int, latency: Optional[LatencyTracker] = None) -> float:
+        """Estimate the seconds left once ``completed`` leads are done.
+
+        Each scraper's remaining calls are priced at the larger of its
+        configured minimum and, when ``latency`` has measured it, its observed
+        time per call shared across the leads running at once.
+        """
+
+        if not self.leads or completed >= self.leads:
+            return 0.0
+        left = 1.0 - completed / self.leads
+        estimates = []
+        for scraper in self.scrapers:
+            per_call = scraper.seconds_per_call
+            observed = latency.latency(scraper.name) if latency is not None else None
+            if observed is not None:
+                per_call = max(per_call, observed / max(1, scraper.parallel))
+            estimates.append(scraper.expected_calls * left * per_call)
+        return self._combine(estimates)
+
+    def _combine(self, values) -> float:
+        values = list(values)
+        if not values:
+            return 0.0
+        return max(values) if self.overlapping else sum(values)
+
+    def describe(self) -> str:
+        lines = [
+            f"Leads: {self.leads} ({self.unique_leads} unique, {self.duplicates} duplicates)",
+            f"Expected cache hits: {self.cache_hits}",
+            "Scraper calls:",
+        ]
+        for scraper in self.scrapers:
+            calls = f"{scraper.max_calls}"
+            if scraper.gated:
+                calls = f"~{scraper.expected_calls:.0f} (at most {scraper.max_calls}, gated)"
+            lines.append(
+                f"  {scraper.name}: {calls} calls, {scraper.cache_hits} cache hits, "
+                f">= {scraper.seconds_per_call:.2f}s per call, >= {format_duration(scraper.min_seconds)}"
+            )
+        lines.append(f"Minimum wall-clock time: {format_duration(self.min_seconds)}")
+        return "\n".join(lines)
+
+
+def format_duration(seconds: float) -> str:
+    seconds = int(round(seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    if hours:
+        return f"{hours}h{minutes:02d}m"
+    if minutes:
+        return f"{minutes}m{seconds:02d}s"
+    return f"{seconds}s"
+
+
+def _pause_seconds(scraper_cfg: Mapping[str, Any]) -> float:
+    """Return ``delay_seconds`` plus any throttle or per-call sleep in the scraper's options."""
+
+    options = scraper_cfg.get("options") or {}
+    nested = options.get("config") if isinstance(options.get("config"), Mapping) else {}
+    throttle = 0.0
+    for source in (scraper_cfg, options, nested):
+        for key in ("throttle_seconds", "rate_limit_seconds"):
+            if source.get(key):
+                throttle = max(throttle, float(source[key]))
+    return float(scraper_cfg.get("delay_seconds", 0) or 0) + throttle
+
+
+def _scraper_name(scraper_cfg: Mapping[str, Any]) -> str:
+    return scraper_cfg.get("name") or str(scraper_cfg.get("class", "scraper")).rpartition(".")[2]
+
+
+def build_run_plan(
+    config: Dict[str, Any],
+    leads: Sequence[LeadInput],
+    *,
+    concurrent: bool = False,
+    lead_concurrency: int = 1,
+    hit_rates: Optional[Mapping[str, float]] = None,
+) -> RunPlan:
+    """Estimate the calls and minimum wall time of verifying ``leads`` with ``config``.
+
+    Cache hits are looked up in the configured ``result_cache`` without
+    changing it.  ``hit_rates`` gives the share of leads each scraper finds
+    something for; a gated scraper (``run_if_missing``, or any scraper after
+    the cheapest tier when ``stop_when`` is set) is expected to run only when
+    every cheaper scraper missed.  Scrapers without a hit rate are assumed
+    to find nothing, so their gated dependents are counted in full.
+    """
+
+    hit_rates = dict(hit_rates or {})
+    queries = [normalise_query(lead) for lead in leads]
+    policy = build_execution_policy(config)
+    cache = None
+    cache_cfg = config.get("result_cache") or {}
+    if cache_cfg.get("path") and Path(cache_cfg["path"]).exists():
+        cache = build_result_cache(config)
+
+    enabled = list(iter_enabled_scraper_configs(config))
+    min_cost = min((policy.policy_for(_scraper_name(cfg)).cost for cfg in enabled), default=0.0) if policy else 0.0
+    plans: List[ScraperPlan] = []
+    try:
+        for scraper_cfg in enabled:
+            name = _scraper_name(scraper_cfg)
+            cache_hits = 0
+            if cache is not None and scraper_cfg.get("cache", True):
+                cache_hits = sum(1 for query in queries if cache.get(name, query) is not None)
+            calls = len(leads) - cache_hits
+            rate = scraper_cfg.get("rate_limit_per_minute")
+            plan = ScraperPlan(
+                name=name,
+                cache_hits=cache_hits,
+                max_calls=calls,
+                expected_calls=float(calls),
+                rate_interval=60.0 / float(rate) if rate else 0.0,
+                pause_seconds=_pause_seconds(scraper_cfg),
+                parallel=max(1, lead_concurrency),
+            )
+            if policy is not None:
+                own = policy.policy_for(name)
+                if own.run_if_missing or (policy.stop_when and own.cost > min_cost):
+                    plan.gated = True
+                    for other in enabled:
+                        other_name = _scraper_name(other)
+                        if policy.policy_for(other_name).cost < own.cost:
+                            plan.expected_calls *= 1.0 - hit_rates.get(other_name, 0.0)
+            plans.append(plan)
+    finally:
+        if cache is not None:
+            cache.close()
+
+    overlapping = concurrent or lead_concurrency > 1
+    return RunPlan(leads=len(leads), unique_leads=len(set(queries)), scrapers=plans, overlapping=overlapping)
+
+
+class EtaReporter:
+    """Log progress with an ETA from a :class:`RunPlan` at most every ``interval`` seconds."""
+
+    def __init__(
+        self,
+        plan: RunPlan,
+        latency: Optional[LatencyTracker] = None,
+        *,
+        interval: float = 30.0,
+        clock=time.monotonic,
+    ) -> None:
+        self.plan = plan
+        self.latency = latency
+        self.interval = interval
+        self._clock = clock
+        self._last: Optional[float] = None
+
+    def update(self, completed: int, total: Optional[int] = None) -> None:
+        """Report ``completed`` leads; usable as an orchestrator ``progress_callback``."""
+
+        total = self.plan.leads if total is None else total
+        now = self._clock()
+        if self._last is not None and now - self._last < self.interval and completed < total:
+            return
+        self._last = now
+        LOGGER.info(
+            "Verified %s/%s leads, about %s left",
+            completed,
+            total,
+            format_duration(self.plan.remaining_seconds(completed, self.latency)),
+        )
+
+
+__all__ = ["EtaReporter", "RunPlan", "ScraperPlan", "build_run_plan", "format_duration"]
@@ -0,0 +1,175 @@
+"""Plan search query variants from most to least selective and learn per-state preferences."""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .models import LeadInput
+
+LOGGER = logging.getLogger(__name__)
+
+VARIANT_NAME_ZIP = "name_zip"
+VARIANT_NAME_CITY_STATE = "name_city_state"
+VARIANT_NAME = "name"
+
+# Most selective first; also used to break ties between learned success rates.
+VARIANT_ORDER = (VARIANT_NAME_ZIP, VARIANT_NAME_CITY_STATE, VARIANT_NAME)
+
+
+@dataclass(frozen=True)
+class QueryVariant:
+    """One way of searching for a lead: the name plus an optional location filter."""
+
+    key: str
+    city: Optional[str] = None
+    state: Optional[str] = None
+    postal_code: Optional[str] = None
+
+    @property
+    def rank(self) -> int:
+        return VARIANT_ORDER.index(self.key)
+
+
+def _clean(value: object) -> Optional[str]:
+    text = str(value or "").strip()
+    return text or None
+
+
+def lead_variants(lead: LeadInput) -> List[QueryVariant]:
+    """Return the variants ``lead`` has data for, most selective first."""
+
+    city = _clean(lead.city)
+    state = _clean(lead.state)
+    postal_code = _clean(lead.metadata.get("zip") or lead.metadata.get("postal_code"))
+
+    variants: List[QueryVariant] = []
+    if postal_code:
+        variants.append(QueryVariant(VARIANT_NAME_ZIP, postal_code=postal_code))
+    if city or state:
+        variants.append(QueryVariant(VARIANT_NAME_CITY_STATE, city=city, state=state))
+    variants.append(QueryVariant(VARIANT_NAME))
+    return variants
+
+
+@dataclass
+class VariantStats:
+    """How often a variant found the lead's expected number of matches."""
+
+    attempts: int = 0
+    hits: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.attempts if self.attempts else 0.0
+
+
+class QueryPlanner:
+    """Order query variants for a lead and decide when to stop searching.
+
+    Variants are tried from most to least selective (name plus zip, name plus
+    city/state, name only) so broad searches only run when narrower ones come
+    back empty.  Outcomes are tallied per state, counting a hit when a
+    variant satisfied the lead's expected matches.  Once every location
+    variant has ``min_samples`` attempts for a state, those are ordered by hit
+    rate instead, with selectivity breaking ties.  The name-only search stays
+    the last resort: it matches almost anyone and is only tried after the
+    others failed, so its hit rate says nothing about which to try first.
+    When ``stats_path`` is set the tallies are loaded from and saved to that
+    JSON file.
+    """
+
+    def __init__(
+        self,
+        *,
+        expected_matches: int = 1,
+        min_samples: int = 5,
+        stats_path: Optional[str | Path] = None,
+    ) -> None:
+        self.expected_matches = max(1, expected_matches)
+        self.min_samples = max(1, min_samples)
+        self.stats_path = Path(stats_path) if stats_path else None
+        self._stats: Dict[str, Dict[str, VariantStats]] = {}
+        self._lock = threading.Lock()
+        if self.stats_path is not None:
+            self._load()
+
+    def plan(self, lead: LeadInput) -> List[QueryVariant]:
+        variants = lead_variants(lead)
+        selective = [variant for variant in variants if variant.key != VARIANT_NAME]
+        with self._lock:
+            learned = self._stats.get(self._state_key(lead), {})
+            if not all(learned.get(variant.key, VariantStats()).attempts >= self.min_samples for variant in selective):
+                return variants
+            ordered = sorted(selective, key=lambda variant: (-learned[variant.key].hit_rate, variant.rank))
+        return ordered + [variant for variant in variants if variant.key == VARIANT_NAME]
+
+    def expected_for(self, lead: LeadInput) -> int:
+        try:
+            return max(1, int(lead.metadata.get("expected_matches") or self.expected_matches))
+        except (TypeError, ValueError):
+            return self.expected_matches
+
+    def is_satisfied(self, lead: LeadInput, matches: int) -> bool:
+        return matches >= self.expected_for(lead)
+
+    def record(self, lead: LeadInput, variant: QueryVariant, matches: int) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(self._state_key(lead), {}).setdefault(variant.key, VariantStats())
+            stats.attempts += 1
+            if self.is_satisfied(lead, matches):
+                stats.hits += 1
+            if self.stats_path is not None:
+                self._save()
+
+    def stats_for(self, state: Optional[str]) -> Dict[str, VariantStats]:
+        with self._lock:
+            return dict(self._stats.get(self._normalise_state(state), {}))
+
+    @classmethod
+    def _state_key(cls, lead: LeadInput) -> str:
+        return cls._normalise_state(lead.state)
+
+    @staticmethod
+    def _normalise_state(state: Optional[str]) -> str:
+        return (state or "").strip().upper() or "*"
+
+    def _load(self) -> None:
+        try:
+            payload = json.loads(self.stats_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError):
+            LOGGER.warning("Ignoring unreadable query planner stats at %s", self.stats_path)
+            return
+        for state, variants in payload.items():
+            self._stats[state] = {
+                key: VariantStats(attempts=int(counts.get("attempts", 0)), hits=int(counts.get("hits", 0)))
+                for key, counts in variants.items()
+                if key in VARIANT_ORDER
+            }
+
+    def _save(self) -> None:
+        payload = {
+            state: {key: {"attempts": stats.attempts, "hits": stats.hits} for key, stats in variants.items()}
+            for state, variants in self._stats.items()
+        }
+        self.stats_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.stats_path.with_name(f"{self.stats_path.name}.{os.getpid()}.tmp")
+        temp_path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+        os.replace(temp_path, self.stats_path)
+
+
+__all__ = [
+    "QueryPlanner",
+    "QueryVariant",
+    "VARIANT_NAME",
+    "VARIANT_NAME_CITY_STATE",
+    "VARIANT_NAME_ZIP",
+    "VariantStats",
+    "lead_variants",
+]
@@ -4,8 +4,10 @@ from __future__ import annotations
 import threading
 import time
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional, Sequence
 
+from . import cancellation
+from .batching import supports_verify_many, verify_each
 from .models import LeadInput, LeadVerification
 
 
@@ -30,7 +32,7 @@ class RateLimiter:
         with self._lock:
             now = time.monotonic()
             if now < self._next_available:
-                time.sleep(self._next_available - now)
+                cancellation.sleep(self._next_available - now)
                 now = time.monotonic()
             self._next_available = now + self._interval
 
@@ -63,8 +65,24 @@ class RateLimitedScraper:
         if result.source != self.name:
             result.source = self.name
         if self._delay_policy.delay_seconds > 0:
-            time.sleep(self._delay_policy.delay_seconds)
+            cancellation.sleep(self._delay_policy.delay_seconds)
         return result
 
+    @property
+    def supports_verify_many(self) -> bool:
+        return supports_verify_many(self._scraper)
+
+    def verify_many(self, leads: Sequence[LeadInput]) -> List[LeadVerification]:
+        """Verify ``leads`` with one batched call, counted once for rate limiting and delay."""
+
+        self._rate_limiter.acquire()
+        results = verify_each(self._scraper, leads)
+        for result in results:
+            if result.source != self.name:
+                result.source = self.name
+        if self._delay_policy.delay_seconds > 0:
+            cancellation.sleep(self._delay_policy.delay_seconds)
+        return results
+
     def __getattr__(self, item):  # pragma: no cover - simple delegation
         return getattr(self._scraper, item)
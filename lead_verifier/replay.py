@@ -0,0 +1,237 @@
+"""Local stand-in for the people-search sites used to benchmark scrapers offline."""
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+from .page_cache import PageCache
+
+LOGGER = logging.getLogger(__name__)
+
+SITE_FAST_PEOPLE_SEARCH = "fast_people_search"
+SITE_TRUE_PEOPLE_SEARCH = "true_people_search"
+
+OUTCOME_RESULT = "result"
+OUTCOME_NOT_FOUND = "not_found"
+OUTCOME_CAPTCHA = "captcha"
+OUTCOME_ERROR = "error"
+
+# Live hosts used to look up recorded pages in a :class:`PageCache`.
+LIVE_BASE_URLS = {
+    SITE_FAST_PEOPLE_SEARCH: "https://www.fastpeoplesearch.com",
+    SITE_TRUE_PEOPLE_SEARCH: "https://www.truepeoplesearch.com",
+}
+
+DEFAULT_PAGES: Dict[str, Dict[str, List[str]]] = {
+    SITE_FAST_PEOPLE_SEARCH: {
+        OUTCOME_RESULT: [
+            "<html><head><title>Jane Doe</title></head><body>"
+            "<div class='card result'><h3>Jane Doe, Age 40</h3>"
+            "<a href='tel:5551234567'>(555) 123-4567</a>"
+            "<a href='tel:5557654321'>(555) 765-4321</a></div></body></html>"
+        ],
+        OUTCOME_NOT_FOUND: [
+            "<html><head><title>No results</title></head><body>"
+            "<div class='no-results'>We could not find any records for that search.</div></body></html>"
+        ],
+        OUTCOME_CAPTCHA: [
+            "<html><head><title>Just a moment...</title></head><body>"
+            "<iframe src='https://challenges.example/captcha'></iframe></body></html>"
+        ],
+    },
+    SITE_TRUE_PEOPLE_SEARCH: {
+        OUTCOME_RESULT: [
+            "<html><body><div class='content-center'><div class='row pl-1 record-count'>"
+            "<div>We found 1 record</div></div></div>"
+            "<div class='card-summary'><div class='h5'>Email Addresses</div>"
+            "<div>jane@example.com</div><div>jane.doe@example.net</div></div></body></html>"
+        ],
+        OUTCOME_NOT_FOUND: [
+            "<html><body><div class='content-center'><div class='row pl-1 record-count'>"
+            "<div>We could not find any records for that search criteria.</div></div></div></body></html>"
+        ],
+        OUTCOME_CAPTCHA: [
+            "<html><body><iframe src='https://challenges.example/captcha'></iframe></body></html>"
+        ],
+    },
+}
+
+
+@dataclass
+class ReplayProfile:
+    """Outcome distribution and latency injected by :class:`ReplayServer`."""
+
+    result_weight: float = 0.6
+    not_found_weight: float = 0.3
+    captcha_weight: float = 0.05
+    error_weight: float = 0.05
+    latency_seconds: Tuple[float, float] = (0.05, 0.25)
+    error_status: int = 503
+    seed: Optional[int] = None
+
+    def weights(self) -> Dict[str, float]:
+        return {
+            OUTCOME_RESULT: self.result_weight,
+            OUTCOME_NOT_FOUND: self.not_found_weight,
+            OUTCOME_CAPTCHA: self.captcha_weight,
+            OUTCOME_ERROR: self.error_weight,
+        }
+
+
+def load_replay_pages(directory: str | Path) -> Dict[str, Dict[str, List[str]]]:
+    """Load recorded pages laid out as ``<site>/<outcome>/*.html``."""
+
+    root = Path(directory)
+    pages: Dict[str, Dict[str, List[str]]] = {}
+    for site in (SITE_FAST_PEOPLE_SEARCH, SITE_TRUE_PEOPLE_SEARCH):
+        for outcome in (OUTCOME_RESULT, OUTCOME_NOT_FOUND, OUTCOME_CAPTCHA):
+            files = sorted((root / site / outcome).glob("*.html"))
+            if files:
+                pages.setdefault(site, {})[outcome] = [
+                    path.read_text(encoding="utf-8", errors="replace") for path in files
+                ]
+    return pages
+
+
+class ReplayServer:
+    """HTTP server answering FastPeopleSearch and TruePeopleSearch URL patterns.
+
+    Each request is assigned an outcome drawn from :class:`ReplayProfile` and
+    answered after a random delay in ``latency_seconds``.  Result outcomes are
+    served from ``page_cache`` when it holds a recording of the equivalent live
+    URL, otherwise from the recorded or built-in page sets.
+    """
+
+    def __init__(
+        self,
+        *,
+        profile: Optional[ReplayProfile] = None,
+        pages: Optional[Mapping[str, Mapping[str, Sequence[str]]]] = None,
+        page_cache: Optional[PageCache] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.profile = profile or ReplayProfile()
+        self._pages: Dict[str, Dict[str, List[str]]] = {
+            site: {outcome: list(bodies) for outcome, bodies in outcomes.items()}
+            for site, outcomes in DEFAULT_PAGES.items()
+        }
+        for site, outcomes in (pages or {}).items():
+            for outcome, bodies in outcomes.items():
+                if bodies:
+                    self._pages.setdefault(site, {})[outcome] = list(bodies)
+        self._page_cache = page_cache
+        self._random = random.Random(self.profile.seed)
+        self._lock = threading.Lock()
+        self.stats: Counter = Counter()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "ReplayServer":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, name="replay-server", daemon=True)
+            self._thread.start()
+            LOGGER.info("Replay server listening on %s", self.base_url)
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> "ReplayServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, exc_tb) -> None:
+        self.stop()
+
+    # ------------------------------------------------------------------
+    def respond(self, path: str) -> Tuple[int, str]:
+        """Return the status code and body for a request path."""
+
+        site = self._site_for(path)
+        if site is None:
+            return 404, "<html><body>Not found</body></html>"
+
+        with self._lock:
+            outcome = self._choose_outcome()
+            low, high = self.profile.latency_seconds
+            delay = self._random.uniform(low, high) if high > low else max(low, 0.0)
+            body = None
+            if outcome == OUTCOME_RESULT:
+                body = self._recorded_page(site, path)
+            if body is None and outcome != OUTCOME_ERROR:
+                body = self._random.choice(self._pages[site][outcome])
+            self.stats[(site, outcome)] += 1
+
+        if delay > 0:
+            time.sleep(delay)
+        if outcome == OUTCOME_ERROR:
+            return self.profile.error_status, "<html><body>Service unavailable</body></html>"
+        return 200, body
+
+    def _site_for(self, path: str) -> Optional[str]:
+        route = urlsplit(path).path
+        if route.startswith("/name/"):
+            return SITE_FAST_PEOPLE_SEARCH
+        if route.rstrip("/") == "/results":
+            return SITE_TRUE_PEOPLE_SEARCH
+        return None
+
+    def _choose_outcome(self) -> str:
+        weights = {outcome: weight for outcome, weight in self.profile.weights().items() if weight > 0}
+        if not weights:
+            return OUTCOME_RESULT
+        outcomes = list(weights)
+        return self._random.choices(outcomes, weights=[weights[outcome] for outcome in outcomes])[0]
+
+    def _recorded_page(self, site: str, path: str) -> Optional[str]:
+        if self._page_cache is None:
+            return None
+        cached = self._page_cache.load(f"{LIVE_BASE_URLS[site]}{path}")
+        return cached.html if cached is not None else None
+
+    def _handler_class(self):
+        server = self
+
+        class _ReplayHandler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802 - http.server naming
+                status, body = server.respond(self.path)
+                payload = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format: str, *args) -> None:  # noqa: A002 - signature from base class
+                LOGGER.debug("replay %s - %s", self.address_string(), format % args)
+
+        return _ReplayHandler
+
+
+__all__ = [
+    "ReplayProfile",
+    "ReplayServer",
+    "load_replay_pages",
+    "OUTCOME_RESULT",
+    "OUTCOME_NOT_FOUND",
+    "OUTCOME_CAPTCHA",
+    "OUTCOME_ERROR",
+]
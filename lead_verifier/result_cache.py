@@ -0,0 +1,182 @@
+"""Persistent cache of scraper outcomes keyed by scraper and normalised query."""
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+from .batching import supports_verify_many, verify_each
+from .models import LeadInput, LeadVerification
+from .serialization import verification_from_dict, verification_to_dict
+
+LOGGER = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    scraper TEXT NOT NULL,
+    query TEXT NOT NULL,
+    found INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (scraper, query)
+)
+"""
+
+
+def normalise_query(lead: LeadInput) -> str:
+    """Return a stable lookup key built from the lead's name and location."""
+
+    name = lead.name or " ".join(filter(None, [lead.first_name, lead.last_name]))
+    postal_code = lead.metadata.get("zip") or lead.metadata.get("postal_code")
+    parts = [name, lead.city, lead.state, postal_code]
+    return "|".join(" ".join(str(part or "").lower().split()) for part in parts)
+
+
+def is_not_found(verification: LeadVerification) -> bool:
+    """Return ``True`` when a scraper reported that the search matched nobody."""
+
+    return bool(verification.raw_data and verification.raw_data.get("not_found"))
+
+
+def _has_errors(verification: LeadVerification) -> bool:
+    raw_data = verification.raw_data or {}
+    return bool(raw_data.get("error") or raw_data.get("errors") or raw_data.get("deferred"))
+
+
+@dataclass
+class CachedOutcome:
+    """A stored scraper outcome."""
+
+    found: bool
+    verification: LeadVerification
+    stored_at: float
+
+
+class ResultCache:
+    """SQLite store of positive and negative outcomes with independent TTLs.
+
+    ``negative_ttl_seconds`` controls how long not-found outcomes are reused;
+    ``positive_ttl_seconds`` does the same for results with contacts and is
+    disabled (``None``) by default so found leads are always refreshed.
+    Outcomes carrying errors are never stored.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        negative_ttl_seconds: Optional[float] = 30 * 24 * 3600,
+        positive_ttl_seconds: Optional[float] = None,
+    ) -> None:
+        self.path = Path(path)
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.positive_ttl_seconds = positive_ttl_seconds
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._connection:
+            self._connection.execute(_SCHEMA)
+
+    def get(self, scraper: str, query: str) -> Optional[CachedOutcome]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT found, stored_at, payload FROM results WHERE scraper = ? AND query = ?",
+                (scraper, query),
+            ).fetchone()
+        if row is None:
+            return None
+        found, stored_at, payload = bool(row[0]), float(row[1]), row[2]
+        ttl = self.positive_ttl_seconds if found else self.negative_ttl_seconds
+        if ttl is None or time.time() - stored_at > ttl:
+            return None
+        return CachedOutcome(found=found, verification=verification_from_dict(json.loads(payload)), stored_at=stored_at)
+
+    def put(self, scraper: str, query: str, verification: LeadVerification) -> bool:
+        """Store ``verification`` if its outcome is cacheable; return whether it was stored."""
+
+        if _has_errors(verification):
+            return False
+        if is_not_found(verification):
+            found = False
+            ttl = self.negative_ttl_seconds
+        elif verification.contacts:
+            found = True
+            ttl = self.positive_ttl_seconds
+        else:
+            return False
+        if ttl is None:
+            return False
+        payload = json.dumps(verification_to_dict(verification), default=str)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO results (scraper, query, found, stored_at, payload) VALUES (?, ?, ?, ?, ?)",
+                (scraper, query, int(found), time.time(), payload),
+            )
+        return True
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class CachedScraper:
+    """Wrapper that answers repeat queries from a :class:`ResultCache`.
+
+    Cache hits bypass the wrapped scraper entirely, including any rate limiting
+    applied by an inner :class:`~lead_verifier.rate_limit.RateLimitedScraper`.
+    """
+
+    def __init__(self, scraper, cache: ResultCache) -> None:
+        self._scraper = scraper
+        self._cache = cache
+
+    @property
+    def name(self) -> str:  # pragma: no cover - delegation
+        return getattr(self._scraper, "name", self._scraper.__class__.__name__)
+
+    def verify(self, lead: LeadInput) -> LeadVerification:
+        query = normalise_query(lead)
+        cached = self._lookup(query)
+        if cached is not None:
+            return cached
+
+        verification = self._scraper.verify(lead)
+        self._cache.put(self.name, query, verification)
+        return verification
+
+    @property
+    def supports_verify_many(self) -> bool:
+        return supports_verify_many(self._scraper)
+
+    def verify_many(self, leads: Sequence[LeadInput]) -> List[LeadVerification]:
+        """Answer cache hits directly and send only the misses to the wrapped scraper, as one batch."""
+
+        queries = [normalise_query(lead) for lead in leads]
+        results: List[Optional[LeadVerification]] = [self._lookup(query) for query in queries]
+        misses = [index for index, result in enumerate(results) if result is None]
+        if misses:
+            for index, verification in zip(misses, verify_each(self._scraper, [leads[index] for index in misses])):
+                self._cache.put(self.name, queries[index], verification)
+                results[index] = verification
+        return [result for result in results if result is not None]
+
+    def _lookup(self, query: str) -> Optional[LeadVerification]:
+        cached = self._cache.get(self.name, query)
+        if cached is None:
+            return None
+        LOGGER.debug("Cache hit (%s) for %s on %s", "found" if cached.found else "not found", query, self.name)
+        verification = cached.verification
+        verification.source = self.name
+        verification.raw_data = {**(verification.raw_data or {}), "cached_at": cached.stored_at}
+        return verification
+
+    def __getattr__(self, item):  # pragma: no cover - simple delegation
+        return getattr(self._scraper, item)
+
+
+__all__ = ["CachedOutcome", "CachedScraper", "ResultCache", "is_not_found", "normalise_query"]
@@ -0,0 +1,273 @@
+"""Priority scheduling with aging and deadlines for queued leads."""
+from __future__ import annotations
+
+import heapq
+import itertools
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Generic, Hashable, List, Mapping, Optional, Tuple, TypeVar
+
+_T = TypeVar("_T")
+
+PRIORITY_NAMES = {"bulk": -10, "low": -10, "normal": 0, "high": 10, "urgent": 20}
+
+
+def parse_priority(value: Any, default: int = 0) -> int:
+    """Return an integer priority from a number or one of :data:`PRIORITY_NAMES`."""
+
+    if value is None or value == "":
+        return default
+    if isinstance(value, str):
+        name = value.strip().lower()
+        if name in PRIORITY_NAMES:
+            return PRIORITY_NAMES[name]
+        try:
+            return int(float(name))
+        except ValueError:
+            raise ValueError(f"Unknown priority '{value}'. Use a number or one of {sorted(PRIORITY_NAMES)}") from None
+    return int(value)
+
+
+def priority_weight(priority: int) -> float:
+    """Return the fair-share weight of a job: every 10 priority levels double its share."""
+
+    return 2.0 ** (priority / 10.0)
+
+
+def estimate_eta(completed: int, total: int, started_at: Optional[float], *, now: Optional[float] = None) -> Optional[float]:
+    """Return the seconds left at the job's observed rate, or ``None`` before the first result."""
+
+    if completed >= total:
+        return 0.0
+    if not completed or started_at is None:
+        return None
+    elapsed = (time.time() if now is None else now) - started_at
+    return max(0.0, elapsed / completed * (total - completed))
+
+
+def parse_deadline(options: Mapping[str, Any], *, now: Optional[float] = None) -> Optional[float]:
+    """Return an absolute deadline from ``deadline`` (epoch seconds) or ``deadline_seconds`` (relative)."""
+
+    if options.get("deadline") not in (None, ""):
+        return float(options["deadline"])
+    if options.get("deadline_seconds") not in (None, ""):
+        return (time.time() if now is None else now) + float(options["deadline_seconds"])
+    return None
+
+
+@dataclass(order=True)
+class _Entry:
+    key: Tuple[float, int]
+    item: Any = field(compare=False)
+    taken: bool = field(compare=False, default=False)
+
+
+class PriorityScheduler(Generic[_T]):
+    """Thread-safe queue ordered by priority with aging, plus deadline pre-emption.
+
+    Each priority level is worth ``aging_seconds`` of waiting: an item is
+    ranked as if it had been queued ``priority * aging_seconds`` earlier, so
+    high-priority work jumps ahead of queued bulk work while bulk items that
+    have waited long enough still get their turn.  An item whose deadline is
+    within ``deadline_slack_seconds`` is served before everything else,
+    earliest deadline first.  :meth:`get` mirrors :class:`queue.Queue`.
+    """
+
+    def __init__(
+        self,
+        *,
+        aging_seconds: float = 60.0,
+        deadline_slack_seconds: float = 60.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.aging_seconds = aging_seconds
+        self.deadline_slack_seconds = deadline_slack_seconds
+        self._clock = clock
+        self._ranked: List[_Entry] = []
+        self._deadlines: List[Tuple[float, int, _Entry]] = []
+        self._sequence = itertools.count()
+        self._size = 0
+        self._condition = threading.Condition()
+
+    def put(self, item: _T, *, priority: int = 0, deadline: Optional[float] = None) -> None:
+        sequence = next(self._sequence)
+        entry = _Entry(key=(self._clock() - priority * self.aging_seconds, sequence), item=item)
+        with self._condition:
+            heapq.heappush(self._ranked, entry)
+            if deadline is not None:
+                heapq.heappush(self._deadlines, (deadline, sequence, entry))
+            self._size += 1
+            self._condition.notify()
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> _T:
+        with self._condition:
+            if not block:
+                if not self._size:
+                    raise queue.Empty
+            elif not self._condition.wait_for(lambda: self._size > 0, timeout):
+                raise queue.Empty
+            entry = self._pop_due_deadline() or self._pop_ranked()
+            entry.taken = True
+            self._size -= 1
+            return entry.item
+
+    def get_nowait(self) -> _T:
+        return self.get(block=False)
+
+    def qsize(self) -> int:
+        with self._condition:
+            return self._size
+
+    __len__ = qsize
+
+    def next_deadline(self) -> Optional[float]:
+        """Return the earliest deadline still queued, if any."""
+
+        with self._condition:
+            self._drop_taken_deadlines()
+            return self._deadlines[0][0] if self._deadlines else None
+
+    def _drop_taken_deadlines(self) -> None:
+        while self._deadlines and self._deadlines[0][2].taken:
+            heapq.heappop(self._deadlines)
+
+    def _pop_due_deadline(self) -> Optional[_Entry]:
+        self._drop_taken_deadlines()
+        if not self._deadlines or self._deadlines[0][0] > self._clock() + self.deadline_slack_seconds:
+            return None
+        return heapq.heappop(self._deadlines)[2]
+
+    def _pop_ranked(self) -> _Entry:
+        while True:
+            entry = heapq.heappop(self._ranked)
+            if not entry.taken:
+                return entry
+
+
+@dataclass
+class _Flow:
+    queue: PriorityScheduler
+    weight: float
+    order: int
+    finish: float = 0.0
+
+
+class FairShareScheduler(Generic[_T]):
+    """Weighted fair queue of items grouped into flows, typically one flow per job.
+
+    Flows take turns in proportion to their ``weight`` (start-time fair
+    queuing), so a small job is not stuck behind a large back-fill submitted
+    before it; a flow that goes idle and comes back does not get credit for
+    the time it was away.  Within a flow items are ordered by a
+    :class:`PriorityScheduler`, and an item whose deadline is within
+    ``deadline_slack_seconds`` is served first regardless of its flow.
+    :meth:`get` mirrors :class:`queue.Queue`.
+    """
+
+    def __init__(
+        self,
+        *,
+        aging_seconds: float = 60.0,
+        deadline_slack_seconds: float = 60.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.aging_seconds = aging_seconds
+        self.deadline_slack_seconds = deadline_slack_seconds
+        self._clock = clock
+        self._flows: Dict[Hashable, _Flow] = {}
+        self._orders = itertools.count()
+        self._virtual_time = 0.0
+        self._size = 0
+        self._condition = threading.Condition()
+
+    def put(
+        self,
+        item: _T,
+        *,
+        flow: Hashable = None,
+        weight: float = 1.0,
+        priority: int = 0,
+        deadline: Optional[float] = None,
+    ) -> None:
+        """Queue ``item`` on ``flow``; ``weight`` applies when the flow has nothing queued yet."""
+
+        with self._condition:
+            state = self._flows.get(flow)
+            if state is None:
+                state = self._flows[flow] = _Flow(
+                    queue=PriorityScheduler(
+                        aging_seconds=self.aging_seconds,
+                        deadline_slack_seconds=self.deadline_slack_seconds,
+                        clock=self._clock,
+                    ),
+                    weight=max(weight, 1e-6),
+                    order=next(self._orders),
+                    finish=self._virtual_time,
+                )
+            state.queue.put(item, priority=priority, deadline=deadline)
+            self._size += 1
+            self._condition.notify()
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> _T:
+        with self._condition:
+            if not block:
+                if not self._size:
+                    raise queue.Empty
+            elif not self._condition.wait_for(lambda: self._size > 0, timeout):
+                raise queue.Empty
+            key, state = self._due_flow() or self._fair_flow()
+            start = max(self._virtual_time, state.finish)
+            self._virtual_time = start
+            state.finish = start + 1.0 / state.weight
+            item = state.queue.get_nowait()
+            self._size -= 1
+            if not len(state.queue):
+                del self._flows[key]
+            return item
+
+    def get_nowait(self) -> _T:
+        return self.get(block=False)
+
+    def qsize(self, flow: Hashable = None) -> int:
+        """Return the number of queued items, or only those of ``flow`` when given."""
+
+        with self._condition:
+            if flow is None:
+                return self._size
+            state = self._flows.get(flow)
+            return len(state.queue) if state is not None else 0
+
+    def __len__(self) -> int:
+        return self.qsize()
+
+    def _due_flow(self) -> Optional[Tuple[Hashable, _Flow]]:
+        horizon = self._clock() + self.deadline_slack_seconds
+        due = [
+            (deadline, state.order, key)
+            for key, state in self._flows.items()
+            for deadline in [state.queue.next_deadline()]
+            if deadline is not None and deadline <= horizon
+        ]
+        if not due:
+            return None
+        key = min(due)[2]
+        return key, self._flows[key]
+
+    def _fair_flow(self) -> Tuple[Hashable, _Flow]:
+        return min(
+            self._flows.items(),
+            key=lambda pair: (max(self._virtual_time, pair[1].finish), pair[1].order),
+        )
+
+
+__all__ = [
+    "FairShareScheduler",
+    "PRIORITY_NAMES",
+    "PriorityScheduler",
+    "estimate_eta",
+    "parse_deadline",
+    "parse_priority",
+    "priority_weight",
+]
@@ -1,9 +1,11 @@
 """Common utilities shared by browser based scrapers."""
 from __future__ import annotations
 
-import time
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Optional
+
+from .. import cancellation
+from ..page_cache import PageCache
 
 
 @dataclass
@@ -13,6 +15,18 @@ class BrowserScraperConfig:
     headless: bool = True
     throttle_seconds: float = 5.0
     navigation_timeout: float = 30.0
+    page_cache_dir: Optional[str] = None
+    reparse: bool = False
+
+
+def parse_html(html: str) -> Any:
+    """Return a BeautifulSoup tree for cached page HTML."""
+
+    try:
+        from bs4 import BeautifulSoup  # type: ignore
+    except ImportError as exc:  # pragma: no cover - dependency optional
+        raise RuntimeError("Re-parsing cached pages requires the 'beautifulsoup4' package") from exc
+    return BeautifulSoup(html, "html.parser")
 
 
 class BrowserScraper:
@@ -20,7 +34,8 @@ class BrowserScraper:
 
     def __init__(self, config: Optional[BrowserScraperConfig] = None) -> None:
         self.config = config or BrowserScraperConfig()
+        self.page_cache = PageCache(self.config.page_cache_dir) if self.config.page_cache_dir else None
 
     def _apply_throttle(self) -> None:
         if self.config.throttle_seconds > 0:
-            time.sleep(self.config.throttle_seconds)
+            cancellation.sleep(self.config.throttle_seconds)
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import contextlib
 import logging
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import asdict, dataclass
-from typing import Callable, Iterable, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from urllib.parse import quote_plus
 
+from .. import cancellation
+from ..cancellation import Cancelled
 from ..models import (
     ContactDetail,
     LeadInput,
@@ -15,6 +20,10 @@ from ..models import (
     PhoneNumberResult,
     phone_results_to_contacts,
 )
+from ..page_cache import PageCache
+from ..query_planner import QueryPlanner, QueryVariant
+from .base import parse_html
+from .recycling import RecyclePolicy, RecycleTracker, process_tree_rss_mb
 
 try:  # pragma: no cover - import guard for optional dependency
     from selenium import webdriver
@@ -23,7 +32,6 @@ try:  # pragma: no cover - import guard for optional dependency
     from selenium.webdriver.chrome.service import Service
     from selenium.webdriver.common.by import By
     from selenium.webdriver.remote.webdriver import WebDriver
-    from selenium.webdriver.support import expected_conditions as EC
     from selenium.webdriver.support.ui import WebDriverWait
 except ImportError:  # pragma: no cover - handled during runtime
     webdriver = None  # type: ignore
@@ -32,11 +40,15 @@ except ImportError:  # pragma: no cover - handled during runtime
     By = None  # type: ignore
     WebDriver = object  # type: ignore
     WebDriverWait = None  # type: ignore
-    EC = None  # type: ignore
     TimeoutException = Exception  # type: ignore
 
 LOGGER = logging.getLogger(__name__)
 
+PAGE_STATE_RESULTS = "results"
+PAGE_STATE_NOT_FOUND = "not_found"
+PAGE_STATE_BLOCKED = "blocked"
+PAGE_STATE_TIMEOUT = "timeout"
+
 
 @dataclass
 class FastPeopleSearchConfig:
@@ -50,6 +62,43 @@ class FastPeopleSearchConfig:
     implicit_wait_seconds: float = 5.0
     wait_timeout_seconds: float = 15.0
     rate_limit_seconds: float = 0.0
+    page_cache_dir: Optional[str] = None
+    reparse: bool = False
+    base_url: Optional[str] = None
+    plan_queries: bool = False
+    expected_matches: int = 1
+    query_stats_path: Optional[str] = None
+    recycle_after_navigations: int = 0
+    recycle_rss_mb: float = 0.0
+    recycle_slow_load_seconds: float = 0.0
+    recycle_after_slow_loads: int = 3
+
+
+@dataclass
+class LookupStats:
+    """Counters describing optional element lookups and the time lost on misses."""
+
+    lookups: int = 0
+    failures: int = 0
+    failed_seconds: float = 0.0
+
+    def record(self, elapsed: float, *, failed: bool) -> None:
+        self.lookups += 1
+        if failed:
+            self.failures += 1
+            self.failed_seconds += elapsed
+
+    def merge(self, other: "LookupStats") -> None:
+        self.lookups += other.lookups
+        self.failures += other.failures
+        self.failed_seconds += other.failed_seconds
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "lookups": self.lookups,
+            "failures": self.failures,
+            "failed_seconds": round(self.failed_seconds, 4),
+        }
 
 
 class FastPeopleSearchScraper:
@@ -57,10 +106,22 @@ class FastPeopleSearchScraper:
 
     name = "fast_people_search"
     BASE_URL = "https://www.fastpeoplesearch.com"
+    RESULT_SELECTOR = "a[href^='tel:']"
+    NOT_FOUND_MARKERS = (
+        "We could not find any records",
+        "No results found",
+        "did not return any results",
+    )
+    NOT_FOUND_XPATH = "//*[" + " or ".join(f"contains(text(), '{marker}')" for marker in NOT_FOUND_MARKERS) + "]"
+    BLOCK_SELECTOR = (
+        "iframe[src*='captcha'], iframe[src*='challenge'], #challenge-form, "
+        "div.g-recaptcha, div.h-captcha, div.cf-browser-verification"
+    )
+    BLOCK_TITLES = ("access denied", "attention required", "just a moment")
 
     def __init__(
         self,
-        config: Optional[FastPeopleSearchConfig] = None,
+        config: Optional[FastPeopleSearchConfig | Dict[str, Any]] = None,
         *,
         driver_factory: Optional[Callable[[], WebDriver]] = None,
         rate_limiter: Optional[Callable[[], None]] = None,
@@ -70,10 +131,32 @@ class FastPeopleSearchScraper:
                 "Selenium is required to use FastPeopleSearchScraper. Install with 'pip install selenium'."
             )
 
+        if isinstance(config, dict):
+            config = FastPeopleSearchConfig(**config)
         self.config = config or FastPeopleSearchConfig()
+        if self.config.base_url:
+            self.BASE_URL = self.config.base_url.rstrip("/")
+        self.page_cache = PageCache(self.config.page_cache_dir) if self.config.page_cache_dir else None
+        self.query_planner = (
+            QueryPlanner(expected_matches=self.config.expected_matches, stats_path=self.config.query_stats_path)
+            if self.config.plan_queries
+            else None
+        )
         self._driver: Optional[WebDriver] = None
+        self._driver_lock = threading.Lock()
+        self.recycle_policy = RecyclePolicy(
+            max_navigations=self.config.recycle_after_navigations,
+            max_rss_mb=self.config.recycle_rss_mb,
+            slow_load_seconds=self.config.recycle_slow_load_seconds,
+            max_slow_loads=self.config.recycle_after_slow_loads,
+        )
+        self._recycle_tracker = RecycleTracker(self.recycle_policy, rss_reader=self._driver_rss_mb)
+        self._recycle_executor: Optional[ThreadPoolExecutor] = None
+        self._replacement: Optional[Future] = None
+        self.recycle_count = 0
         self._driver_factory = driver_factory
         self._rate_limiter = rate_limiter or self._default_rate_limiter
+        self.lookup_stats = LookupStats()
 
     def __enter__(self) -> "FastPeopleSearchScraper":
         self._ensure_driver()
@@ -82,18 +165,87 @@ class FastPeopleSearchScraper:
     def __exit__(self, exc_type, exc, exc_tb) -> None:
         self.close()
 
+    def warm_up(self) -> None:
+        """Start Chrome ahead of the first lookup."""
+
+        if self.config.reparse:
+            return
+        self._ensure_driver()
+
     def _ensure_driver(self) -> WebDriver:
-        if self._driver is None:
-            if self._driver_factory is not None:
-                self._driver = self._driver_factory()
-            else:
-                options = self._build_options()
-                service = Service(executable_path=self.config.driver_path) if self.config.driver_path else Service()
-                self._driver = webdriver.Chrome(service=service, options=options)
-            implicit_wait = max(self.config.implicit_wait_seconds, 0.0)
+        with self._driver_lock:
+            self._swap_in_replacement()
+            if self._driver is None:
+                self._driver = self._create_driver()
+            return self._driver
+
+    def _create_driver(self) -> WebDriver:
+        if self._driver_factory is not None:
+            driver = self._driver_factory()
+        else:
+            options = self._build_options()
+            service = Service(executable_path=self.config.driver_path) if self.config.driver_path else Service()
+            driver = webdriver.Chrome(service=service, options=options)
+        implicit_wait = max(self.config.implicit_wait_seconds, 0.0)
+        if implicit_wait:
+            driver.implicitly_wait(implicit_wait)
+        return driver
+
+    # ------------------------------------------------------------------
+    # Driver recycling
+    def _schedule_replacement(self, reason: str) -> None:
+        """Start a replacement driver in the background; it is swapped in once ready."""
+
+        with self._driver_lock:
+            if self._replacement is not None:
+                return
+            LOGGER.info("Recycling Chrome after %s", reason)
+            if self._recycle_executor is None:
+                self._recycle_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="fps-recycle")
+            self._replacement = self._recycle_executor.submit(self._create_driver)
+
+    def _swap_in_replacement(self) -> None:
+        """Promote a warmed replacement driver and drain the old one (lock held)."""
+
+        future = self._replacement
+        if future is None or not future.done():
+            return
+        self._replacement = None
+        try:
+            replacement = future.result()
+        except Exception:  # pragma: no cover - keep the current driver and retry later
+            LOGGER.warning("Failed to start replacement Chrome; keeping the current instance", exc_info=True)
+            return
+        previous, self._driver = self._driver, replacement
+        self._recycle_tracker.reset()
+        self.recycle_count += 1
+        if previous is not None and self._recycle_executor is not None:
+            self._recycle_executor.submit(self._quit_driver, previous)
+
+    @staticmethod
+    def _quit_driver(driver: WebDriver) -> None:
+        try:
+            driver.quit()
+        except Exception:  # pragma: no cover - best effort cleanup
+            LOGGER.debug("Error while quitting recycled Chrome instance", exc_info=True)
+
+    def _driver_rss_mb(self) -> Optional[float]:
+        process = getattr(getattr(self._driver, "service", None), "process", None)
+        pid = getattr(process, "pid", None)
+        return process_tree_rss_mb(pid) if pid else None
+
+    @contextlib.contextmanager
+    def _implicit_wait_suspended(self, driver: WebDriver) -> Iterator[None]:
+        """Disable the driver's implicit wait so missing optional elements fail fast."""
+
+        implicit_wait = max(self.config.implicit_wait_seconds, 0.0)
+        if implicit_wait:
+            driver.implicitly_wait(0)
+        try:
+            yield
+        finally:
             if implicit_wait:
-                self._driver.implicitly_wait(implicit_wait)
-        return self._driver
+                driver.implicitly_wait(implicit_wait)
 
     def _build_options(self) -> ChromeOptions:
         options = ChromeOptions()
@@ -112,88 +264,298 @@ class FastPeopleSearchScraper:
         return options
 
     def close(self) -> None:
+        with self._driver_lock:
+            replacement, self._replacement = self._replacement, None
+            executor, self._recycle_executor = self._recycle_executor, None
+        if replacement is not None:
+            with contextlib.suppress(Exception):
+                self._quit_driver(replacement.result())
+        if executor is not None:
+            executor.shutdown(wait=True)
         if self._driver is not None:
             LOGGER.debug("Closing Selenium driver")
             self._driver.quit()
             self._driver = None
 
     def verify(self, lead: LeadInput) -> LeadVerification:
+        if self.config.reparse:
+            return self.reparse(lead)
+
         driver = self._ensure_driver()
+        if self.query_planner is not None:
+            return self._verify_planned(driver, lead)
+
+        search_url = self._search_url_or_raise(lead)
+        page_state, phones, errors, lookup_stats = self._search(driver, lead, search_url)
+        return self._build_verification(
+            search_url,
+            phones,
+            errors,
+            page_state=page_state,
+            lookup_stats=lookup_stats.as_dict(),
+        )
+
+    def _verify_planned(self, driver: WebDriver, lead: LeadInput) -> LeadVerification:
+        """Search each planned query variant until enough phone numbers are found.
+
+        The variant with the most matches is reported.  Blocked, timed out, or
+        failed searches end the plan early and are not counted towards the
+        planner's per-state statistics.
+        """
+
+        assert self.query_planner is not None
+        lookup_stats = LookupStats()
+        attempts: List[Dict[str, Any]] = []
+        best: Optional[Tuple[QueryVariant, str, Optional[str], List[PhoneNumberResult], List[str]]] = None
+        for variant in self.query_planner.plan(lead):
+            search_url = self._search_url_or_raise(lead, variant)
+            page_state, phones, errors, variant_stats = self._search(driver, lead, search_url)
+            lookup_stats.merge(variant_stats)
+            attempts.append(
+                {"variant": variant.key, "search_url": search_url, "page_state": page_state, "matches": len(phones)}
+            )
+            incomplete = bool(errors) or page_state not in {PAGE_STATE_RESULTS, PAGE_STATE_NOT_FOUND}
+            # Keep the richest result, but surface a failure when nothing was found.
+            if best is None or len(phones) > len(best[3]) or (incomplete and not best[3]):
+                best = (variant, search_url, page_state, phones, errors)
+            if incomplete:
+                break
+            self.query_planner.record(lead, variant, len(phones))
+            if self.query_planner.is_satisfied(lead, len(phones)):
+                break
+
+        assert best is not None
+        variant, search_url, page_state, phones, errors = best
+        return self._build_verification(
+            search_url,
+            phones,
+            errors,
+            page_state=page_state,
+            lookup_stats=lookup_stats.as_dict(),
+            query_variant=variant.key,
+            query_attempts=attempts,
+        )
+
+    def _search(
+        self, driver: WebDriver, lead: LeadInput, search_url: str
+    ) -> Tuple[Optional[str], List[PhoneNumberResult], List[str], LookupStats]:
         if self._rate_limiter is not None:
             self._rate_limiter()
 
-        try:
-            search_url = self._build_search_url(lead)
-        except ValueError as exc:
-            LOGGER.error(
-                "Cannot build FastPeopleSearch URL for lead %s: %s",
-                lead.display_name(),
-                exc,
-            )
-            raise
-
         LOGGER.info("Navigating to %s", search_url)
-
         phones: List[PhoneNumberResult] = []
         errors: List[str] = []
+        lookup_stats = LookupStats()
+        page_state: Optional[str] = None
+        started = time.perf_counter()
+        load_seconds: Optional[float] = None
         try:
+            cancellation.check_cancelled()
             driver.get(search_url)
-            phones = self._extract_phone_numbers(driver)
+            page_state = self._wait_for_page_state(driver)
+            load_seconds = time.perf_counter() - started
+            if page_state in {PAGE_STATE_RESULTS, PAGE_STATE_NOT_FOUND} and self.page_cache is not None:
+                self.page_cache.store(search_url, driver.page_source)
+            if page_state == PAGE_STATE_RESULTS:
+                phones = self._extract_phone_numbers(driver, lookup_stats)
+            elif page_state == PAGE_STATE_BLOCKED:
+                LOGGER.warning("FastPeopleSearch blocked the request for %s", search_url)
+                errors.append("Access blocked or CAPTCHA challenge presented.")
+        except Cancelled:
+            raise
         except Exception as exc:  # pragma: no cover - runtime guard
             LOGGER.exception(
                 "Failed to retrieve results for lead %s", lead.display_name()
             )
             errors.append(str(exc))
 
+        if self.recycle_policy.enabled:
+            if load_seconds is None:
+                load_seconds = time.perf_counter() - started
+            reason = self._recycle_tracker.record_navigation(load_seconds)
+            if reason:
+                self._schedule_replacement(reason)
+
+        self.lookup_stats.merge(lookup_stats)
+        if lookup_stats.failures:
+            LOGGER.debug(
+                "Spent %.3fs in %s failed optional lookups for lead %s",
+                lookup_stats.failed_seconds,
+                lookup_stats.failures,
+                lead.display_name(),
+            )
+        return page_state, phones, errors, lookup_stats
+
+    def reparse(self, lead: LeadInput) -> LeadVerification:
+        """Rebuild the verification for ``lead`` from its cached result page.
+
+        No browser is started and no request is made; leads whose search URL
+        was never cached are reported with an error.  With query planning
+        enabled the planned variants are replayed in order from the cache.
+        """
+
+        variants: List[Optional[QueryVariant]] = list(self.query_planner.plan(lead)) if self.query_planner else [None]
+        verification: Optional[LeadVerification] = None
+        for variant in variants:
+            search_url = self._search_url_or_raise(lead, variant)
+            cached = self.page_cache.load(search_url) if self.page_cache is not None else None
+            if cached is None:
+                continue
+
+            page_state, phones = self._parse_page_html(cached.html)
+            errors = ["Access blocked or CAPTCHA challenge presented."] if page_state == PAGE_STATE_BLOCKED else []
+            metadata: Dict[str, Any] = {"page_state": page_state, "cached_at": cached.fetched_at}
+            if variant is not None:
+                metadata["query_variant"] = variant.key
+            if verification is None or len(phones) > len(verification.contacts):
+                verification = self._build_verification(search_url, phones, errors, **metadata)
+            if errors or self.query_planner is None or self.query_planner.is_satisfied(lead, len(phones)):
+                break
+
+        if verification is None:
+            search_url = self._search_url_or_raise(lead, variants[0])
+            return self._build_verification(search_url, [], ["No cached page available for reparse."])
+        return verification
+
+    def _search_url_or_raise(self, lead: LeadInput, variant: Optional[QueryVariant] = None) -> str:
+        try:
+            return self._build_search_url(lead, variant)
+        except ValueError as exc:
+            LOGGER.error(
+                "Cannot build FastPeopleSearch URL for lead %s: %s",
+                lead.display_name(),
+                exc,
+            )
+            raise
+
+    def _build_verification(
+        self,
+        search_url: str,
+        phones: List[PhoneNumberResult],
+        errors: List[str],
+        **metadata: Any,
+    ) -> LeadVerification:
         contacts: List[ContactDetail] = phone_results_to_contacts(phones)
         raw_data = {
             "metadata": {
                 "search_url": search_url,
                 "phone_count": len(contacts),
+                **metadata,
             },
             "phone_results": [asdict(phone) for phone in phones],
             "errors": errors,
+            "not_found": metadata.get("page_state") == PAGE_STATE_NOT_FOUND,
         }
-
         return LeadVerification(source=self.name, contacts=contacts, raw_data=raw_data)
 
-    def _extract_phone_numbers(self, driver: WebDriver) -> List[PhoneNumberResult]:
+    def _wait_for_page_state(self, driver: WebDriver) -> str:
+        """Block until the page shows results, a not-found banner, or a block marker.
+
+        Whichever appears first ends the wait, so negative and blocked searches
+        return as soon as the page renders rather than after the full timeout.
+        Each poll also checks for cancellation, so a cancelled run stops
+        waiting within one poll interval.
+        """
+
         wait_timeout = max(self.config.wait_timeout_seconds, 1.0)
+        with self._implicit_wait_suspended(driver):
+            try:
+                return WebDriverWait(driver, wait_timeout).until(self._detect_page_state)
+            except TimeoutException:
+                LOGGER.warning("Timed out waiting for search results on %s", driver.current_url)
+                return PAGE_STATE_TIMEOUT
+
+    def _detect_page_state(self, driver: WebDriver) -> Optional[str]:
+        cancellation.check_cancelled()
+        if driver.find_elements(By.CSS_SELECTOR, self.RESULT_SELECTOR):
+            return PAGE_STATE_RESULTS
+        if driver.find_elements(By.CSS_SELECTOR, self.BLOCK_SELECTOR):
+            return PAGE_STATE_BLOCKED
+        title = (getattr(driver, "title", "") or "").strip().lower()
+        if any(title.startswith(marker) for marker in self.BLOCK_TITLES):
+            return PAGE_STATE_BLOCKED
+        if driver.find_elements(By.XPATH, self.NOT_FOUND_XPATH):
+            return PAGE_STATE_NOT_FOUND
+        return None
+
+    def _extract_phone_numbers(
+        self, driver: WebDriver, lookup_stats: Optional[LookupStats] = None
+    ) -> List[PhoneNumberResult]:
         phones: List[PhoneNumberResult] = []
-        try:
-            WebDriverWait(driver, wait_timeout).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "a[href^='tel:']"))
-            )
-        except TimeoutException:
-            LOGGER.warning("Timed out waiting for phone numbers on %s", driver.current_url)
-            return phones
-
-        elements: Iterable = driver.find_elements(By.CSS_SELECTOR, "a[href^='tel:']")
-        for elem in elements:
-            text = elem.text.strip()
-            href = elem.get_attribute("href") or ""
-            if not text:
-                continue
-            phones.append(
-                PhoneNumberResult(
-                    phone_number=text,
-                    raw_text=text,
-                    label=self._infer_label(elem),
-                    is_primary=not phones,
+        elements: Iterable = driver.find_elements(By.CSS_SELECTOR, self.RESULT_SELECTOR)
+        with self._implicit_wait_suspended(driver):
+            for elem in elements:
+                text = elem.text.strip()
+                href = elem.get_attribute("href") or ""
+                if not text:
+                    continue
+                phones.append(
+                    PhoneNumberResult(
+                        phone_number=text,
+                        raw_text=text,
+                        label=self._infer_label(elem, lookup_stats),
+                        is_primary=not phones,
+                    )
                 )
-            )
-            LOGGER.debug("Discovered phone number %s (href=%s)", text, href)
+                LOGGER.debug("Discovered phone number %s (href=%s)", text, href)
         return phones
 
-    def _infer_label(self, element) -> Optional[str]:  # type: ignore[override]
+    def _infer_label(self, element, lookup_stats: Optional[LookupStats] = None) -> Optional[str]:  # type: ignore[override]
+        """Return the result card header for ``element``.
+
+        Callers are expected to suspend the implicit wait first; otherwise each
+        missing ancestor or header blocks for the full implicit wait.
+        """
+
+        started = time.perf_counter()
         try:
             container = element.find_element(By.XPATH, "ancestor::div[contains(@class, 'result')]")
             header = container.find_element(By.CSS_SELECTOR, "h3, h2")
-            return header.text.strip() or None
+            label = header.text.strip() or None
         except Exception:  # pragma: no cover - best effort metadata
+            if lookup_stats is not None:
+                lookup_stats.record(time.perf_counter() - started, failed=True)
             return None
+        if lookup_stats is not None:
+            lookup_stats.record(time.perf_counter() - started, failed=False)
+        return label
+
+    def _parse_page_html(self, html: str) -> Tuple[Optional[str], List[PhoneNumberResult]]:
+        """Classify and extract phone numbers from saved page HTML.
+
+        Mirrors :meth:`_detect_page_state` and :meth:`_extract_phone_numbers`
+        using the same selectors so cached pages yield the same results.
+        """
+
+        soup = parse_html(html)
+        links = soup.select(self.RESULT_SELECTOR)
+        if not links:
+            title = soup.title.get_text(strip=True).lower() if soup.title else ""
+            if soup.select(self.BLOCK_SELECTOR) or any(title.startswith(marker) for marker in self.BLOCK_TITLES):
+                return PAGE_STATE_BLOCKED, []
+            if soup.find(string=lambda text: text and any(marker in text for marker in self.NOT_FOUND_MARKERS)):
+                return PAGE_STATE_NOT_FOUND, []
+            return None, []
+
+        phones: List[PhoneNumberResult] = []
+        for link in links:
+            text = link.get_text(strip=True)
+            if not text:
+                continue
+            container = link.find_parent(lambda tag: tag.name == "div" and "result" in " ".join(tag.get("class", [])))
+            header = container.select_one("h3, h2") if container is not None else None
+            label = header.get_text(strip=True) or None if header is not None else None
+            phones.append(PhoneNumberResult(phone_number=text, raw_text=text, label=label, is_primary=not phones))
+        return PAGE_STATE_RESULTS, phones
+
+    def _build_search_url(self, lead: LeadInput, variant: Optional[QueryVariant] = None) -> str:
+        """Return the search URL for ``lead``.
+
+        Without a ``variant`` the name is combined with the lead's city and
+        state when present; a :class:`QueryVariant` selects the location filter
+        explicitly (zip code, city/state, or none).
+        """
 
-    def _build_search_url(self, lead: LeadInput) -> str:
         first_name = (lead.first_name or "").strip()
         last_name = (lead.last_name or "").strip()
 
@@ -218,13 +580,15 @@ class FastPeopleSearchScraper:
             )
 
         name = quote_plus(f"{first_name} {last_name}")
-        if lead.city or lead.state:
+        if variant is None:
             location = " ".join(filter(None, [lead.city, lead.state]))
-            location = quote_plus(location)
-            return f"{self.BASE_URL}/name/{name}/{location}"
+        else:
+            location = variant.postal_code or " ".join(filter(None, [variant.city, variant.state]))
+        if location:
+            return f"{self.BASE_URL}/name/{name}/{quote_plus(location)}"
         return f"{self.BASE_URL}/name/{name}"
 
     def _default_rate_limiter(self) -> None:
         if self.config.rate_limit_seconds > 0:
             LOGGER.debug("Sleeping for %s seconds to respect rate limits", self.config.rate_limit_seconds)
-            time.sleep(self.config.rate_limit_seconds)
+            cancellation.sleep(self.config.rate_limit_seconds)
@@ -0,0 +1,108 @@
+"""Policies for replacing long-lived browser instances before they degrade."""
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+
+@dataclass
+class RecyclePolicy:
+    """Thresholds after which a browser instance should be replaced.
+
+    A value of ``0`` disables the corresponding check.  Resident memory is
+    measured across the driver process and all of its descendants, and only
+    every ``rss_check_interval`` navigations because it walks ``/proc``.
+    """
+
+    max_navigations: int = 0
+    max_rss_mb: float = 0.0
+    slow_load_seconds: float = 0.0
+    max_slow_loads: int = 3
+    rss_check_interval: int = 10
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.max_navigations or self.max_rss_mb or self.slow_load_seconds)
+
+
+class RecycleTracker:
+    """Count navigations against a :class:`RecyclePolicy` for one browser instance."""
+
+    def __init__(self, policy: RecyclePolicy, rss_reader: Optional[Callable[[], Optional[float]]] = None) -> None:
+        self.policy = policy
+        self._rss_reader = rss_reader
+        self.reset()
+
+    def reset(self) -> None:
+        self.navigations = 0
+        self.slow_loads = 0
+        self.last_rss_mb: Optional[float] = None
+
+    def record_navigation(self, elapsed: float) -> Optional[str]:
+        """Record one page load and return the reason to recycle, if any."""
+
+        policy = self.policy
+        self.navigations += 1
+        if policy.slow_load_seconds and elapsed >= policy.slow_load_seconds:
+            self.slow_loads += 1
+
+        if policy.max_navigations and self.navigations >= policy.max_navigations:
+            return f"{self.navigations} navigations"
+        if policy.slow_load_seconds and self.slow_loads >= max(policy.max_slow_loads, 1):
+            return f"{self.slow_loads} loads slower than {policy.slow_load_seconds:g}s"
+        if policy.max_rss_mb and self._rss_reader is not None:
+            if self.navigations % max(policy.rss_check_interval, 1) == 0:
+                self.last_rss_mb = self._rss_reader()
+                if self.last_rss_mb is not None and self.last_rss_mb >= policy.max_rss_mb:
+                    return f"resident memory {self.last_rss_mb:.0f} MB"
+        return None
+
+
+def _resident_bytes(proc: Path, pid: int, page_size: int) -> int:
+    try:
+        fields = (proc / str(pid) / "statm").read_text().split()
+    except OSError:
+        return 0
+    return int(fields[1]) * page_size if len(fields) > 1 else 0
+
+
+def process_tree_rss_mb(pid: int, *, proc_root: str = "/proc") -> Optional[float]:
+    """Return the resident memory of ``pid`` and its descendants in megabytes.
+
+    Returns ``None`` where ``/proc`` is unavailable or ``pid`` no longer exists.
+    """
+
+    proc = Path(proc_root)
+    if not (proc / str(pid)).exists():
+        return None
+
+    children: Dict[int, List[int]] = {}
+    for entry in proc.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+        except OSError:
+            continue
+        # The command name may contain spaces; fields after it are fixed.
+        fields = stat.rpartition(")")[2].split()
+        if len(fields) > 1:
+            children.setdefault(int(fields[1]), []).append(int(entry.name))
+
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    total = 0
+    pending = [pid]
+    seen = set()
+    while pending:
+        current = pending.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        total += _resident_bytes(proc, current, page_size)
+        pending.extend(children.get(current, []))
+    return total / (1024 * 1024)
+
+
+__all__ = ["RecyclePolicy", "RecycleTracker", "process_tree_rss_mb"]
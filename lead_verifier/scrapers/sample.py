@@ -1,7 +1,7 @@
 """Example scraper implementations that operate on local data."""
 from __future__ import annotations
 
-from typing import List
+from typing import List, Sequence
 
 from ..models import ContactDetail, LeadInput, LeadVerification
 
@@ -22,3 +22,8 @@ class EchoScraper:
             contacts.append(ContactDetail(type="email", value=str(lead.email)))
         raw_data = lead.metadata if self._include_metadata else None
         return LeadVerification(source=self.name, contacts=contacts, raw_data=raw_data)
+
+    def verify_many(self, leads: Sequence[LeadInput]) -> List[LeadVerification]:
+        """Echo a batch of leads; see :class:`~lead_verifier.batching.MicroBatcher`."""
+
+        return [self.verify(lead) for lead in leads]
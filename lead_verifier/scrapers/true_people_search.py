@@ -12,14 +12,20 @@ Prerequisites
 from __future__ import annotations
 
 import contextlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, TypeVar
 from urllib.parse import urlencode
 
 from playwright.sync_api import Error as PlaywrightError
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from playwright.sync_api import sync_playwright
 
+from .. import cancellation
+from ..cancellation import Cancelled
+from ..captcha import CaptchaDeferred
 from ..models import (
     LeadInput,
     LeadVerification,
@@ -27,7 +33,13 @@ from ..models import (
     ScraperResult,
     email_records_to_contacts,
 )
-from .base import BrowserScraper, BrowserScraperConfig
+from ..query_planner import QueryPlanner, QueryVariant
+from .base import BrowserScraper, BrowserScraperConfig, parse_html
+
+_T = TypeVar("_T")
+
+# Page waits are split into slices this long so cancellation is noticed quickly.
+_WAIT_SLICE_SECONDS = 0.5
 
 
 @dataclass
@@ -35,6 +47,11 @@ class TruePeopleSearchConfig(BrowserScraperConfig):
     """Extends :class:`BrowserScraperConfig` with scraper specific options."""
 
     wait_for_captcha: bool = False
+    defer_captcha: bool = True
+    base_url: Optional[str] = None
+    plan_queries: bool = False
+    expected_matches: int = 1
+    query_stats_path: Optional[str] = None
 
 
 class TruePeopleSearchScraper(BrowserScraper):
@@ -45,14 +62,27 @@ class TruePeopleSearchScraper(BrowserScraper):
     config:
         Optional :class:`TruePeopleSearchConfig` controlling browser behaviour.
         The base options add throttling and headless/headful controls, while
-        :attr:`TruePeopleSearchConfig.wait_for_captcha` can be toggled to pause
-        execution once a CAPTCHA dialog is detected.
+        :attr:`TruePeopleSearchConfig.wait_for_captcha` can be toggled to hold
+        the page open once a CAPTCHA is detected.  By default the lookup is
+        deferred by raising :class:`~lead_verifier.captcha.CaptchaDeferred`
+        so other leads keep flowing; set ``defer_captcha`` to ``False`` to block
+        until the challenge dialog is dismissed instead.
+
+    Chromium is launched once and reused for every search, each in a fresh
+    browser context.  Playwright's sync API is bound to the thread that started
+    it, so all browser work runs on a single dedicated thread owned by the
+    scraper; :meth:`warm_up` starts the browser on that thread ahead of time.
     """
 
     name = "true_people_search"
     provider = "truepeoplesearch.com"
+    BASE_URL = "https://www.truepeoplesearch.com"
     NOT_FOUND_TEXT = "We could not find any records for that search criteria."
     EMAIL_SECTION_TITLE = "Email Addresses"
+    RECORD_COUNT_SELECTOR = "div.content-center div.row.pl-1.record-count div"
+    REPARSE_MISS_NOTE = "No cached page available for reparse."
+    CAPTCHA_SELECTOR = "iframe[src*='captcha']"
+    RESULTS_SELECTOR = "div.card-summary, a[href^='mailto:']"
 
     def __init__(self, config: Optional[TruePeopleSearchConfig | Dict[str, Any]] = None) -> None:
         if isinstance(config, dict):
@@ -60,6 +90,39 @@ class TruePeopleSearchScraper(BrowserScraper):
         else:
             resolved_config = config or TruePeopleSearchConfig()
         super().__init__(config=resolved_config)
+        if resolved_config.base_url:
+            self.BASE_URL = resolved_config.base_url.rstrip("/")
+        self.query_planner = (
+            QueryPlanner(expected_matches=resolved_config.expected_matches, stats_path=resolved_config.query_stats_path)
+            if resolved_config.plan_queries
+            else None
+        )
+        self._browser_thread: Optional[ThreadPoolExecutor] = None
+        self._browser_thread_lock = threading.Lock()
+        self._playwright = None
+        self._browser = None
+
+    def warm_up(self) -> None:
+        """Launch Chromium ahead of the first search."""
+
+        if self.config.reparse:
+            return
+        self._run_on_browser_thread(self._ensure_browser)
+
+    def close(self) -> None:
+        with self._browser_thread_lock:
+            executor, self._browser_thread = self._browser_thread, None
+        if executor is None:
+            return
+        executor.submit(self._shutdown_browser).result()
+        executor.shutdown(wait=True)
+
+    def __enter__(self) -> "TruePeopleSearchScraper":
+        self.warm_up()
+        return self
+
+    def __exit__(self, exc_type, exc, exc_tb) -> None:
+        self.close()
 
     def verify(self, lead: LeadInput) -> LeadVerification:
         """Translate :meth:`search` results into orchestrator-friendly output."""
@@ -72,16 +135,67 @@ class TruePeopleSearchScraper(BrowserScraper):
                 raw_data={"error": "Lead is missing a name."},
             )
 
-        query = PersonSearch(full_name=full_name, city_state_zip=self._derive_location(lead))
+        if self.query_planner is not None:
+            return self._verify_planned(lead, full_name)
+        return self._verify_query(PersonSearch(full_name=full_name, city_state_zip=self._derive_location(lead)))
+
+    def _verify_planned(self, lead: LeadInput, full_name: str) -> LeadVerification:
+        """Search each planned query variant until enough email addresses are found.
+
+        The variant with the most addresses is reported.  A failed search,
+        including a reparse without a cached page, ends the plan early and is
+        not recorded, and a deferred CAPTCHA resumes only the variant that hit
+        it.
+        """
+
+        assert self.query_planner is not None
+        attempts: List[Dict[str, Any]] = []
+        best: Optional[LeadVerification] = None
+        for variant in self.query_planner.plan(lead):
+            query = PersonSearch(full_name=full_name, city_state_zip=self._variant_location(variant))
+            verification = self._verify_query(query)
+            failed = bool(verification.raw_data.get("error") or verification.raw_data.get("errors"))
+            attempts.append({"variant": variant.key, "query": asdict(query), "matches": len(verification.contacts)})
+            if best is None or len(verification.contacts) > len(best.contacts) or (failed and not best.contacts):
+                best = verification
+                best.raw_data["query_variant"] = variant.key
+            if failed:
+                break
+            self.query_planner.record(lead, variant, len(verification.contacts))
+            if self.query_planner.is_satisfied(lead, len(verification.contacts)):
+                break
+
+        assert best is not None
+        best.raw_data["query_attempts"] = attempts
+        return best
+
+    def _verify_query(self, query: PersonSearch) -> LeadVerification:
         try:
             result = self.search(query)
+        except CaptchaDeferred as exc:
+            raise self._defer_verification(exc, query) from None
+        except Cancelled:
+            raise
         except Exception as exc:  # pragma: no cover - defensive guard around playwright
             return LeadVerification(
                 source=self.name,
                 contacts=[],
                 raw_data={"error": str(exc), "query": asdict(query)},
             )
+        return self._to_verification(result, query)
+
+    def _defer_verification(self, deferred: CaptchaDeferred, query: PersonSearch) -> CaptchaDeferred:
+        """Wrap a deferred :meth:`search` so resuming it yields a :class:`LeadVerification`."""
+
+        def resume() -> LeadVerification:
+            try:
+                return self._to_verification(deferred.resume(), query)
+            except CaptchaDeferred as again:
+                raise self._defer_verification(again, query) from None
+
+        return CaptchaDeferred(str(deferred), resume=resume, release=deferred.release)
 
+    def _to_verification(self, result: ScraperResult, query: PersonSearch) -> LeadVerification:
         contacts = email_records_to_contacts(result.emails)
         raw_data = {
             "found": result.found,
@@ -89,6 +203,10 @@ class TruePeopleSearchScraper(BrowserScraper):
             "emails": [asdict(email) for email in result.emails],
             "query": asdict(query),
         }
+        if result.not_found:
+            raw_data["not_found"] = True
+        if result.reparse_miss:
+            raw_data["errors"] = [self.REPARSE_MISS_NOTE]
         return LeadVerification(source=self.name, contacts=contacts, raw_data=raw_data)
 
     def search(self, query: PersonSearch) -> ScraperResult:
@@ -96,35 +214,131 @@ class TruePeopleSearchScraper(BrowserScraper):
 
         query.require_name()
         result = ScraperResult(provider=self.provider, query=query, found=False)
+        target_url = self._build_query_url(query)
+        if self.config.reparse:
+            return self._reparse_search(result, target_url)
 
-        with sync_playwright() as playwright:
-            browser = playwright.chromium.launch(headless=self.config.headless)
-            try:
-                page = browser.new_page()
-                page.set_default_navigation_timeout(self.config.navigation_timeout * 1000)
-                target_url = self._build_query_url(query)
-                page.goto(target_url, wait_until="domcontentloaded")
-                self._apply_throttle()
-
-                if self._is_not_found(page):
-                    result.add_note("No records returned by TruePeopleSearch.")
-                    return result
-
-                if getattr(self.config, "wait_for_captcha", False) and self._is_captcha_present(page):
-                    result.add_note("Execution paused for manual CAPTCHA resolution.")
-                    page.wait_for_event("dialog")
-
-                emails = self._extract_emails(page)
-                for address in emails:
-                    result.add_email(address)
-
-                result.found = bool(emails)
-                if not emails:
-                    result.add_note("Result page did not expose an email section.")
+        return self._run_on_browser_thread(self._search_live, result, target_url)
+
+    def _search_live(self, result: ScraperResult, target_url: str) -> ScraperResult:
+        context = self._ensure_browser().new_context()
+        keep_open = False
+        try:
+            page = context.new_page()
+            page.set_default_navigation_timeout(self.config.navigation_timeout * 1000)
+            cancellation.check_cancelled()
+            page.goto(target_url, wait_until="domcontentloaded")
+            self._wait_for_page_state(page)
+            self._apply_throttle()
+
+            if self._is_not_found(page):
+                self._cache_page(target_url, page)
+                result.not_found = True
+                result.add_note("No records returned by TruePeopleSearch.")
                 return result
-            finally:
-                with contextlib.suppress(PlaywrightError):
-                    browser.close()
+
+            if getattr(self.config, "wait_for_captcha", False) and self._is_captcha_present(page):
+                if self.config.defer_captcha:
+                    keep_open = True
+                    raise self._defer(result, target_url, context, page)
+                result.add_note("Execution paused for manual CAPTCHA resolution.")
+                page.wait_for_event("dialog")
+
+            return self._collect_emails(result, target_url, page)
+        finally:
+            if not keep_open:
+                self._close_context(context)
+
+    def _defer(self, result: ScraperResult, target_url: str, context, page) -> CaptchaDeferred:
+        """Park the open page so an operator can solve the CAPTCHA later."""
+
+        result.add_note("Deferred for manual CAPTCHA resolution.")
+
+        def resume() -> ScraperResult:
+            return self._run_on_browser_thread(self._resume_search, result, target_url, context, page)
+
+        def release() -> None:
+            self._run_on_browser_thread(self._close_context, context)
+
+        return CaptchaDeferred(f"CAPTCHA presented for {target_url}", resume=resume, release=release)
+
+    def _resume_search(self, result: ScraperResult, target_url: str, context, page) -> ScraperResult:
+        if self._is_captcha_present(page):
+            raise self._defer(result, target_url, context, page)
+        try:
+            return self._collect_emails(result, target_url, page)
+        finally:
+            self._close_context(context)
+
+    def _close_context(self, context) -> None:
+        with contextlib.suppress(PlaywrightError):
+            context.close()
+
+    def _collect_emails(self, result: ScraperResult, target_url: str, page) -> ScraperResult:
+        emails = self._extract_emails(page)
+        self._cache_page(target_url, page)
+        for address in emails:
+            result.add_email(address)
+
+        result.found = bool(emails)
+        if not emails:
+            result.add_note("Result page did not expose an email section.")
+        return result
+
+    def _reparse_search(self, result: ScraperResult, target_url: str) -> ScraperResult:
+        """Populate ``result`` from the cached page for ``target_url`` without a browser."""
+
+        cached = self.page_cache.load(target_url) if self.page_cache is not None else None
+        if cached is None:
+            result.reparse_miss = True
+            result.add_note(self.REPARSE_MISS_NOTE)
+            return result
+
+        soup = parse_html(cached.html)
+        result.add_note(f"Rebuilt from page cached at {cached.fetched_at:.0f}.")
+        record_count = soup.select_one(self.RECORD_COUNT_SELECTOR)
+        if record_count is not None and record_count.get_text().strip() == self.NOT_FOUND_TEXT:
+            result.not_found = True
+            result.add_note("No records returned by TruePeopleSearch.")
+            return result
+
+        emails = self._parse_emails(soup)
+        for address in emails:
+            result.add_email(address)
+        result.found = bool(emails)
+        if not emails:
+            result.add_note("Result page did not expose an email section.")
+        return result
+
+    # ------------------------------------------------------------------
+    # Browser lifecycle
+    def _run_on_browser_thread(self, func: Callable[..., _T], *args: Any) -> _T:
+        with self._browser_thread_lock:
+            if self._browser_thread is None:
+                self._browser_thread = ThreadPoolExecutor(max_workers=1, thread_name_prefix="true-people-search")
+            executor = self._browser_thread
+        return cancellation.submit_with_context(executor, func, *args).result()
+
+    def _ensure_browser(self):
+        """Return the shared browser, relaunching it if it has disconnected."""
+
+        if self._browser is not None and not self._browser.is_connected():
+            self._shutdown_browser()
+        if self._browser is None:
+            if self._playwright is None:
+                self._playwright = sync_playwright().start()
+            self._browser = self._playwright.chromium.launch(headless=self.config.headless)
+        return self._browser
+
+    def _shutdown_browser(self) -> None:
+        if self._browser is not None:
+            with contextlib.suppress(PlaywrightError):
+                self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            with contextlib.suppress(PlaywrightError):
+                self._playwright.stop()
+            self._playwright = None
 
     # ------------------------------------------------------------------
     # Helpers
@@ -139,17 +353,51 @@ class TruePeopleSearchScraper(BrowserScraper):
         components = [component for component in [city_state, postal_code] if component]
         return " ".join(components) or None
 
+    @staticmethod
+    def _variant_location(variant: QueryVariant) -> Optional[str]:
+        if variant.postal_code:
+            return variant.postal_code
+        return ", ".join(part for part in [variant.city, variant.state] if part) or None
+
     def _build_query_url(self, query: PersonSearch) -> str:
         params = {
             "name": query.full_name,
             "citystatezip": query.city_state_zip or "",
             "rid": "0x0",
         }
-        return f"https://www.truepeoplesearch.com/results?{urlencode(params)}"
+        return f"{self.BASE_URL}/results?{urlencode(params)}"
+
+    def _wait_for_page_state(self, page) -> None:
+        """Wait until the record count, a result, or a CAPTCHA frame is attached.
+
+        The combined selector resolves on whichever marker renders first, so
+        not-found and challenge pages are classified without waiting out the
+        default timeout on a selector that will never appear.  The wait is
+        polled in short slices and raises :class:`Cancelled` between them
+        once the run is cancelled.
+        """
+
+        selector = ", ".join([self.RECORD_COUNT_SELECTOR, self.CAPTCHA_SELECTOR, self.RESULTS_SELECTOR])
+        deadline = time.monotonic() + self.config.navigation_timeout
+        while True:
+            cancellation.check_cancelled()
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            try:
+                page.wait_for_selector(
+                    selector,
+                    state="attached",
+                    timeout=min(remaining, _WAIT_SLICE_SECONDS) * 1000,
+                )
+                return
+            except PlaywrightTimeoutError:
+                continue
 
     def _is_not_found(self, page) -> bool:
         try:
-            text = page.text_content("div.content-center div.row.pl-1.record-count div")
+            element = page.query_selector(self.RECORD_COUNT_SELECTOR)
+            text = element.text_content() if element else None
             if text and text.strip() == self.NOT_FOUND_TEXT:
                 return True
         except PlaywrightTimeoutError:
@@ -160,28 +408,87 @@ class TruePeopleSearchScraper(BrowserScraper):
 
     def _is_captcha_present(self, page) -> bool:
         with contextlib.suppress(PlaywrightError):
-            return bool(page.query_selector("iframe[src*='captcha']"))
+            return bool(page.query_selector(self.CAPTCHA_SELECTOR))
         return False
 
+    def _cache_page(self, target_url: str, page) -> None:
+        if self.page_cache is None or self._is_captcha_present(page):
+            return
+        with contextlib.suppress(PlaywrightError):
+            self.page_cache.store(target_url, page.content())
+
+    def _parse_emails(self, soup) -> List[str]:
+        """HTML counterpart of :data:`EMAIL_EXTRACTION_SCRIPT` used for cached pages."""
+
+        title = self.EMAIL_SECTION_TITLE
+        node = soup.find(string=lambda text: text is not None and text.strip() == title)
+        if node is None or node.parent is None:
+            return []
+        header = node.parent
+        while (
+            header.parent is not None
+            and header.parent.name not in {"body", "[document]"}
+            and header.parent.get_text().strip() == title
+        ):
+            header = header.parent
+        if header.parent is None:
+            return []
+        children = header.parent.find_all(recursive=False)[1:]
+        return [text for text in (child.get_text().strip() for child in children) if text]
+
     def _extract_emails(self, page) -> List[str]:
         try:
-            emails = page.evaluate(
-                """
-                (desc) => {
-                    const elements = Array.from(document.querySelectorAll('*'));
-                    const header = elements.find((node) => node.textContent.trim() === desc);
-                    if (!header || !header.parentElement) {
-                        return [];
-                    }
-                    const parent = header.parentElement;
-                    const children = Array.from(parent.children).slice(1);
-                    return children
-                        .map((child) => child.textContent.trim())
-                        .filter((value) => value.length > 0);
-                }
-                """,
-                self.EMAIL_SECTION_TITLE,
-            )
+            emails = page.evaluate(EMAIL_EXTRACTION_SCRIPT, self.EMAIL_SECTION_TITLE)
             return emails or []
         except PlaywrightError as exc:
             raise RuntimeError("Failed to extract email addresses from response") from exc
+
+
+# Locate the section header through the XPath engine, which only inspects text
+# nodes, rather than reading ``textContent`` from every element on the page.
+# The header is widened to the outermost ancestor with the same text so the
+# section container matches the one found by a full document scan.  A text-node
+# walk is kept as a fallback for headers whose label is split across nodes.
+EMAIL_EXTRACTION_SCRIPT = """
+(desc) => {
+    const literal = desc.includes('"') ? `'${desc}'` : `"${desc}"`;
+    let header = document.evaluate(
+        `//body//*[normalize-space(text())=${literal}]`,
+        document,
+        null,
+        XPathResult.FIRST_ORDERED_NODE_TYPE,
+        null,
+    ).singleNodeValue;
+    if (!header && document.body) {
+        const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+        while (!header && walker.nextNode()) {
+            const text = walker.currentNode.nodeValue.trim();
+            if (!text || !desc.includes(text)) {
+                continue;
+            }
+            let candidate = walker.currentNode.parentElement;
+            for (let depth = 0; candidate && depth < 3; depth += 1) {
+                if (candidate.textContent.trim() === desc) {
+                    header = candidate;
+                    break;
+                }
+                candidate = candidate.parentElement;
+            }
+        }
+    }
+    if (!header) {
+        return [];
+    }
+    while (header.parentElement && header.parentElement !== document.body
+            && header.parentElement.textContent.trim() === desc) {
+        header = header.parentElement;
+    }
+    if (!header.parentElement) {
+        return [];
+    }
+    const children = Array.from(header.parentElement.children).slice(1);
+    return children
+        .map((child) => child.textContent.trim())
+        .filter((value) => value.length > 0);
+}
+"""
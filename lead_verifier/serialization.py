@@ -0,0 +1,82 @@
+"""JSON-friendly conversions for lead and verification models."""
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from .models import AggregatedContact, AggregatedLeadResult, ContactDetail, LeadInput, LeadVerification
+
+
+def lead_to_dict(lead: LeadInput) -> Dict[str, Any]:
+    return {
+        "name": lead.name,
+        "phone": lead.phone,
+        "email": lead.email,
+        "first_name": lead.first_name,
+        "last_name": lead.last_name,
+        "metadata": dict(lead.metadata),
+    }
+
+
+def lead_from_dict(data: Dict[str, Any]) -> LeadInput:
+    return LeadInput(
+        name=data.get("name"),
+        phone=data.get("phone"),
+        email=data.get("email"),
+        first_name=data.get("first_name"),
+        last_name=data.get("last_name"),
+        metadata=dict(data.get("metadata") or {}),
+    )
+
+
+def verification_to_dict(verification: LeadVerification) -> Dict[str, Any]:
+    return {
+        "source": verification.source,
+        "contacts": [
+            {"type": contact.type, "value": contact.value, "metadata": dict(contact.metadata)}
+            for contact in verification.contacts
+        ],
+        "raw_data": verification.raw_data,
+    }
+
+
+def verification_from_dict(data: Dict[str, Any]) -> LeadVerification:
+    return LeadVerification(
+        source=data["source"],
+        contacts=[
+            ContactDetail(type=contact["type"], value=contact["value"], metadata=dict(contact.get("metadata") or {}))
+            for contact in data.get("contacts", [])
+        ],
+        raw_data=data.get("raw_data"),
+    )
+
+
+def aggregated_to_dict(result: AggregatedLeadResult) -> Dict[str, Any]:
+    return {
+        "lead": lead_to_dict(result.lead),
+        "contacts": [
+            {"type": contact.type, "value": contact.value, "sources": list(contact.sources)}
+            for contact in result.contacts
+        ],
+        "raw_results": [verification_to_dict(verification) for verification in result.raw_results],
+    }
+
+
+def aggregated_from_dict(data: Dict[str, Any]) -> AggregatedLeadResult:
+    return AggregatedLeadResult(
+        lead=lead_from_dict(data["lead"]),
+        contacts=[
+            AggregatedContact(type=contact["type"], value=contact["value"], sources=list(contact.get("sources", [])))
+            for contact in data.get("contacts", [])
+        ],
+        raw_results=[verification_from_dict(item) for item in data.get("raw_results", [])],
+    )
+
+
+__all__ = [
+    "aggregated_from_dict",
+    "aggregated_to_dict",
+    "lead_from_dict",
+    "lead_to_dict",
+    "verification_from_dict",
+    "verification_to_dict",
+]
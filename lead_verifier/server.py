@@ -0,0 +1,414 @@
+"""Local HTTP service that verifies submitted leads with one long-lived orchestrator."""
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+from .models import AggregatedLeadResult, LeadInput, LeadVerification
+from .orchestrator import VerificationOrchestrator
+from .scheduling import FairShareScheduler, estimate_eta, parse_deadline, parse_priority, priority_weight
+from .serialization import aggregated_to_dict
+
+LOGGER = logging.getLogger(__name__)
+
+_LEAD_FIELDS = ("name", "phone", "email", "first_name", "last_name")
+
+
+def lead_from_payload(data: Mapping[str, Any]) -> LeadInput:
+    """Build a :class:`LeadInput` from a JSON object.
+
+    Accepts the shape produced by :func:`~lead_verifier.serialization.lead_to_dict`
+    as well as flat spreadsheet-style rows; keys other than the lead fields are
+    merged into ``metadata``.
+    """
+
+    if not isinstance(data, Mapping):
+        raise ValueError("Each lead must be a JSON object")
+    metadata = dict(data.get("metadata") or {})
+    metadata.update({key: value for key, value in data.items() if key not in _LEAD_FIELDS and key != "metadata"})
+    return LeadInput(metadata=metadata, **{key: data.get(key) for key in _LEAD_FIELDS})
+
+
+@dataclass
+class ServiceJob:
+    """Leads submitted in one request and the results verified so far, in completion order."""
+
+    id: str
+    total: int
+    priority: int = 0
+    deadline: Optional[float] = None
+    weight: float = 1.0
+    created_at: float = field(default_factory=time.time)
+    results: List[Tuple[int, AggregatedLeadResult]] = field(default_factory=list)
+    partial: Dict[int, AggregatedLeadResult] = field(default_factory=dict)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    _condition: threading.Condition = field(default_factory=threading.Condition, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.finished and self.finished_at is None:
+            self.finished_at = self.created_at
+
+    @property
+    def completed(self) -> int:
+        return len(self.results)
+
+    @property
+    def finished(self) -> bool:
+        return self.completed >= self.total
+
+    def mark_started(self) -> None:
+        if self.started_at is None:
+            self.started_at = time.time()
+
+    def eta_seconds(self) -> Optional[float]:
+        return estimate_eta(self.completed, self.total, self.started_at)
+
+    def set_partial(self, position: int, result: AggregatedLeadResult) -> None:
+        """Record the contacts found so far for a lead that is still being verified."""
+
+        with self._condition:
+            self.partial[position] = result
+
+    def add(self, position: int, result: AggregatedLeadResult) -> None:
+        with self._condition:
+            self.partial.pop(position, None)
+            self.results.append((position, result))
+            if self.finished:
+                self.finished_at = time.time()
+            self._condition.notify_all()
+
+    def iter_results(self, *, timeout: Optional[float] = None) -> Iterator[Tuple[int, AggregatedLeadResult]]:
+        """Yield ``(input position, result)`` pairs as they complete until the job finishes.
+
+        ``timeout`` bounds the wait for each next result.
+        """
+
+        index = 0
+        while True:
+            with self._condition:
+                if index >= len(self.results) and not self.finished:
+                    self._condition.wait_for(lambda: index < len(self.results) or self.finished, timeout)
+                pending = self.results[index:]
+                finished = self.finished
+            if not pending and not finished:
+                return
+            for item in pending:
+                yield item
+            index += len(pending)
+            if finished and index >= self.total:
+                return
+
+    def status(self) -> Dict[str, Any]:
+        with self._condition:
+            partial = sorted(self.partial.items(), key=lambda item: item[0])
+        return {
+            "job_id": self.id,
+            "total": self.total,
+            "completed": self.completed,
+            "finished": self.finished,
+            "priority": self.priority,
+            "deadline": self.deadline,
+            "weight": self.weight,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "eta_seconds": self.eta_seconds(),
+            "in_progress": [
+                {"position": position, "contacts": aggregated_to_dict(result)["contacts"]} for position, result in partial
+            ],
+        }
+
+
+@dataclass
+class _Task:
+    job: ServiceJob
+    position: int
+    lead: LeadInput
+
+
+class VerificationService:
+    """Queue submitted leads onto ``workers`` threads sharing one orchestrator.
+
+    The orchestrator's scrapers, and therefore their browsers, stay warm across
+    requests.  Leads are served by a :class:`FairShareScheduler` with one flow
+    per job, so a small job interleaves with a large back-fill instead of
+    waiting behind it, and a job's ``priority`` sets its share.  Finished jobs
+    are forgotten ``retention_seconds`` after they complete.
+    """
+
+    _STOP_FLOW = "__stop__"
+
+    def __init__(
+        self,
+        orchestrator: VerificationOrchestrator,
+        *,
+        workers: int = 1,
+        retention_seconds: float = 3600.0,
+        scheduler: Optional[FairShareScheduler] = None,
+    ) -> None:
+        self.orchestrator = orchestrator
+        self.retention_seconds = retention_seconds
+        self._tasks: FairShareScheduler = scheduler if scheduler is not None else FairShareScheduler()
+        self._jobs: Dict[str, ServiceJob] = {}
+        self._jobs_lock = threading.Lock()
+        self._threads = [
+            threading.Thread(target=self._work, name=f"verification-service-{index}", daemon=True)
+            for index in range(max(1, workers))
+        ]
+        self._started = False
+
+    def start(self) -> None:
+        if self._started:
+            return
+        self._started = True
+        self.orchestrator.start_warm_up()
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self) -> None:
+        if not self._started:
+            return
+        for _ in self._threads:
+            self._tasks.put(None, flow=self._STOP_FLOW, deadline=0.0)
+        for thread in self._threads:
+            thread.join()
+
+    def submit(
+        self,
+        leads: Sequence[LeadInput],
+        *,
+        priority: int = 0,
+        deadline: Optional[float] = None,
+        weight: Optional[float] = None,
+    ) -> ServiceJob:
+        """Queue ``leads`` as one job.
+
+        ``priority`` and ``deadline`` apply to every lead unless a lead's
+        metadata carries its own ``priority``, ``deadline`` or ``deadline_seconds``.
+        ``weight`` defaults to :func:`~lead_verifier.scheduling.priority_weight`
+        of the job priority.
+        """
+
+        schedule = [
+            (parse_priority(lead.metadata.get("priority"), default=priority), parse_deadline(lead.metadata) or deadline)
+            for lead in leads
+        ]
+        job = ServiceJob(
+            id=uuid.uuid4().hex[:12],
+            total=len(leads),
+            priority=priority,
+            deadline=deadline,
+            weight=weight if weight is not None else priority_weight(priority),
+        )
+        with self._jobs_lock:
+            self._prune()
+            self._jobs[job.id] = job
+        for position, (lead, (lead_priority, lead_deadline)) in enumerate(zip(leads, schedule)):
+            self._tasks.put(
+                _Task(job=job, position=position, lead=lead),
+                flow=job.id,
+                weight=job.weight,
+                priority=lead_priority,
+                deadline=lead_deadline,
+            )
+        LOGGER.info("Accepted job %s with %s leads", job.id, job.total)
+        return job
+
+    def job(self, job_id: str) -> ServiceJob:
+        with self._jobs_lock:
+            return self._jobs[job_id]
+
+    def job_status(self, job: ServiceJob) -> Dict[str, Any]:
+        return {**job.status(), "queued": self._tasks.qsize(job.id)}
+
+    def jobs(self) -> List[ServiceJob]:
+        with self._jobs_lock:
+            return list(self._jobs.values())
+
+    @property
+    def queued(self) -> int:
+        return self._tasks.qsize()
+
+    def _prune(self) -> None:
+        cutoff = time.time() - self.retention_seconds
+        for job_id in [job_id for job_id, job in self._jobs.items() if job.finished_at and job.finished_at < cutoff]:
+            del self._jobs[job_id]
+
+    def _work(self) -> None:
+        while True:
+            task = self._tasks.get()
+            if task is None:
+                return
+            task.job.mark_started()
+            try:
+                result = self.orchestrator.verify(
+                    [task.lead], partial_callback=lambda partial: task.job.set_partial(task.position, partial)
+                )[0]
+            except Exception as exc:  # pragma: no cover - defensive programming
+                LOGGER.exception("Verification failed for lead %s of job %s", task.position, task.job.id)
+                result = AggregatedLeadResult(
+                    lead=task.lead,
+                    contacts=[],
+                    raw_results=[LeadVerification(source="service", contacts=[], raw_data={"error": str(exc)})],
+                )
+            task.job.add(task.position, result)
+
+
+class VerificationServer:
+    """HTTP front end for :class:`VerificationService`.
+
+    ``POST /jobs`` accepts ``{"leads": [...]}`` (or a bare list), optionally
+    with a ``priority`` and a ``deadline``/``deadline_seconds``, and answers
+    ``202`` with the job id.  An optional ``weight`` overrides the job's fair
+    share.  ``GET /jobs`` lists active jobs, ``GET /jobs/<id>`` reports
+    progress, an ETA and the contacts found so far for leads still being
+    verified (``in_progress``), and ``GET /jobs/<id>/results`` streams ``{"position": ..., "result": ...}``
+    lines as NDJSON while the job runs, closing the response when it finishes.
+    """
+
+    def __init__(
+        self,
+        orchestrator: VerificationOrchestrator,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        workers: int = 1,
+        retention_seconds: float = 3600.0,
+    ) -> None:
+        self.service = VerificationService(orchestrator, workers=workers, retention_seconds=retention_seconds)
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "VerificationServer":
+        self.service.start()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, name="verification-server", daemon=True)
+            self._thread.start()
+            LOGGER.info("Verification service listening on %s", self.base_url)
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve on the calling thread until interrupted."""
+
+        self.service.start()
+        LOGGER.info("Verification service listening on %s", self.base_url)
+        self._server.serve_forever()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+        self.service.stop()
+
+    def __enter__(self) -> "VerificationServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, exc_tb) -> None:
+        self.stop()
+
+    # ------------------------------------------------------------------
+    def _handler_class(self):
+        service = self.service
+
+        class _ServiceHandler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:  # noqa: N802 - http.server naming
+                if urlsplit(self.path).path.rstrip("/") != "/jobs":
+                    self._send_json(404, {"error": "Not found"})
+                    return
+                try:
+                    length = int(self.headers.get("Content-Length") or 0)
+                    payload = json.loads(self.rfile.read(length) or b"null")
+                    options = payload if isinstance(payload, dict) else {}
+                    items = options.get("leads") if isinstance(payload, dict) else payload
+                    if not isinstance(items, list):
+                        raise ValueError("Expected a JSON list of leads or an object with a 'leads' list")
+                    leads = [lead_from_payload(item) for item in items]
+                    weight = options.get("weight")
+                    if weight is not None and float(weight) <= 0:
+                        raise ValueError("weight must be positive")
+                    job = service.submit(
+                        leads,
+                        priority=parse_priority(options.get("priority")),
+                        deadline=parse_deadline(options),
+                        weight=float(weight) if weight is not None else None,
+                    )
+                except (TypeError, ValueError) as exc:
+                    self._send_json(400, {"error": str(exc)})
+                    return
+                self._send_json(
+                    202,
+                    {
+                        **service.job_status(job),
+                        "status_url": f"/jobs/{job.id}",
+                        "results_url": f"/jobs/{job.id}/results",
+                    },
+                )
+
+            def do_GET(self) -> None:  # noqa: N802 - http.server naming
+                parts = [part for part in urlsplit(self.path).path.split("/") if part]
+                if parts == ["health"]:
+                    self._send_json(200, {"status": "ok", "queued": service.queued})
+                    return
+                if parts == ["jobs"]:
+                    self._send_json(
+                        200, {"jobs": [service.job_status(job) for job in service.jobs() if not job.finished]}
+                    )
+                    return
+                if len(parts) < 2 or parts[0] != "jobs" or len(parts) > 3:
+                    self._send_json(404, {"error": "Not found"})
+                    return
+                try:
+                    job = service.job(parts[1])
+                except KeyError:
+                    self._send_json(404, {"error": f"Unknown job {parts[1]}"})
+                    return
+                if len(parts) == 2:
+                    self._send_json(200, service.job_status(job))
+                elif parts[2] == "results":
+                    self._stream_results(job)
+                else:
+                    self._send_json(404, {"error": "Not found"})
+
+            def _stream_results(self, job: ServiceJob) -> None:
+                self.send_response(200)
+                self.send_header("Content-Type", "application/x-ndjson")
+                self.send_header("Cache-Control", "no-cache")
+                self.end_headers()
+                try:
+                    for position, result in job.iter_results():
+                        line = json.dumps({"position": position, "result": aggregated_to_dict(result)}, default=str)
+                        self.wfile.write(line.encode("utf-8") + b"\n")
+                        self.wfile.flush()
+                except (BrokenPipeError, ConnectionResetError):
+                    LOGGER.debug("Client stopped reading results for job %s", job.id)
+
+            def _send_json(self, status: int, payload: Dict[str, Any]) -> None:
+                body = json.dumps(payload, default=str).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:  # noqa: A002 - signature from base class
+                LOGGER.debug("service %s - %s", self.address_string(), format % args)
+
+        return _ServiceHandler
+
+
+__all__ = ["ServiceJob", "VerificationServer", "VerificationService", "lead_from_payload"]
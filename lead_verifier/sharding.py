@@ -0,0 +1,75 @@
+"""Partition leads into stable shards and merge per-shard results back into input order."""
+from __future__ import annotations
+
+import hashlib
+import heapq
+from dataclasses import dataclass
+from typing import Iterable, List, Sequence, Tuple, TypeVar
+
+from .models import LeadInput
+
+_T = TypeVar("_T")
+
+
+@dataclass(frozen=True)
+class ShardSpec:
+    """One shard out of ``count``; ``index`` is zero-based."""
+
+    index: int
+    count: int
+
+    def __post_init__(self) -> None:
+        if self.count < 1 or not 0 <= self.index < self.count:
+            raise ValueError(f"Invalid shard {self.index + 1}/{self.count}")
+
+    def __str__(self) -> str:
+        return f"{self.index + 1}/{self.count}"
+
+
+def parse_shard_spec(text: str) -> ShardSpec:
+    """Parse a one-based ``"i/N"`` shard specification such as ``"2/8"``."""
+
+    number, separator, count = text.partition("/")
+    try:
+        if not separator:
+            raise ValueError
+        return ShardSpec(index=int(number) - 1, count=int(count))
+    except ValueError:
+        raise ValueError(f"Shard must look like 'i/N' with 1 <= i <= N, got '{text}'") from None
+
+
+def shard_key(lead: LeadInput) -> str:
+    """Return the identity used to place ``lead``; duplicate rows land on the same shard."""
+
+    if lead.source_id:
+        return f"id:{lead.source_id}"
+    parts = [
+        lead.name or " ".join(filter(None, [lead.first_name, lead.last_name])),
+        lead.city,
+        lead.state,
+        lead.phone,
+        lead.email,
+    ]
+    return "|".join(" ".join(str(part or "").lower().split()) for part in parts)
+
+
+def shard_for(lead: LeadInput, count: int) -> int:
+    """Return the zero-based shard of ``lead``, stable across processes and runs."""
+
+    digest = hashlib.sha1(shard_key(lead).encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % count
+
+
+def select_shard(leads: Sequence[LeadInput], spec: ShardSpec) -> List[Tuple[int, LeadInput]]:
+    """Return ``(input position, lead)`` pairs belonging to ``spec``."""
+
+    return [(position, lead) for position, lead in enumerate(leads) if shard_for(lead, spec.count) == spec.index]
+
+
+def merge_in_input_order(parts: Iterable[Iterable[Tuple[int, _T]]]) -> List[_T]:
+    """Merge per-shard ``(input position, item)`` lists, each already in input order."""
+
+    return [item for _, item in heapq.merge(*parts, key=lambda pair: pair[0])]
+
+
+__all__ = ["ShardSpec", "merge_in_input_order", "parse_shard_spec", "select_shard", "shard_for", "shard_key"]
@@ -15,6 +15,7 @@ from dataclasses import dataclass
 from tkinter import filedialog, messagebox, ttk
 from typing import Callable, Dict, Iterable, List, Optional
 
+from ..cancellation import CancellationToken, Cancelled, cancellation_scope
 from ..config import ConfigurationError, load_configuration
 from ..factory import build_scrapers
 from ..io import write_results
@@ -151,6 +152,7 @@ def run_verification_job(
     cancel_event: Optional[threading.Event] = None,
     progress_callback: Optional[Callable[[int, int], None]] = None,
     result_callback: Optional[Callable[[AggregatedLeadResult], None]] = None,
+    partial_callback: Optional[Callable[[AggregatedLeadResult], None]] = None,
 ) -> List[AggregatedLeadResult]:
     lead_rows = list(rows)
     leads = [normalise_lead_row(row, mapping) for row in lead_rows]
@@ -162,17 +164,21 @@ def run_verification_job(
             progress_callback(0, 0)
         return aggregated_results
 
-    for index, lead in enumerate(leads, start=1):
-        if cancel_event and cancel_event.is_set():
-            break
-        aggregated = orchestrator.verify([lead])[0]
-        aggregated_results.append(aggregated)
-        if result_callback:
-            result_callback(aggregated)
-        if progress_callback:
-            progress_callback(index, total)
-        if cancel_event and cancel_event.is_set():
-            break
+    # Share the cancel event with the scrapers so a cancel also interrupts the lead in progress.
+    token = CancellationToken(event=cancel_event) if cancel_event is not None else None
+    with cancellation_scope(token):
+        for index, lead in enumerate(leads, start=1):
+            if token is not None and token.cancelled:
+                break
+            try:
+                aggregated = orchestrator.verify([lead], partial_callback=partial_callback)[0]
+            except Cancelled:
+                break
+            aggregated_results.append(aggregated)
+            if result_callback:
+                result_callback(aggregated)
+            if progress_callback:
+                progress_callback(index, total)
 
     return aggregated_results
 
@@ -319,7 +325,8 @@ class LeadVerifierApp:
 
         ttk.Button(frame, text="Start", command=self.start_verification).grid(row=2, column=0, padx=4, pady=4, sticky="w")
         ttk.Button(frame, text="Cancel", command=self.cancel_verification).grid(row=2, column=1, padx=4, pady=4, sticky="w")
-        ttk.Button(frame, text="Clear results", command=self.clear_results).grid(row=2, column=2, padx=4, pady=4, sticky="e")
+        ttk.Button(frame, text="Resolve CAPTCHAs", command=self.resolve_captchas).grid(row=2, column=2, padx=4, pady=4, sticky="w")
+        ttk.Button(frame, text="Clear results", command=self.clear_results).grid(row=2, column=3, padx=4, pady=4, sticky="e")
 
     # ------------------------------------------------------------------
     def _build_results_section(self, parent: ttk.Frame) -> None:
@@ -356,6 +363,7 @@ class LeadVerifierApp:
         path = filedialog.askopenfilename(filetypes=[("Spreadsheets", "*.csv *.xlsx *.xls"), ("CSV", "*.csv"), ("Excel", "*.xlsx *.xls"), ("All files", "*.*")])
         if not path:
             return
+        self.orchestrator.start_warm_up()
         try:
             rows = load_rows_from_file(path)
         except Exception as exc:  # pragma: no cover - GUI surface
@@ -412,6 +420,9 @@ class LeadVerifierApp:
         def result_callback(result: AggregatedLeadResult) -> None:
             self.event_queue.put(("result", result))
 
+        def partial_callback(result: AggregatedLeadResult) -> None:
+            self.event_queue.put(("partial", result))
+
         def worker() -> List[AggregatedLeadResult]:
             try:
                 results = run_verification_job(
@@ -421,6 +432,7 @@ class LeadVerifierApp:
                     cancel_event=self._cancel_event,
                     progress_callback=progress_callback,
                     result_callback=result_callback,
+                    partial_callback=partial_callback,
                 )
             except Exception as exc:  # pragma: no cover - GUI surface
                 self.event_queue.put(("error", exc))
@@ -432,6 +444,28 @@ class LeadVerifierApp:
         self.current_task = self._executor.submit(worker)
         self.status_var.set("Verification running...")
 
+    # ------------------------------------------------------------------
+    def resolve_captchas(self) -> None:
+        pending = len(self.orchestrator.attention_queue)
+        if not pending:
+            messagebox.showinfo("Nothing to resolve", "No leads are waiting on a CAPTCHA.")
+            return
+        if self.current_task and not self.current_task.done():
+            messagebox.showinfo("Job running", "Resolve CAPTCHAs once the current job has finished.")
+            return
+
+        def worker() -> List[AggregatedLeadResult]:
+            try:
+                updated = self.orchestrator.resolve_deferred()
+            except Exception as exc:  # pragma: no cover - GUI surface
+                self.event_queue.put(("error", exc))
+                return []
+            self.event_queue.put(("resolved", updated))
+            return updated
+
+        self.status_var.set(f"Resolving {pending} deferred leads...")
+        self.current_task = self._executor.submit(worker)
+
     # ------------------------------------------------------------------
     def cancel_verification(self) -> None:
         if self.current_task and not self.current_task.done():
@@ -486,6 +520,15 @@ class LeadVerifierApp:
         messagebox.showinfo("Export complete", f"Results exported to {path}")
 
     # ------------------------------------------------------------------
+    def _show_result(self, result: AggregatedLeadResult) -> None:
+        """Add ``result`` to the table, replacing the partial row of the same lead."""
+
+        if self.result_rows and self.result_rows[-1].lead is result.lead:
+            self.result_rows[-1] = result
+        else:
+            self.result_rows.append(result)
+        self.refresh_result_table()
+
     def _poll_queue(self) -> None:
         try:
             while True:
@@ -506,10 +549,9 @@ class LeadVerifierApp:
             else:
                 self.progress_var.set(0.0)
             self.status_var.set(f"Processing lead {current} of {total}")
-        elif kind == "result":
+        elif kind in {"partial", "result"}:
             _, result = event
-            self.result_rows.append(result)
-            self.refresh_result_table()
+            self._show_result(result)
         elif kind == "error":
             _, exc = event
             messagebox.showerror("Verification failed", str(exc))
@@ -522,10 +564,21 @@ class LeadVerifierApp:
             if cancelled:
                 self.status_var.set("Verification cancelled")
             elif self.status_var.get() not in {"Verification failed", "Error starting verification"}:
-                self.status_var.set("Verification finished")
+                pending = len(self.orchestrator.attention_queue)
+                if pending:
+                    self.status_var.set(f"Verification finished - {pending} leads need CAPTCHA attention")
+                else:
+                    self.status_var.set("Verification finished")
             self.current_task = None
             self._cancel_event = None
             self.progress_var.set(100.0 if self.result_rows else 0.0)
+        elif kind == "resolved":
+            _, updated = event
+            self.refresh_result_table()
+            pending = len(self.orchestrator.attention_queue)
+            message = f"Resolved {len(updated)} deferred leads"
+            self.status_var.set(f"{message} - {pending} still need attention" if pending else message)
+            self.current_task = None
 
     # ------------------------------------------------------------------
     def refresh_result_table(self) -> None:
@@ -0,0 +1,92 @@
+"""Benchmark contact normalisation over millions of synthetic contacts.
+
+The previous merge keys (phone digits via a per-character comprehension,
+lower-cased emails) are timed against :mod:`lead_verifier.normalise`, both
+one value at a time and through the memoising batch API.  The contacts
+repeat at ``--distinct`` values, as they do when several scrapers report the
+same numbers, and the number of distinct keys each approach produces shows
+how many more duplicates the canonical forms merge.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List, Sequence, Tuple
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+if str(BASE_DIR) not in sys.path:
+    sys.path.insert(0, str(BASE_DIR))
+
+from lead_verifier.normalise import normalise_contact_value, normalise_contacts  # noqa: E402  (import after path fix)
+
+Contact = Tuple[str, str]
+
+PHONE_FORMATS = ["({a}) {b}-{c}", "{a}-{b}-{c}", "1-{a}-{b}-{c}", "+1 {a} {b} {c}", "{a}.{b}.{c} ext. 12"]
+EMAIL_FORMATS = ["{user}@gmail.com", "{dotted}@gmail.com", "{user}+leads@gmail.com", "{user}@Example.com"]
+
+
+def parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Time contact normalisation on synthetic contacts.")
+    parser.add_argument("--contacts", type=int, default=2_000_000, help="Contacts to normalise")
+    parser.add_argument("--distinct", type=int, default=200_000, help="Distinct people behind the contacts")
+    parser.add_argument("--seed", type=int, default=7)
+    return parser.parse_args(argv)
+
+
+def synthetic_contacts(count: int, distinct: int, seed: int) -> List[Contact]:
+    rng = random.Random(seed)
+    contacts: List[Contact] = []
+    for _ in range(count):
+        person = rng.randrange(distinct)
+        if rng.random() < 0.6:
+            digits = f"{303 + person % 600:03d}{person % 10_000_000:07d}"
+            template = rng.choice(PHONE_FORMATS)
+            contacts.append(("phone", template.format(a=digits[:3], b=digits[3:6], c=digits[6:])))
+        else:
+            user = f"lead{person}"
+            template = rng.choice(EMAIL_FORMATS)
+            contacts.append(("email", template.format(user=user, dotted=".".join(user))))
+    return contacts
+
+
+def legacy_key(contact_type: str, value: str) -> str:
+    value = value.strip()
+    if contact_type.lower() == "email":
+        return value.lower()
+    if contact_type.lower() == "phone":
+        digits = [c for c in value if c.isdigit()]
+        return "".join(digits)
+    return value.lower()
+
+
+def time_keys(function: Callable[[List[Contact]], List[str]], contacts: List[Contact]) -> Tuple[float, int]:
+    started = time.perf_counter()
+    keys = function(contacts)
+    elapsed = time.perf_counter() - started
+    return elapsed, len(set(zip((contact_type for contact_type, _ in contacts), keys)))
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_args(argv if argv is not None else sys.argv[1:])
+    contacts = synthetic_contacts(args.contacts, args.distinct, args.seed)
+
+    approaches = [
+        ("legacy", lambda items: [legacy_key(*contact) for contact in items]),
+        ("normalise_contact_value", lambda items: [normalise_contact_value(*contact) for contact in items]),
+        ("normalise_contacts (batch)", normalise_contacts),
+    ]
+    print(f"{len(contacts):,} contacts from {args.distinct:,} people")
+    print(f"{'approach':<28} {'seconds':>8} {'contacts/s':>12} {'distinct keys':>14}")
+    for name, function in approaches:
+        elapsed, distinct = time_keys(function, contacts)
+        rate = len(contacts) / elapsed if elapsed else float("inf")
+        print(f"{name:<28} {elapsed:>8.2f} {rate:>12,.0f} {distinct:>14,}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
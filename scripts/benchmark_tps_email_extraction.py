@@ -0,0 +1,120 @@
+"""Benchmark TruePeopleSearch email extraction over saved result pages.
+
+Each page is loaded into a headless Chromium instance with ``page.set_content``
+so no network traffic is generated.  The targeted extraction script used by
+:class:`TruePeopleSearchScraper` is timed against the previous full-document
+scan and the per-page results are printed side by side.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Iterable, List, Sequence, Tuple
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+if str(BASE_DIR) not in sys.path:
+    sys.path.insert(0, str(BASE_DIR))
+
+from lead_verifier.scrapers.true_people_search import (  # noqa: E402  (import after path fix)
+    EMAIL_EXTRACTION_SCRIPT,
+    TruePeopleSearchScraper,
+)
+
+LEGACY_EXTRACTION_SCRIPT = """
+(desc) => {
+    const elements = Array.from(document.querySelectorAll('*'));
+    const header = elements.find((node) => node.textContent.trim() === desc);
+    if (!header || !header.parentElement) {
+        return [];
+    }
+    const parent = header.parentElement;
+    const children = Array.from(parent.children).slice(1);
+    return children
+        .map((child) => child.textContent.trim())
+        .filter((value) => value.length > 0);
+}
+"""
+
+
+def parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Time TruePeopleSearch email extraction on saved pages.")
+    parser.add_argument(
+        "pages",
+        nargs="*",
+        type=Path,
+        help="Saved HTML pages or directories containing *.html files",
+    )
+    parser.add_argument("--iterations", type=int, default=20, help="Timed runs per page and script")
+    parser.add_argument(
+        "--synthetic-rows",
+        type=int,
+        default=5000,
+        help="Rows in the generated page used when no saved pages are supplied",
+    )
+    return parser.parse_args(argv)
+
+
+def iter_pages(paths: Iterable[Path]) -> List[Tuple[str, str]]:
+    pages: List[Tuple[str, str]] = []
+    for path in paths:
+        candidates = sorted(path.glob("*.html")) if path.is_dir() else [path]
+        for candidate in candidates:
+            pages.append((candidate.name, candidate.read_text(encoding="utf-8", errors="replace")))
+    return pages
+
+
+def synthetic_page(rows: int) -> str:
+    filler = "".join(
+        f"<div class='card-summary'><div class='h4'>Person {index}</div>"
+        f"<span>Age {20 + index % 60}</span><span>Lived in City {index}</span></div>"
+        for index in range(rows)
+    )
+    section = (
+        "<div class='row'><div class='h5'>Email Addresses</div>"
+        "<div>first@example.com</div><div>second@example.com</div></div>"
+    )
+    return f"<html><body>{filler}{section}{filler}</body></html>"
+
+
+def time_script(page, script: str, title: str, iterations: int) -> Tuple[float, List[str]]:
+    emails = page.evaluate(script, title)
+    timings: List[float] = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        page.evaluate(script, title)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1000, emails
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_args(argv if argv is not None else sys.argv[1:])
+    pages = iter_pages(args.pages)
+    if not pages:
+        pages = [(f"synthetic-{args.synthetic_rows}-rows", synthetic_page(args.synthetic_rows))]
+
+    from playwright.sync_api import sync_playwright
+
+    title = TruePeopleSearchScraper.EMAIL_SECTION_TITLE
+    print(f"{'page':<40} {'legacy ms':>10} {'targeted ms':>12} {'speedup':>8}  match")
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(headless=True)
+        try:
+            page = browser.new_page()
+            for name, html in pages:
+                page.set_content(html, wait_until="domcontentloaded")
+                legacy_ms, legacy_emails = time_script(page, LEGACY_EXTRACTION_SCRIPT, title, args.iterations)
+                targeted_ms, targeted_emails = time_script(page, EMAIL_EXTRACTION_SCRIPT, title, args.iterations)
+                speedup = legacy_ms / targeted_ms if targeted_ms else float("inf")
+                match = "yes" if legacy_emails == targeted_emails else "NO"
+                print(f"{name[:40]:<40} {legacy_ms:>10.2f} {targeted_ms:>12.2f} {speedup:>7.1f}x  {match}")
+        finally:
+            browser.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+"""Benchmark the browser scrapers end to end against the local replay server.
+
+The replay server answers FastPeopleSearch and TruePeopleSearch URL patterns
+with recorded result, not-found, and CAPTCHA pages using a configurable
+latency and outcome distribution, so throughput can be measured repeatably
+without hitting the live sites.  ``--serve`` runs the server on its own for
+manual testing.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import List, Sequence
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+if str(BASE_DIR) not in sys.path:
+    sys.path.insert(0, str(BASE_DIR))
+
+from lead_verifier.models import LeadInput  # noqa: E402  (import after path fix)
+from lead_verifier.orchestrator import VerificationOrchestrator  # noqa: E402
+from lead_verifier.page_cache import PageCache  # noqa: E402
+from lead_verifier.replay import ReplayProfile, ReplayServer, load_replay_pages  # noqa: E402
+
+LOGGER = logging.getLogger(__name__)
+
+
+def parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run scrapers against the local replay server.")
+    parser.add_argument("--leads", type=int, default=50, help="Number of synthetic leads to verify")
+    parser.add_argument(
+        "--scraper",
+        choices=["fast_people_search", "true_people_search", "both"],
+        default="both",
+        help="Which scrapers to benchmark",
+    )
+    parser.add_argument("--pages", type=Path, help="Directory of recorded pages (<site>/<outcome>/*.html)")
+    parser.add_argument("--page-cache", type=Path, help="Page cache directory to serve recorded results from")
+    parser.add_argument("--result-weight", type=float, default=0.6)
+    parser.add_argument("--not-found-weight", type=float, default=0.3)
+    parser.add_argument("--captcha-weight", type=float, default=0.05)
+    parser.add_argument("--error-weight", type=float, default=0.05)
+    parser.add_argument(
+        "--latency",
+        type=float,
+        nargs=2,
+        default=(0.05, 0.25),
+        metavar=("MIN", "MAX"),
+        help="Uniform response latency range in seconds",
+    )
+    parser.add_argument("--seed", type=int, default=1234, help="Random seed for outcomes and latency")
+    parser.add_argument("--port", type=int, default=0, help="Port to bind (default: any free port)")
+    parser.add_argument("--serve", action="store_true", help="Only run the replay server until interrupted")
+    parser.add_argument("--headful", action="store_true", help="Show browser windows")
+    parser.add_argument("--log-level", default="WARNING")
+    return parser.parse_args(argv)
+
+
+def build_scrapers(args: argparse.Namespace, base_url: str) -> List:
+    scrapers: List = []
+    if args.scraper in {"fast_people_search", "both"}:
+        from lead_verifier.scrapers.fast_people_search import FastPeopleSearchConfig, FastPeopleSearchScraper
+
+        scrapers.append(
+            FastPeopleSearchScraper(
+                FastPeopleSearchConfig(base_url=base_url, headless=not args.headful, wait_timeout_seconds=5.0)
+            )
+        )
+    if args.scraper in {"true_people_search", "both"}:
+        from lead_verifier.scrapers.true_people_search import TruePeopleSearchScraper
+
+        scrapers.append(
+            TruePeopleSearchScraper({"base_url": base_url, "headless": not args.headful, "throttle_seconds": 0.0})
+        )
+    return scrapers
+
+
+def synthetic_leads(count: int) -> List[LeadInput]:
+    return [
+        LeadInput(
+            name=f"Lead{index} Example",
+            first_name=f"Lead{index}",
+            last_name="Example",
+            metadata={"city": "Portland", "state": "OR"},
+        )
+        for index in range(count)
+    ]
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_args(argv if argv is not None else sys.argv[1:])
+    logging.basicConfig(level=getattr(logging, args.log_level.upper(), logging.WARNING))
+
+    profile = ReplayProfile(
+        result_weight=args.result_weight,
+        not_found_weight=args.not_found_weight,
+        captcha_weight=args.captcha_weight,
+        error_weight=args.error_weight,
+        latency_seconds=tuple(args.latency),
+        seed=args.seed,
+    )
+    server = ReplayServer(
+        profile=profile,
+        pages=load_replay_pages(args.pages) if args.pages else None,
+        page_cache=PageCache(args.page_cache) if args.page_cache else None,
+        port=args.port,
+    )
+
+    with server:
+        if args.serve:
+            print(f"Replay server listening on {server.base_url} (Ctrl+C to stop)")
+            try:
+                while True:
+                    time.sleep(3600)
+            except KeyboardInterrupt:
+                return 0
+
+        scrapers = build_scrapers(args, server.base_url)
+        orchestrator = VerificationOrchestrator(scrapers)
+        leads = synthetic_leads(args.leads)
+        started = time.perf_counter()
+        try:
+            results = orchestrator.verify(leads)
+        finally:
+            for scraper in scrapers:
+                close = getattr(scraper, "close", None)
+                if callable(close):
+                    close()
+        elapsed = time.perf_counter() - started
+
+    contacts = sum(len(result.contacts) for result in results)
+    print(f"Verified {len(results)} leads with {len(scrapers)} scrapers in {elapsed:.2f}s")
+    print(f"Throughput: {len(results) / elapsed:.2f} leads/s, {contacts} contacts found")
+    for (site, outcome), count in sorted(server.stats.items()):
+        print(f"  {site:<20} {outcome:<10} {count}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""Tests for batched ``verify_many`` execution."""
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from lead_verifier.batching import MicroBatcher
+from lead_verifier.cancellation import CancellationToken, cancellation_scope
+from lead_verifier.models import LeadInput, LeadVerification
+from lead_verifier.orchestrator import VerificationOrchestrator
+from lead_verifier.rate_limit import RateLimitedScraper
+from lead_verifier.result_cache import CachedScraper, ResultCache
+from lead_verifier.scrapers.sample import EchoScraper
+
+
+class CountingEchoScraper(EchoScraper):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches = []
+
+    def verify_many(self, leads):
+        self.batches.append([lead.name for lead in leads])
+        return super().verify_many(leads)
+
+
+def test_orchestrator_sends_prefetched_leads_in_full_batches() -> None:
+    inner = CountingEchoScraper()
+    orchestrator = VerificationOrchestrator([RateLimitedScraper(inner, display_name="echo")], batch_size=2)
+    leads = [LeadInput(name=f"Lead {index}", phone=f"555-010{index}") for index in range(5)]
+
+    results = orchestrator.verify(leads)
+    orchestrator.close()
+
+    assert inner.batches == [["Lead 0", "Lead 1"], ["Lead 2", "Lead 3"], ["Lead 4"]]
+    assert [result.contacts[0].value for result in results] == [lead.phone for lead in leads]
+
+
+def test_micro_batcher_groups_concurrent_callers() -> None:
+    inner = CountingEchoScraper()
+    batcher = MicroBatcher(inner, batch_size=10, linger_seconds=0.2)
+    barrier = threading.Barrier(3)
+    results = {}
+
+    def call(name: str) -> None:
+        barrier.wait()
+        results[name] = batcher.verify(LeadInput(name=name, email=f"{name}@example.com"))
+
+    threads = [threading.Thread(target=call, args=(name,)) for name in ("a", "b", "c")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    batcher.close()
+
+    assert batcher.batches_sent == 1 and sorted(inner.batches[0]) == ["a", "b", "c"]
+    assert results["b"].contacts[0].value == "b@example.com"
+
+
+def test_cached_scraper_batches_only_cache_misses(tmp_path) -> None:
+    inner = CountingEchoScraper()
+    scraper = CachedScraper(inner, ResultCache(tmp_path / "cache.sqlite3", positive_ttl_seconds=3600))
+    scraper.verify(LeadInput(name="Ada", phone="555-0100"))
+
+    results = scraper.verify_many([LeadInput(name="Ada"), LeadInput(name="Grace", phone="555-0101")])
+
+    assert inner.batches == [["Grace"]]
+    assert [result.contacts[0].value for result in results] == ["555-0100", "555-0101"]
+    assert "cached_at" in results[0].raw_data
+
+
+class FailingBatchScraper(CountingEchoScraper):
+    def verify_many(self, leads):
+        time.sleep(0.05)
+        super().verify_many(leads)
+        raise RuntimeError("service down")
+
+
+def test_aborted_runs_drop_prefetched_leads_from_the_batcher() -> None:
+    inner = FailingBatchScraper()
+    orchestrator = VerificationOrchestrator([inner], batch_size=2, raise_on_error=True)
+
+    with pytest.raises(RuntimeError):
+        orchestrator.verify([LeadInput(name=f"Lead {index}") for index in range(20)])
+    time.sleep(0.3)
+    orchestrator.close()
+
+    assert 1 <= len(inner.batches) <= 2
+
+
+def test_batches_are_not_sent_for_cancelled_callers() -> None:
+    inner = CountingEchoScraper()
+    batcher = MicroBatcher(inner, batch_size=10, linger_seconds=0.1)
+    token = CancellationToken()
+
+    with cancellation_scope(token):
+        future = batcher.submit(LeadInput(name="a"))
+    token.cancel()
+    batcher.close()
+
+    assert future.cancelled() and inner.batches == []
@@ -0,0 +1,117 @@
+"""Tests for :mod:`lead_verifier.budget`."""
+from __future__ import annotations
+
+import csv
+import time
+
+import pytest
+
+from lead_verifier.budget import LatencyTracker, TimeBudget
+from lead_verifier.io import write_results
+from lead_verifier.models import ContactDetail, LeadInput, LeadVerification
+from lead_verifier.orchestrator import VerificationOrchestrator
+from lead_verifier.pipeline import VerificationPipeline
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TimedScraper:
+    def __init__(self, name: str, seconds: float, *, finds: bool) -> None:
+        self.name = name
+        self.seconds = seconds
+        self.finds = finds
+
+    def verify(self, lead: LeadInput) -> LeadVerification:
+        time.sleep(self.seconds)
+        contacts = [ContactDetail(type="phone", value="555-0100")] if self.finds else []
+        return LeadVerification(source=self.name, contacts=contacts)
+
+
+def test_latency_tracker_smooths_latency_and_hit_rate() -> None:
+    tracker = LatencyTracker(alpha=0.5)
+    tracker.record("fps", 2.0, found=True)
+    tracker.record("fps", 4.0, found=False)
+
+    assert tracker.latency("fps") == 3.0
+    assert tracker.hit_rate("fps") == 0.5
+    assert tracker.latency("tps") is None
+
+
+def test_plan_drops_low_value_scrapers_as_the_deadline_nears() -> None:
+    clock = FakeClock()
+    budget = TimeBudget(100, clock=clock)
+    tracker = LatencyTracker()
+    tracker.record("cheap", 1.0, found=True)
+    tracker.record("slow", 10.0, found=True)
+
+    assert budget.plan(["cheap", "slow", "new"], tracker, leads_left=5) == {}
+
+    clock.now = 60
+    skip = budget.plan(["cheap", "slow", "new"], tracker, leads_left=4)
+    assert list(skip) == ["slow"]
+    assert budget.plan(["cheap", "slow"], tracker, leads_left=4, concurrent=True) == {}
+
+    clock.now = 100
+    assert set(budget.plan(["cheap", "slow"], tracker)) == {"cheap", "slow"}
+    assert budget.expired()
+
+
+def test_plan_keeps_the_best_scraper_while_it_can_finish() -> None:
+    clock = FakeClock()
+    budget = TimeBudget(10, clock=clock)
+    tracker = LatencyTracker()
+    tracker.record("only", 2.0, found=True)
+
+    assert budget.plan(["only"], tracker, leads_left=100) == {}
+    clock.now = 9
+    assert "only" in budget.plan(["only"], tracker, leads_left=100)
+
+
+def test_time_budget_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        TimeBudget(0)
+
+
+def test_orchestrator_skips_slow_scrapers_within_budget() -> None:
+    orchestrator = VerificationOrchestrator(
+        [TimedScraper("quick", 0.0, finds=False), TimedScraper("slow", 0.05, finds=True)], time_budget=0.3
+    )
+
+    results = orchestrator.verify([LeadInput(name=str(index)) for index in range(10)])
+
+    assert results[0].status == "complete"
+    assert results[1].status == "partial"
+    skipped = results[1].raw_results[1]
+    assert skipped.source == "slow" and skipped.raw_data["time_budget"]
+    assert orchestrator.latency.calls("slow") < 10
+
+
+def test_leads_left_when_the_budget_runs_out_are_marked_unprocessed(tmp_path) -> None:
+    orchestrator = VerificationOrchestrator([TimedScraper("slow", 0.05, finds=True)], time_budget=0.01)
+
+    results = orchestrator.verify([LeadInput(name=name) for name in ["a", "b", "c"]])
+
+    assert [result.status for result in results] == ["complete", "unprocessed", "unprocessed"]
+    output = tmp_path / "out.csv"
+    write_results(output, results)
+    with output.open(newline="") as handle:
+        assert [row["status"] for row in csv.DictReader(handle)] == ["complete", "unprocessed", "unprocessed"]
+
+
+def test_streaming_pipeline_shares_the_budget_across_the_known_total() -> None:
+    orchestrator = VerificationOrchestrator(
+        [TimedScraper("quick", 0.0, finds=False), TimedScraper("slow", 0.05, finds=True)], time_budget=0.3
+    )
+    written = []
+
+    VerificationPipeline(orchestrator, total=10).run((LeadInput(name=str(index)) for index in range(10)), written.append)
+
+    assert written[0].status == "complete"
+    assert written[1].status == "partial"
+    assert orchestrator._leads_left is None
@@ -0,0 +1,110 @@
+"""Tests for :mod:`lead_verifier.cancellation`."""
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from lead_verifier import cancellation
+from lead_verifier.cancellation import CancellationToken, Cancelled, cancellation_scope
+from lead_verifier.legacy_orchestrator import LeadVerifierOrchestrator
+from lead_verifier.models import LeadInput, LeadVerification, LeadVerificationResult
+from lead_verifier.orchestrator import VerificationOrchestrator
+from lead_verifier.pipeline import VerificationPipeline
+from lead_verifier.rate_limit import RateLimitedScraper, RateLimiter
+from lead_verifier.scrapers.sample import EchoScraper
+
+
+class StallingScraper:
+    """Answers leads numbered below ``stall_from`` at once and stalls on the rest."""
+
+    name = "stalling"
+
+    def __init__(self, stall_from: int) -> None:
+        self.stall_from = stall_from
+
+    def verify(self, lead: LeadInput) -> LeadVerification:
+        if int(lead.name) >= self.stall_from:
+            cancellation.sleep(30)
+        return LeadVerification(source=self.name)
+
+
+def _cancel_soon(token: CancellationToken, delay: float = 0.2) -> None:
+    threading.Timer(delay, token.cancel).start()
+
+
+def test_sleep_without_a_token_is_a_plain_sleep() -> None:
+    started = time.monotonic()
+    cancellation.sleep(0.01)
+    cancellation.check_cancelled()
+    assert time.monotonic() - started >= 0.01
+
+
+def test_cancel_interrupts_rate_limit_wait_and_keeps_finished_leads() -> None:
+    token = CancellationToken()
+    scraper = RateLimitedScraper(EchoScraper(), rate_limiter=RateLimiter(1))
+    orchestrator = VerificationOrchestrator([scraper], batch_size=1)
+    leads = [LeadInput(name=str(index)) for index in range(3)]
+
+    _cancel_soon(token)
+    started = time.monotonic()
+    with cancellation_scope(token), pytest.raises(Cancelled) as info:
+        orchestrator.verify(leads)
+
+    assert time.monotonic() - started < 1.0
+    assert [result.lead.name for result in info.value.results] == ["0"]
+
+
+def test_cancel_with_concurrent_leads_keeps_every_finished_lead() -> None:
+    token = CancellationToken()
+    orchestrator = VerificationOrchestrator([StallingScraper(stall_from=3)], lead_concurrency=3)
+
+    _cancel_soon(token)
+    with cancellation_scope(token), pytest.raises(Cancelled) as info:
+        orchestrator.verify([LeadInput(name=str(index)) for index in range(6)])
+
+    assert [result.lead.name for result in info.value.results] == ["0", "1", "2"]
+
+
+def test_pipeline_flushes_completed_results_on_cancel() -> None:
+    token = CancellationToken()
+    pipeline = VerificationPipeline(VerificationOrchestrator([StallingScraper(stall_from=6)]), workers=2, queue_size=2)
+    written = []
+
+    _cancel_soon(token)
+    started = time.monotonic()
+    with cancellation_scope(token), pytest.raises(Cancelled):
+        pipeline.run((LeadInput(name=str(index)) for index in range(50)), written.append)
+
+    assert time.monotonic() - started < 1.0
+    assert pipeline.stats.cancelled
+    assert [result.lead.name for result in written] == [str(index) for index in range(6)]
+
+
+def test_legacy_task_cancel_reports_partial_results() -> None:
+    class LegacyStallingScraper:
+        name = "legacy"
+
+        def verify(self, lead: LeadInput) -> LeadVerificationResult:
+            if lead.name != "first":
+                cancellation.sleep(30)
+            return LeadVerificationResult(lead=lead, source=self.name, status="Verified")
+
+    completed = []
+    orchestrator = LeadVerifierOrchestrator([LegacyStallingScraper()])
+    task = orchestrator.verify_async(
+        [{"Name": "first"}, {"Name": "second"}, {"Name": "third"}],
+        {"name": "Name"},
+        completion_callback=completed.append,
+    )
+    time.sleep(0.1)
+    started = time.monotonic()
+    task.cancel()
+    results = task.result(timeout=1.0)
+
+    assert time.monotonic() - started < 1.0
+    assert task.cancelled()
+    assert [result.lead.name for result in results] == ["first"]
+    assert completed == [results]
+    orchestrator.shutdown()
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import time
+
 import pytest
 
 from lead_verifier.models import LeadInput
@@ -44,3 +46,110 @@ def test_build_search_url_without_name_data_raises() -> None:
         scraper._build_search_url(lead)
 
     assert "(Unnamed Lead)" in str(excinfo.value)
+
+
+class _FakeElement:
+    def __init__(self, text: str, *, container: "_FakeElement | None" = None) -> None:
+        self.text = text
+        self._container = container
+
+    def get_attribute(self, name: str) -> str:
+        return f"tel:{self.text}"
+
+    def find_element(self, by: str, value: str) -> "_FakeElement":
+        if self._container is None:
+            raise LookupError(value)
+        return self._container
+
+
+class _FakeDriver:
+    current_url = "https://www.fastpeoplesearch.com/name/Jane+Doe"
+    title = "Jane Doe"
+
+    def __init__(self, elements: list, *, not_found: bool = False) -> None:
+        self._elements = elements
+        self._not_found = not_found
+        self.implicit_waits: list[float] = []
+
+    def implicitly_wait(self, seconds: float) -> None:
+        self.implicit_waits.append(seconds)
+
+    def get(self, url: str) -> None:
+        self.current_url = url
+
+    def find_element(self, by: str, value: str) -> _FakeElement:
+        return self._elements[0]
+
+    def find_elements(self, by: str, value: str) -> list:
+        if value == FastPeopleSearchScraper.RESULT_SELECTOR:
+            return list(self._elements)
+        if value == FastPeopleSearchScraper.NOT_FOUND_XPATH and self._not_found:
+            return [_FakeElement("We could not find any records")]
+        return []
+
+    def quit(self) -> None:
+        pass
+
+
+def test_label_lookups_run_without_implicit_wait_and_report_misses() -> None:
+    pytest.importorskip("selenium")
+    header = _FakeElement("Jane Doe, Age 40")
+    labelled = _FakeElement("(555) 123-4567", container=_FakeElement("card", container=header))
+    unlabelled = _FakeElement("(555) 765-4321")
+    driver = _FakeDriver([labelled, unlabelled])
+    scraper = FastPeopleSearchScraper(driver_factory=lambda: driver)
+
+    verification = scraper.verify(LeadInput(first_name="Jane", last_name="Doe"))
+
+    assert driver.implicit_waits == [5.0, 0, 5.0, 0, 5.0]
+    labels = [contact.metadata.get("label") for contact in verification.contacts]
+    assert labels == ["Jane Doe, Age 40", None]
+    stats = verification.raw_data["metadata"]["lookup_stats"]
+    assert stats["lookups"] == 2
+    assert stats["failures"] == 1
+    assert scraper.lookup_stats.failures == 1
+
+
+def test_not_found_page_ends_wait_without_timeout() -> None:
+    pytest.importorskip("selenium")
+    driver = _FakeDriver([], not_found=True)
+    scraper = FastPeopleSearchScraper(driver_factory=lambda: driver)
+
+    started = time.monotonic()
+    verification = scraper.verify(LeadInput(first_name="Jane", last_name="Doe"))
+
+    assert time.monotonic() - started < 1.0
+    assert verification.contacts == []
+    assert verification.raw_data["metadata"]["page_state"] == "not_found"
+    assert verification.raw_data["errors"] == []
+
+
+def test_query_planner_stops_at_first_variant_with_matches() -> None:
+    pytest.importorskip("selenium")
+
+    class _PlannedDriver(_FakeDriver):
+        def __init__(self) -> None:
+            super().__init__([])
+            self.visited: list[str] = []
+
+        def get(self, url: str) -> None:
+            super().get(url)
+            self.visited.append(url)
+            self._not_found = url.endswith("/97201")
+            self._elements = [] if self._not_found else [_FakeElement("(555) 123-4567")]
+
+    driver = _PlannedDriver()
+    scraper = FastPeopleSearchScraper({"plan_queries": True}, driver_factory=lambda: driver)
+    lead = LeadInput(first_name="Jane", last_name="Doe", metadata={"city": "Portland", "state": "OR", "zip": "97201"})
+
+    verification = scraper.verify(lead)
+
+    assert driver.visited == [
+        "https://www.fastpeoplesearch.com/name/Jane+Doe/97201",
+        "https://www.fastpeoplesearch.com/name/Jane+Doe/Portland+OR",
+    ]
+    metadata = verification.raw_data["metadata"]
+    assert metadata["query_variant"] == "name_city_state"
+    assert [attempt["matches"] for attempt in metadata["query_attempts"]] == [0, 1]
+    assert verification.raw_data["not_found"] is False
+    assert [contact.value for contact in verification.contacts] == ["(555) 123-4567"]
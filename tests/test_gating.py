@@ -0,0 +1,158 @@
+"""Tests for cost-ordered, conditional scraper execution."""
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from lead_verifier.captcha import CaptchaDeferred
+from lead_verifier.config import ConfigurationError
+from lead_verifier.gating import build_execution_policy
+from lead_verifier.models import ContactDetail, LeadInput, LeadVerification
+from lead_verifier.orchestrator import VerificationOrchestrator
+
+
+class FixedScraper:
+    def __init__(self, name: str, *contacts: ContactDetail) -> None:
+        self.name = name
+        self.contacts = list(contacts)
+        self.calls = 0
+
+    def verify(self, lead: LeadInput) -> LeadVerification:
+        self.calls += 1
+        return LeadVerification(source=self.name, contacts=list(self.contacts))
+
+
+def _config(**extra):
+    return {
+        "scrapers": [
+            {"name": "tps", "class": "x.TPS", "cost": 10, "run_if_missing": "email"},
+            {"name": "fps", "class": "x.FPS", "cost": 1},
+            {"name": "other", "class": "x.Other", "cost": 10},
+        ],
+        **extra,
+    }
+
+
+def test_cheap_scrapers_run_first_and_gate_expensive_ones() -> None:
+    fps = FixedScraper("fps", ContactDetail(type="email", value="ada@example.com"))
+    tps = FixedScraper("tps", ContactDetail(type="phone", value="555-0100"))
+    other = FixedScraper("other")
+    orchestrator = VerificationOrchestrator([tps, fps, other], execution_policy=build_execution_policy(_config()))
+
+    result = orchestrator.verify([LeadInput(name="Ada")])[0]
+
+    assert (fps.calls, tps.calls, other.calls) == (1, 0, 1)
+    assert [raw.source for raw in result.raw_results] == ["tps", "fps", "other"]
+    assert result.raw_results[0].raw_data == {"skipped": True, "reason": "already found email"}
+
+
+def test_stop_condition_skips_remaining_tiers() -> None:
+    fps = FixedScraper("fps", ContactDetail(type="phone", value="(555) 010-0100"))
+    tps = FixedScraper("tps")
+    other = FixedScraper("other")
+    policy = build_execution_policy(_config(stop_when={"phone": 1}))
+    orchestrator = VerificationOrchestrator([tps, fps, other], execution_policy=policy, concurrent=True)
+
+    result = orchestrator.verify([LeadInput(name="Ada")])[0]
+
+    assert (fps.calls, tps.calls, other.calls) == (1, 0, 0)
+    assert all(raw.raw_data["skipped"] for raw in result.raw_results if raw.source != "fps")
+
+
+class LocatorScraper(FixedScraper):
+    def __init__(self) -> None:
+        super().__init__("locator", ContactDetail(type="zip", value="97201"))
+        self.done = threading.Event()
+
+    def verify(self, lead: LeadInput) -> LeadVerification:
+        threading.Event().wait(0.1)
+        self.done.set()
+        return super().verify(lead)
+
+
+class RecordingScraper(FixedScraper):
+    def __init__(self, name: str, locator: LocatorScraper) -> None:
+        super().__init__(name)
+        self.locator = locator
+        self.leads = []
+        self.locator_done_at_start = None
+
+    def verify(self, lead: LeadInput) -> LeadVerification:
+        self.locator_done_at_start = self.locator.done.is_set()
+        self.leads.append(lead)
+        return super().verify(lead)
+
+
+def test_dependents_receive_enriched_leads_while_independent_branches_run() -> None:
+    locator = LocatorScraper()
+    downstream = RecordingScraper("downstream", locator)
+    independent = RecordingScraper("independent", locator)
+    config = {
+        "scrapers": [
+            {"name": "downstream", "class": "x.D", "depends_on": "locator"},
+            {"name": "locator", "class": "x.L"},
+            {"name": "independent", "class": "x.I"},
+        ]
+    }
+    orchestrator = VerificationOrchestrator(
+        [downstream, locator, independent], execution_policy=build_execution_policy(config), concurrent=True
+    )
+
+    lead = LeadInput(name="Ada Lovelace", metadata={"city": "Portland"})
+    result = orchestrator.verify([lead])[0]
+
+    assert downstream.locator_done_at_start is True
+    assert independent.locator_done_at_start is False
+    assert downstream.leads[0].metadata == {"city": "Portland", "zip": "97201", "enriched_from": ["locator"]}
+    assert independent.leads[0] is lead and result.lead is lead
+    assert [raw.source for raw in result.raw_results] == ["downstream", "locator", "independent"]
+
+
+def test_policy_configuration() -> None:
+    assert build_execution_policy({"scrapers": [{"name": "fps", "class": "x.FPS"}]}) is None
+    with pytest.raises(ConfigurationError):
+        build_execution_policy({"scrapers": [{"class": "x.FPS", "cost": 1}]})
+    with pytest.raises(ConfigurationError):
+        build_execution_policy({"scrapers": [], "stop_when": {"phone": "one"}})
+    with pytest.raises(ConfigurationError, match="cycle"):
+        build_execution_policy(
+            {
+                "scrapers": [
+                    {"name": "a", "class": "x.A", "depends_on": "b"},
+                    {"name": "b", "class": "x.B", "depends_on": ["a"]},
+                ]
+            }
+        )
+    with pytest.raises(ConfigurationError, match="unknown"):
+        build_execution_policy({"scrapers": [{"name": "a", "class": "x.A", "depends_on": "missing"}]})
+
+
+class DeferringScraper(FixedScraper):
+    """Defers on a CAPTCHA once, then finds an email when resumed."""
+
+    def __init__(self) -> None:
+        super().__init__("downstream")
+        self.resumed_leads = []
+
+    def verify(self, lead: LeadInput) -> LeadVerification:
+        def resume() -> LeadVerification:
+            self.resumed_leads.append(lead)
+            return LeadVerification(source=self.name, contacts=[ContactDetail(type="email", value="ada@example.com")])
+
+        raise CaptchaDeferred("CAPTCHA presented", resume=resume)
+
+
+def test_deferred_dependents_are_merged_back_into_the_original_lead() -> None:
+    downstream = DeferringScraper()
+    config = {"scrapers": [{"name": "up", "class": "x.U"}, {"name": "downstream", "class": "x.D", "depends_on": "up"}]}
+    up = FixedScraper("up", ContactDetail(type="zip", value="97201"))
+    orchestrator = VerificationOrchestrator([up, downstream], execution_policy=build_execution_policy(config))
+    lead = LeadInput(name="Ada Lovelace")
+
+    [result] = orchestrator.verify([lead])
+    assert orchestrator.attention_queue.pending()[0].lead is lead
+
+    assert orchestrator.resolve_deferred() == [result]
+    assert [contact.value for contact in result.contacts] == ["97201", "ada@example.com"]
+    assert downstream.resumed_leads[0].metadata["zip"] == "97201"
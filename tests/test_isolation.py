@@ -0,0 +1,77 @@
+"""Tests for :mod:`lead_verifier.isolation`."""
+from __future__ import annotations
+
+import os
+
+from lead_verifier.models import ContactDetail, LeadInput, LeadVerification
+from lead_verifier.isolation import ProcessIsolatedScraper
+from lead_verifier.orchestrator import VerificationOrchestrator
+
+
+class PidScraper:
+    """Reports the worker's process id and exits abruptly for leads named ``crash``."""
+
+    name = "pid"
+
+    def __init__(self, label: str = "pid") -> None:
+        self.label = label
+
+    def verify(self, lead: LeadInput) -> LeadVerification:
+        if lead.name == "crash":
+            os._exit(3)
+        return LeadVerification(
+            source=self.name,
+            contacts=[ContactDetail(type="phone", value=str(lead.phone))],
+            raw_data={"pid": os.getpid(), "label": self.label},
+        )
+
+
+def test_verify_runs_in_worker_processes() -> None:
+    scraper = ProcessIsolatedScraper(f"{__name__}.PidScraper", {"label": "isolated"}, processes=2)
+    orchestrator = VerificationOrchestrator([scraper], lead_concurrency=2)
+    try:
+        scraper.warm_up()
+        leads = [LeadInput(name=f"lead {index}", phone=f"555-000{index}") for index in range(4)]
+        results = orchestrator.verify(leads)
+    finally:
+        orchestrator.close()
+
+    assert [result.contacts[0].value for result in results] == [f"555-000{index}" for index in range(4)]
+    pids = {result.raw_results[0].raw_data["pid"] for result in results}
+    assert os.getpid() not in pids
+    assert {result.raw_results[0].raw_data["label"] for result in results} == {"isolated"}
+
+
+def test_crashed_worker_is_restarted() -> None:
+    scraper = ProcessIsolatedScraper(f"{__name__}.PidScraper", max_retries=1)
+    try:
+        crashed = scraper.verify(LeadInput(name="crash"))
+        recovered = scraper.verify(LeadInput(name="Ada", phone="555-0100"))
+    finally:
+        scraper.close()
+
+    assert crashed.contacts == []
+    assert "worker exited with code 3" in crashed.raw_data["error"]
+    assert [contact.value for contact in recovered.contacts] == ["555-0100"]
+    assert scraper.restarts == 2
+
+
+def test_factory_builds_process_pool_when_configured() -> None:
+    from lead_verifier.factory import build_scrapers
+
+    (scraper,) = build_scrapers(
+        {
+            "scrapers": [
+                {
+                    "name": "echo",
+                    "class": "lead_verifier.scrapers.sample.EchoScraper",
+                    "isolation": "process",
+                    "processes": 3,
+                }
+            ]
+        }
+    )
+
+    assert isinstance(scraper._scraper, ProcessIsolatedScraper)
+    assert scraper._scraper.processes == 3
+    assert scraper.name == "echo"
@@ -0,0 +1,156 @@
+"""Tests for :mod:`lead_verifier.jobqueue` and the queue CLI commands."""
+from __future__ import annotations
+
+import csv
+import json
+import sqlite3
+
+from lead_verifier.cli import main
+from lead_verifier.jobqueue import SQLiteJobQueue, open_queue, register_backend, run_worker
+from lead_verifier.models import AggregatedLeadResult, LeadInput
+
+
+def _echo(leads):
+    return [AggregatedLeadResult(lead=lead, contacts=[], raw_results=[]) for lead in leads]
+
+
+def test_batches_are_leased_completed_and_returned_in_order(tmp_path) -> None:
+    queue = SQLiteJobQueue(tmp_path / "queue.sqlite3")
+    job_id = queue.submit([LeadInput(name=f"Lead {index}") for index in range(5)], batch_size=2)
+
+    first = queue.claim("a", lease_seconds=60)
+    second = queue.claim("b", lease_seconds=60)
+    assert [position for position, _ in first.leads] == [0, 1]
+    assert [position for position, _ in second.leads] == [2, 3]
+
+    assert queue.complete(second, _echo([lead for _, lead in second.leads]))
+    assert run_worker(queue, _echo, exit_when_idle=True) == 1
+    status = queue.status(job_id)
+    assert (status.completed, status.leased_batches, status.finished) == (3, 1, False)
+
+    assert queue.complete(first, _echo([lead for _, lead in first.leads]))
+    assert queue.status(job_id).finished
+    assert [result.lead.name for _, result in queue.results(job_id)] == [f"Lead {index}" for index in range(5)]
+
+
+def test_expired_leases_are_reassigned_and_stale_results_discarded(tmp_path) -> None:
+    queue = SQLiteJobQueue(tmp_path / "queue.sqlite3", max_attempts=2)
+    job_id = queue.submit([LeadInput(name="Ada")])
+
+    stale = queue.claim("dead-worker", lease_seconds=-1)
+    retry = queue.claim("live-worker", lease_seconds=60)
+    assert retry is not None and retry.id == stale.id
+
+    assert not queue.complete(stale, _echo([LeadInput(name="Ada")]))
+    queue.release(retry, "browser crashed")
+    assert queue.claim("other", lease_seconds=60) is None
+    assert queue.status(job_id).failed_batches == 1
+
+
+def test_custom_backends_can_be_registered(tmp_path) -> None:
+    opened = []
+
+    def factory(location: str) -> SQLiteJobQueue:
+        opened.append(location)
+        return SQLiteJobQueue(tmp_path / location)
+
+    register_backend("test", factory)
+
+    open_queue("test://custom.sqlite3").close()
+    assert opened == ["custom.sqlite3"]
+    assert isinstance(open_queue(tmp_path / "plain.sqlite3"), SQLiteJobQueue)
+
+
+def test_submit_worker_collect_round_trip(tmp_path, capsys) -> None:
+    config_path = tmp_path / "config.json"
+    config_path.write_text(
+        json.dumps({"scrapers": [{"name": "Echo", "class": "lead_verifier.scrapers.sample.EchoScraper"}]}),
+        encoding="utf-8",
+    )
+    input_path = tmp_path / "input.csv"
+    input_path.write_text(
+        "first_name,last_name,phone,email\n" + "".join(f"First{i},Last{i},555{i},\n" for i in range(5)),
+        encoding="utf-8",
+    )
+    queue = str(tmp_path / "queue.sqlite3")
+    output_path = tmp_path / "results.csv"
+
+    assert main(["submit", str(input_path), "--queue", queue, "--batch-size", "2"]) == 0
+    job_id = capsys.readouterr().out.strip()
+    assert main(["collect", job_id, str(output_path), "--queue", queue]) == 1
+
+    assert main(["worker", "--config", str(config_path), "--queue", queue, "--exit-when-idle"]) == 0
+    assert main(["collect", job_id, str(output_path), "--queue", queue]) == 0
+
+    with output_path.open(newline="", encoding="utf-8") as handle:
+        rows = list(csv.DictReader(handle))
+    assert [row["first_name"] for row in rows] == [f"First{i}" for i in range(5)]
+    assert "phone:5553" in rows[3]["contacts"]
+
+
+def test_jobs_share_workers_by_weight_and_priority_orders_batches(tmp_path) -> None:
+    queue = SQLiteJobQueue(tmp_path / "queue.sqlite3")
+    backfill = queue.submit([LeadInput(name=f"Bulk {index}") for index in range(6)], batch_size=2)
+    assert queue.claim("w", lease_seconds=60).job_id == backfill
+    small = queue.submit(
+        [LeadInput(name="Small"), LeadInput(name="Rush", metadata={"priority": "urgent"})], weight=2
+    )
+
+    claimed = [queue.claim("w", lease_seconds=60) for _ in range(4)]
+    assert [(batch.job_id, [lead.name for _, lead in batch.leads]) for batch in claimed] == [
+        (small, ["Rush"]),
+        (backfill, ["Bulk 2", "Bulk 3"]),
+        (small, ["Small"]),
+        (backfill, ["Bulk 4", "Bulk 5"]),
+    ]
+    queue.complete(claimed[0], _echo([lead for _, lead in claimed[0].leads]))
+    status = queue.status(small)
+    assert status.weight == 2 and status.started_at is not None and status.eta_seconds is not None
+
+
+_PRE_SCHEDULING_SCHEMA = """
+CREATE TABLE jobs (id TEXT PRIMARY KEY, created_at REAL NOT NULL, total INTEGER NOT NULL, metadata TEXT NOT NULL);
+CREATE TABLE batches (
+    id INTEGER PRIMARY KEY AUTOINCREMENT, job_id TEXT NOT NULL REFERENCES jobs(id), payload TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending', lease_owner TEXT, lease_token TEXT, lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0, last_error TEXT
+);
+INSERT INTO jobs VALUES ('old', 0, 1, '{}');
+INSERT INTO batches (job_id, payload) VALUES ('old', '[[0, {"name": "Ada"}]]');
+"""
+
+
+def _old_queue(path):
+    connection = sqlite3.connect(str(path))
+    connection.executescript(_PRE_SCHEDULING_SCHEMA)
+    connection.close()
+    return path
+
+
+def _columns(path, table):
+    connection = sqlite3.connect(str(path))
+    try:
+        return {row[1] for row in connection.execute(f"PRAGMA table_info({table})")}
+    finally:
+        connection.close()
+
+
+def test_queue_files_from_before_scheduling_gain_batch_columns(tmp_path) -> None:
+    path = _old_queue(tmp_path / "queue.sqlite3")
+
+    SQLiteJobQueue(path).close()
+    SQLiteJobQueue(path).close()
+
+    assert {"priority", "deadline", "created_at"} <= _columns(path, "batches")
+
+
+def test_upgraded_queue_files_accept_new_jobs_and_keep_old_batches(tmp_path) -> None:
+    path = _old_queue(tmp_path / "queue.sqlite3")
+
+    queue = SQLiteJobQueue(path)
+    queue.submit([LeadInput(name="Grace")], priority=5)
+
+    assert {"weight", "served", "started_at"} <= _columns(path, "jobs")
+    assert [lead.name for _, lead in queue.claim("w", lease_seconds=60).leads] == ["Ada"]
+    assert [lead.name for _, lead in queue.claim("w", lease_seconds=60).leads] == ["Grace"]
+    assert queue.status("old").weight == 1.0
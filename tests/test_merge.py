@@ -0,0 +1,55 @@
+"""Tests for :mod:`lead_verifier.merge`."""
+from __future__ import annotations
+
+from lead_verifier.merge import IncrementalMerger, merge_lead_results
+from lead_verifier.models import ContactDetail, LeadInput, LeadVerification
+from lead_verifier.orchestrator import VerificationOrchestrator
+
+
+class FixedScraper:
+    def __init__(self, name: str, *values: str) -> None:
+        self.name = name
+        self.values = values
+
+    def verify(self, lead: LeadInput) -> LeadVerification:
+        return LeadVerification(source=self.name, contacts=[ContactDetail(type="phone", value=v) for v in self.values])
+
+
+def _result(source: str, *values: str) -> LeadVerification:
+    return FixedScraper(source, *values).verify(LeadInput(name="unused"))
+
+
+def test_incremental_merger_reports_new_contacts_and_snapshots_are_independent() -> None:
+    merger = IncrementalMerger(LeadInput(name="Ann"))
+
+    assert [contact.value for contact in merger.add(_result("fps", "555-0100"))] == ["555-0100"]
+    first = merger.snapshot()
+    assert merger.add(_result("tps", "555 0100")) == []
+    assert [contact.value for contact in merger.add(_result("tps", "555-0199"))] == ["555-0199"]
+
+    assert [contact.sources for contact in first.contacts] == [["fps"]]
+    assert [contact.sources for contact in merger.snapshot().contacts] == [["fps", "tps"], ["tps"]]
+    assert len(merger) == 3
+
+
+def test_merge_lead_results_skips_missing_results_and_keeps_first_seen_order() -> None:
+    lead = LeadInput(name="Ann")
+
+    merged = merge_lead_results(lead, [_result("a", "2", "1"), None, _result("b", "1", "3")])
+
+    assert [(contact.value, contact.sources) for contact in merged.contacts] == [
+        ("2", ["a"]),
+        ("1", ["a", "b"]),
+        ("3", ["b"]),
+    ]
+    assert [result.source for result in merged.raw_results] == ["a", "b"]
+
+
+def test_orchestrator_reports_partial_results_as_scrapers_return() -> None:
+    orchestrator = VerificationOrchestrator([FixedScraper("a", "1"), FixedScraper("b", "1", "2")])
+    partials = []
+
+    [result] = orchestrator.verify([LeadInput(name="Ann")], partial_callback=partials.append)
+
+    assert [[contact.value for contact in partial.contacts] for partial in partials] == [["1"], ["1", "2"]]
+    assert [contact.sources for contact in result.contacts] == [["a", "b"], ["b"]]
@@ -0,0 +1,83 @@
+"""Tests for :mod:`lead_verifier.normalise`."""
+from __future__ import annotations
+
+import pytest
+
+from lead_verifier.merge import merge_lead_results
+from lead_verifier.models import ContactDetail, LeadInput, LeadVerification
+from lead_verifier.normalise import (
+    normalise_contact_value,
+    normalise_contacts,
+    normalise_email,
+    normalise_emails,
+    normalise_phone,
+    normalise_phones,
+)
+
+PHONES = [
+    ("(303) 555-0100", "+13035550100"),
+    ("1-303-555-0100", "+13035550100"),
+    ("+1 303 555 0100", "+13035550100"),
+    ("303.555.0100 ext. 12", "+13035550100;ext=12"),
+    ("303-555-0100, x7", "+13035550100;ext=7"),
+    ("303-555-0100 #7", "+13035550100;ext=7"),
+    ("1-800-FLOWERS", "+18003569377"),
+    ("(800) 555 HELP", "+18005554357"),
+    ("555-0100 home", "5550100"),
+    ("+44 20 7946 0958", "+442079460958"),
+    ("011 44 20 7946 0958", "+442079460958"),
+    ("0044 20 7946 0958", "+442079460958"),
+    ("", ""),
+]
+
+EMAILS = [
+    (" J.Doe+news@GoogleMail.com ", "jdoe@gmail.com"),
+    ("jdoe@gmail.com", "jdoe@gmail.com"),
+    ("Jane+work@Outlook.com", "jane@outlook.com"),
+    ("jane.doe+work@example.com", "jane.doe+work@example.com"),
+    ("not an email", "not an email"),
+    ("+Tag@Gmail.com", "+tag@gmail.com"),
+    (".@gmail.com", ".@gmail.com"),
+    ("+news@outlook.com", "+news@outlook.com"),
+]
+
+
+@pytest.mark.parametrize("value, expected", PHONES)
+def test_normalise_phone(value: str, expected: str) -> None:
+    assert normalise_phone(value) == expected
+
+
+@pytest.mark.parametrize("value, expected", EMAILS)
+def test_normalise_email(value: str, expected: str) -> None:
+    assert normalise_email(value) == expected
+
+
+def test_batch_helpers_match_single_values() -> None:
+    phones = [value for value, _ in PHONES] + ["a\nb"]
+    emails = [value for value, _ in EMAILS]
+    contacts = [("phone", phones[0]), ("Email", emails[0]), ("url", " HTTP://Example.com "), ("phone", phones[3])]
+
+    assert normalise_phones(phones) == [normalise_phone(value) for value in phones]
+    assert normalise_emails(emails) == [normalise_email(value) for value in emails]
+    assert normalise_contacts(contacts) == [normalise_contact_value(*contact) for contact in contacts]
+    assert normalise_contacts([]) == []
+
+
+def test_merge_dedupes_equivalent_contacts() -> None:
+    results = [
+        LeadVerification(
+            source="fps",
+            contacts=[ContactDetail(type="phone", value="(303) 555-0100"), ContactDetail(type="email", value="j.doe@gmail.com")],
+        ),
+        LeadVerification(
+            source="tps",
+            contacts=[ContactDetail(type="phone", value="+1 303-555-0100"), ContactDetail(type="email", value="JDoe+x@gmail.com")],
+        ),
+    ]
+
+    merged = merge_lead_results(LeadInput(name="Jane"), results)
+
+    assert [(contact.value, contact.sources) for contact in merged.contacts] == [
+        ("(303) 555-0100", ["fps", "tps"]),
+        ("j.doe@gmail.com", ["fps", "tps"]),
+    ]
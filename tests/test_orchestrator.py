@@ -0,0 +1,113 @@
+"""Tests for :class:`lead_verifier.orchestrator.VerificationOrchestrator`."""
+from __future__ import annotations
+
+import threading
+import time
+
+from lead_verifier.captcha import AttentionQueue, CaptchaDeferred
+from lead_verifier.models import ContactDetail, LeadInput, LeadVerification
+from lead_verifier.orchestrator import VerificationOrchestrator
+from lead_verifier.rate_limit import RateLimitedScraper
+
+
+class WarmableScraper:
+    def __init__(self, name: str, warm_up_seconds: float) -> None:
+        self.name = name
+        self._warm_up_seconds = warm_up_seconds
+        self.ready = threading.Event()
+        self.verified_before_ready = False
+        self.closed = False
+
+    def warm_up(self) -> None:
+        time.sleep(self._warm_up_seconds)
+        self.ready.set()
+
+    def verify(self, lead: LeadInput) -> LeadVerification:
+        if not self.ready.is_set():
+            self.verified_before_ready = True
+        return LeadVerification(source=self.name, contacts=[ContactDetail(type="email", value=f"{self.name}@example.com")])
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_warm_up_runs_in_parallel_and_gates_dispatch() -> None:
+    first = WarmableScraper("first", 0.2)
+    second = WarmableScraper("second", 0.2)
+    orchestrator = VerificationOrchestrator([RateLimitedScraper(first), RateLimitedScraper(second)])
+
+    started = time.monotonic()
+    orchestrator.start_warm_up()
+    results = orchestrator.verify([LeadInput(name="Ada")])
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 0.35
+    assert not first.verified_before_ready
+    assert not second.verified_before_ready
+    assert [contact.value for contact in results[0].contacts] == ["first@example.com", "second@example.com"]
+
+    orchestrator.close()
+    assert first.closed and second.closed
+
+
+class CaptchaScraper:
+    name = "captcha"
+
+    def __init__(self) -> None:
+        self.solved = False
+        self.released = 0
+
+    def verify(self, lead: LeadInput) -> LeadVerification:
+        if self.solved:
+            return self._resume()
+        raise CaptchaDeferred("CAPTCHA presented", resume=self._resume, release=self._release)
+
+    def _resume(self) -> LeadVerification:
+        if not self.solved:
+            raise CaptchaDeferred("still unsolved", resume=self._resume, release=self._release)
+        return LeadVerification(source=self.name, contacts=[ContactDetail(type="email", value="solved@example.com")])
+
+    def _release(self) -> None:
+        self.released += 1
+
+
+def test_captcha_leads_are_parked_and_resolved_in_bulk() -> None:
+    captcha = CaptchaScraper()
+    echo = WarmableScraper("echo", 0.0)
+    echo.ready.set()
+    orchestrator = VerificationOrchestrator([captcha, echo], attention_queue=AttentionQueue(max_held=1))
+
+    results = orchestrator.verify([LeadInput(name="Ada"), LeadInput(name="Grace")])
+
+    assert [contact.value for contact in results[0].contacts] == ["echo@example.com"]
+    assert results[0].raw_results[0].raw_data == {"deferred": True, "reason": "CAPTCHA presented"}
+    assert len(orchestrator.attention_queue) == 2
+    assert captcha.released == 1
+
+    assert orchestrator.resolve_deferred() == []
+    assert len(orchestrator.attention_queue) == 2
+
+    captcha.solved = True
+    updated = orchestrator.resolve_deferred()
+
+    assert updated == results
+    assert len(orchestrator.attention_queue) == 0
+    assert [contact.value for contact in results[0].contacts] == ["solved@example.com", "echo@example.com"]
+    assert results[1].raw_results[0].source == "captcha"
+
+
+def test_reparking_over_capacity_retries_with_a_fresh_lookup() -> None:
+    captcha = CaptchaScraper()
+    lookups = []
+    original_verify = captcha.verify
+    captcha.verify = lambda lead: lookups.append(lead) or original_verify(lead)
+    orchestrator = VerificationOrchestrator([captcha], attention_queue=AttentionQueue(max_held=0))
+
+    orchestrator.verify([LeadInput(name="Ada")])
+    assert orchestrator.resolve_deferred() == []
+    assert orchestrator.resolve_deferred() == []
+
+    assert len(lookups) == 3
+    assert captcha.released == 3
+    [entry] = orchestrator.attention_queue.pending()
+    assert not entry.holds_browser and entry.resume == entry.retry
@@ -0,0 +1,111 @@
+"""Tests for :mod:`lead_verifier.page_cache` and scraper re-parsing."""
+from __future__ import annotations
+
+import gzip
+
+import pytest
+
+from lead_verifier.models import LeadInput, PersonSearch, ScraperResult
+from lead_verifier.page_cache import PageCache
+
+
+def test_store_and_load_round_trip(tmp_path) -> None:
+    cache = PageCache(tmp_path)
+    url = "https://www.fastpeoplesearch.com/name/Jane+Doe"
+
+    cache.store(url, "<html>cached</html>", fetched_at=123.0)
+    page = cache.load(url)
+
+    assert page is not None
+    assert page.html == "<html>cached</html>"
+    assert page.fetched_at == 123.0
+    path = cache.path_for(url)
+    assert path.parent.name == PageCache.key_for(url)[:2]
+    with gzip.open(path, "rt", encoding="utf-8") as handle:
+        assert "cached" in handle.read()
+
+
+def test_load_ignores_missing_and_expired_pages(tmp_path) -> None:
+    cache = PageCache(tmp_path, max_age_seconds=60)
+    url = "https://example.com/results?name=Jane"
+
+    assert cache.load(url) is None
+    cache.store(url, "<html></html>", fetched_at=0.0)
+
+    assert cache.load(url) is None
+    assert url not in cache
+
+
+RESULT_PAGE = """
+<html><body>
+  <div class="card result-card">
+    <h3>Jane Doe, Age 40</h3>
+    <a href="tel:5551234567">(555) 123-4567</a>
+  </div>
+  <a href="tel:5557654321">(555) 765-4321</a>
+</body></html>
+"""
+
+
+def test_fast_people_search_reparse_uses_cached_page(tmp_path) -> None:
+    pytest.importorskip("selenium")
+    pytest.importorskip("bs4")
+    from lead_verifier.scrapers.fast_people_search import FastPeopleSearchConfig, FastPeopleSearchScraper
+
+    def unexpected_driver():  # pragma: no cover - guard
+        raise AssertionError("reparse must not start a browser")
+
+    scraper = FastPeopleSearchScraper(
+        FastPeopleSearchConfig(page_cache_dir=str(tmp_path), reparse=True),
+        driver_factory=unexpected_driver,
+    )
+    lead = LeadInput(first_name="Jane", last_name="Doe")
+    scraper.page_cache.store(scraper._build_search_url(lead), RESULT_PAGE, fetched_at=42.0)
+
+    verification = scraper.verify(lead)
+
+    assert [contact.value for contact in verification.contacts] == ["(555) 123-4567", "(555) 765-4321"]
+    assert verification.contacts[0].metadata["label"] == "Jane Doe, Age 40"
+    assert "label" not in verification.contacts[1].metadata
+    assert verification.raw_data["metadata"]["page_state"] == "results"
+    assert verification.raw_data["metadata"]["cached_at"] == 42.0
+
+    missing = scraper.verify(LeadInput(first_name="John", last_name="Roe"))
+    assert missing.contacts == []
+    assert missing.raw_data["errors"] == ["No cached page available for reparse."]
+
+
+def test_true_people_search_reparse_extracts_emails(tmp_path) -> None:
+    pytest.importorskip("playwright.sync_api")
+    pytest.importorskip("bs4")
+    from lead_verifier.scrapers.true_people_search import TruePeopleSearchScraper
+
+    scraper = TruePeopleSearchScraper({"page_cache_dir": str(tmp_path), "reparse": True})
+    query = PersonSearch(full_name="Ada Lovelace")
+    scraper.page_cache.store(
+        scraper._build_query_url(query),
+        "<html><body><div><div class='h5'><span>Email Addresses</span></div>"
+        "<div>ada@example.com</div><div> </div><div>ada@work.example</div></div></body></html>",
+    )
+
+    result = scraper.search(query)
+
+    assert result.found is True
+    assert [email.address for email in result.emails] == ["ada@example.com", "ada@work.example"]
+
+
+def test_true_people_search_reparse_miss_is_an_error_result(tmp_path) -> None:
+    pytest.importorskip("playwright.sync_api")
+    pytest.importorskip("bs4")
+    from lead_verifier.scrapers.true_people_search import TruePeopleSearchScraper
+
+    scraper = TruePeopleSearchScraper({"page_cache_dir": str(tmp_path), "reparse": True})
+
+    verification = scraper.verify(LeadInput(first_name="John", last_name="Roe"))
+
+    assert verification.contacts == []
+    assert verification.raw_data["errors"] == ["No cached page available for reparse."]
+
+    noted = ScraperResult(provider=scraper.provider, query=PersonSearch(full_name="John Roe"), found=False)
+    noted.add_note(scraper.REPARSE_MISS_NOTE)
+    assert "errors" not in scraper._to_verification(noted, noted.query).raw_data
@@ -0,0 +1,69 @@
+"""Tests for :mod:`lead_verifier.pipeline`."""
+from __future__ import annotations
+
+import csv
+import time
+
+import pytest
+
+from lead_verifier.cli import main
+from lead_verifier.models import LeadInput, LeadVerification
+from lead_verifier.orchestrator import VerificationOrchestrator
+from lead_verifier.pipeline import VerificationPipeline
+
+
+class JitteryScraper:
+    name = "jittery"
+
+    def verify(self, lead: LeadInput) -> LeadVerification:
+        if lead.name == "boom":
+            raise RuntimeError("boom")
+        time.sleep(0.02 if int(lead.name) % 3 == 0 else 0.001)
+        return LeadVerification(source=self.name)
+
+
+def test_results_are_written_in_input_order_with_bounded_read_ahead() -> None:
+    read = []
+
+    def leads():
+        for index in range(60):
+            read.append(index)
+            yield LeadInput(name=str(index))
+
+    written = []
+    pipeline = VerificationPipeline(VerificationOrchestrator([JitteryScraper()]), workers=3, queue_size=2, window=5)
+
+    def write(result) -> None:
+        written.append(int(result.lead.name))
+        assert len(read) - len(written) <= 5
+
+    assert pipeline.run(leads(), write) == 60
+    assert written == list(range(60))
+    assert pipeline.stats.max_in_flight <= 5
+
+
+def test_stage_errors_stop_the_pipeline() -> None:
+    orchestrator = VerificationOrchestrator([JitteryScraper()], raise_on_error=True)
+    pipeline = VerificationPipeline(orchestrator, workers=2, queue_size=1)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        pipeline.run((LeadInput(name=name) for name in ["0", "1", "boom", "3"]), lambda result: None)
+
+
+def test_cli_stream_mode_writes_every_lead(tmp_path) -> None:
+    source = tmp_path / "leads.csv"
+    with source.open("w", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["first_name", "last_name", "phone"])
+        for index in range(20):
+            writer.writerow([f"Lead{index}", "Doe", f"555-01{index:02d}"])
+    config = tmp_path / "config.json"
+    config.write_text('{"scrapers": [{"name": "echo", "class": "lead_verifier.scrapers.sample.EchoScraper"}]}')
+    output = tmp_path / "out.csv"
+
+    assert main([str(source), str(output), "--config", str(config), "--stream", "--lead-concurrency", "3"]) == 0
+
+    with output.open(newline="") as handle:
+        rows = list(csv.DictReader(handle))
+    assert [row["first_name"] for row in rows] == [f"Lead{index}" for index in range(20)]
+    assert rows[7]["contacts"] == "phone:555-0107 [echo]"
@@ -0,0 +1,101 @@
+"""Tests for :mod:`lead_verifier.planning`."""
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from lead_verifier.budget import LatencyTracker
+from lead_verifier.cli import main
+from lead_verifier.models import ContactDetail, LeadInput, LeadVerification
+from lead_verifier.planning import build_run_plan, format_duration
+from lead_verifier.result_cache import ResultCache, normalise_query
+
+ECHO = "lead_verifier.scrapers.sample.EchoScraper"
+
+
+def _leads(*names: str):
+    return [LeadInput(name=name, metadata={"city": "Denver"}) for name in names]
+
+
+def test_plan_counts_duplicates_and_rate_limited_minimum() -> None:
+    config = {
+        "scrapers": [
+            {"name": "fast", "class": ECHO, "rate_limit_per_minute": 60, "delay_seconds": 0.5},
+            {"name": "slow", "class": ECHO, "delay_seconds": 2, "options": {"config": {"throttle_seconds": 3}}},
+        ]
+    }
+
+    plan = build_run_plan(config, _leads("Ann", "Bob", "ann "))
+
+    assert (plan.leads, plan.unique_leads, plan.duplicates) == (3, 2, 1)
+    fast, slow = plan.scrapers
+    assert fast.seconds_per_call == 1.0
+    assert slow.seconds_per_call == 5.0
+    assert plan.min_seconds == 3 * 1.0 + 3 * 5.0
+
+    overlapping = build_run_plan(config, _leads("Ann", "Bob", "ann "), lead_concurrency=5)
+    assert overlapping.scrapers[1].seconds_per_call == 1.0
+    assert overlapping.min_seconds == 3.0
+
+
+def test_plan_discounts_gated_scrapers_by_cheaper_hit_rates() -> None:
+    config = {
+        "scrapers": [
+            {"name": "cheap", "class": ECHO, "cost": 1},
+            {"name": "pricey", "class": ECHO, "cost": 10, "run_if_missing": "email"},
+        ]
+    }
+
+    plan = build_run_plan(config, _leads(*"abcdefghij"), hit_rates={"cheap": 0.7})
+
+    cheap, pricey = plan.scrapers
+    assert not cheap.gated and cheap.expected_calls == 10
+    assert pricey.gated and pricey.max_calls == 10
+    assert pricey.expected_calls == pytest.approx(3)
+
+
+def test_plan_reports_cache_hits_without_creating_a_cache(tmp_path) -> None:
+    leads = _leads("Ann", "Bob")
+    path = tmp_path / "cache.sqlite3"
+    config = {"result_cache": {"path": str(path), "positive_ttl_hours": 1}, "scrapers": [{"name": "echo", "class": ECHO}]}
+
+    assert build_run_plan(config, leads).cache_hits == 0
+    assert not path.exists()
+
+    cache = ResultCache(path, positive_ttl_seconds=3600)
+    found = LeadVerification(source="echo", contacts=[ContactDetail(type="phone", value="555")])
+    cache.put("echo", normalise_query(leads[0]), found)
+    cache.close()
+
+    plan = build_run_plan(config, leads)
+    assert plan.cache_hits == 1
+    assert plan.scrapers[0].max_calls == 1
+
+
+def test_remaining_seconds_uses_observed_latency() -> None:
+    config = {"scrapers": [{"name": "echo", "class": ECHO, "rate_limit_per_minute": 60}]}
+    plan = build_run_plan(config, _leads(*"abcd"))
+    latency = LatencyTracker()
+
+    assert plan.remaining_seconds(2) == 2.0
+    latency.record("echo", 5.0, found=True)
+    assert plan.remaining_seconds(2, latency) == 10.0
+    assert plan.remaining_seconds(4, latency) == 0.0
+
+
+def test_format_duration() -> None:
+    assert format_duration(42) == "42s"
+    assert format_duration(125) == "2m05s"
+    assert format_duration(3 * 3600 + 60) == "3h01m"
+
+
+def test_cli_plan_fails_when_the_budget_is_too_small(tmp_path, capsys) -> None:
+    source = tmp_path / "leads.csv"
+    source.write_text("first_name,last_name\nAnn,Lee\nBob,Lee\n")
+    config = tmp_path / "config.json"
+    config.write_text(json.dumps({"scrapers": [{"name": "echo", "class": ECHO, "rate_limit_per_minute": 1}]}))
+
+    assert main(["plan", str(source), "--config", str(config), "--time-budget", "5"]) == 0
+    assert "echo: 2 calls" in capsys.readouterr().out
+    assert main(["plan", str(source), "--config", str(config), "--time-budget", "1"]) == 1
@@ -0,0 +1,65 @@
+"""Tests for :mod:`lead_verifier.query_planner`."""
+from __future__ import annotations
+
+from lead_verifier.models import LeadInput
+from lead_verifier.query_planner import (
+    VARIANT_NAME,
+    VARIANT_NAME_CITY_STATE,
+    VARIANT_NAME_ZIP,
+    QueryPlanner,
+    lead_variants,
+)
+
+
+def test_variants_run_from_most_to_least_selective() -> None:
+    lead = LeadInput(name="Jane Doe", metadata={"city": "Portland", "state": "OR", "zip": "97201"})
+
+    variants = lead_variants(lead)
+
+    assert [variant.key for variant in variants] == [VARIANT_NAME_ZIP, VARIANT_NAME_CITY_STATE, VARIANT_NAME]
+    assert variants[0].postal_code == "97201"
+    assert (variants[1].city, variants[1].state) == ("Portland", "OR")
+    assert [variant.key for variant in lead_variants(LeadInput(name="Jane Doe"))] == [VARIANT_NAME]
+
+
+def test_learned_hit_rates_reorder_variants_per_state(tmp_path) -> None:
+    stats_path = tmp_path / "planner.json"
+    planner = QueryPlanner(min_samples=2, stats_path=stats_path)
+    oregon = LeadInput(name="Jane Doe", metadata={"city": "Portland", "state": "OR", "zip": "97201"})
+    zip_variant, city_variant, name_variant = lead_variants(oregon)
+
+    for _ in range(2):
+        planner.record(oregon, zip_variant, 0)
+        planner.record(oregon, city_variant, 3)
+        planner.record(oregon, name_variant, 1)
+
+    assert [variant.key for variant in planner.plan(oregon)] == [VARIANT_NAME_CITY_STATE, VARIANT_NAME_ZIP, VARIANT_NAME]
+
+    texas = LeadInput(name="Jane Doe", metadata={"city": "Austin", "state": "TX", "zip": "73301"})
+    assert [variant.key for variant in planner.plan(texas)] == [VARIANT_NAME_ZIP, VARIANT_NAME_CITY_STATE, VARIANT_NAME]
+
+    reloaded = QueryPlanner(min_samples=2, stats_path=stats_path)
+    assert reloaded.stats_for("or")[VARIANT_NAME_CITY_STATE].hits == 2
+    assert [variant.key for variant in reloaded.plan(oregon)][0] == VARIANT_NAME_CITY_STATE
+
+
+def test_expected_matches_can_be_overridden_per_lead() -> None:
+    planner = QueryPlanner(expected_matches=2)
+
+    assert not planner.is_satisfied(LeadInput(name="Jane Doe"), 1)
+    assert planner.is_satisfied(LeadInput(name="Jane Doe", metadata={"expected_matches": 1}), 1)
+
+
+def test_name_only_stays_last_even_when_it_hits_more_often() -> None:
+    planner = QueryPlanner(expected_matches=2, min_samples=3)
+    lead = LeadInput(name="Jane Doe", metadata={"city": "Portland", "state": "OR", "zip": "97201"})
+    zip_variant, city_variant, name_variant = lead_variants(lead)
+
+    for _ in range(3):
+        planner.record(lead, zip_variant, 1)
+        planner.record(lead, city_variant, 2)
+        planner.record(lead, name_variant, 40)
+
+    stats = planner.stats_for("OR")
+    assert (stats[VARIANT_NAME_ZIP].hits, stats[VARIANT_NAME_CITY_STATE].hits, stats[VARIANT_NAME].hits) == (0, 3, 3)
+    assert [variant.key for variant in planner.plan(lead)] == [VARIANT_NAME_CITY_STATE, VARIANT_NAME_ZIP, VARIANT_NAME]
@@ -0,0 +1,86 @@
+"""Tests for browser recycling policies."""
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from lead_verifier.scrapers.recycling import RecyclePolicy, RecycleTracker, process_tree_rss_mb
+
+
+def test_tracker_reports_navigation_and_slow_load_thresholds() -> None:
+    tracker = RecycleTracker(RecyclePolicy(max_navigations=3, slow_load_seconds=2.0, max_slow_loads=2))
+
+    assert tracker.record_navigation(0.1) is None
+    assert tracker.record_navigation(2.5) is None
+    assert tracker.record_navigation(3.0) == "3 navigations"
+
+    tracker.reset()
+    tracker.policy.max_navigations = 0
+    assert tracker.record_navigation(2.0) is None
+    assert tracker.record_navigation(2.0) == "2 loads slower than 2s"
+
+
+def test_tracker_samples_memory_at_the_configured_interval() -> None:
+    readings = []
+
+    def reader() -> float:
+        readings.append(1)
+        return 900.0
+
+    tracker = RecycleTracker(RecyclePolicy(max_rss_mb=512, rss_check_interval=2), rss_reader=reader)
+
+    assert tracker.record_navigation(0.1) is None
+    assert tracker.record_navigation(0.1) == "resident memory 900 MB"
+    assert len(readings) == 1
+
+
+@pytest.mark.skipif(not os.path.isdir("/proc"), reason="requires /proc")
+def test_process_tree_rss_reads_proc() -> None:
+    assert process_tree_rss_mb(os.getpid()) > 0
+    assert process_tree_rss_mb(2**22 + 1) is None
+
+
+def test_fast_people_search_swaps_in_warmed_replacement() -> None:
+    pytest.importorskip("selenium")
+    from lead_verifier.models import LeadInput
+    from lead_verifier.scrapers.fast_people_search import FastPeopleSearchScraper
+
+    class _Driver:
+        current_url = ""
+        title = ""
+
+        def __init__(self) -> None:
+            self.visits = 0
+            self.quit_called = False
+
+        def implicitly_wait(self, seconds: float) -> None:
+            pass
+
+        def get(self, url: str) -> None:
+            self.visits += 1
+
+        def find_elements(self, by: str, value: str) -> list:
+            return [object()] if value == FastPeopleSearchScraper.NOT_FOUND_XPATH else []
+
+        def quit(self) -> None:
+            self.quit_called = True
+
+    drivers: list[_Driver] = []
+
+    def factory() -> _Driver:
+        drivers.append(_Driver())
+        return drivers[-1]
+
+    scraper = FastPeopleSearchScraper({"recycle_after_navigations": 2}, driver_factory=factory)
+    lead = LeadInput(first_name="Jane", last_name="Doe")
+
+    scraper.verify(lead)
+    scraper.verify(lead)
+    scraper._replacement.result(timeout=5)
+    scraper.verify(lead)
+    scraper.close()
+
+    assert [driver.visits for driver in drivers] == [2, 1]
+    assert scraper.recycle_count == 1
+    assert all(driver.quit_called for driver in drivers)
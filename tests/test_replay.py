@@ -0,0 +1,78 @@
+"""Tests for the offline replay server."""
+from __future__ import annotations
+
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from lead_verifier.models import LeadInput
+from lead_verifier.page_cache import PageCache
+from lead_verifier.replay import ReplayProfile, ReplayServer
+
+
+def _fetch(url: str) -> str:
+    with urllib.request.urlopen(url, timeout=5) as response:
+        return response.read().decode("utf-8")
+
+
+def _profile(**weights: float) -> ReplayProfile:
+    base = {"result_weight": 0.0, "not_found_weight": 0.0, "captcha_weight": 0.0, "error_weight": 0.0}
+    base.update(weights)
+    return ReplayProfile(latency_seconds=(0.0, 0.0), seed=1, **base)
+
+
+def test_serves_outcome_pages_for_both_sites() -> None:
+    with ReplayServer(profile=_profile(not_found_weight=1.0)) as server:
+        fps = _fetch(f"{server.base_url}/name/Jane+Doe/Portland+OR")
+        tps = _fetch(f"{server.base_url}/results?name=Jane+Doe&citystatezip=&rid=0x0")
+
+    assert "We could not find any records" in fps
+    assert "We could not find any records for that search criteria." in tps
+    assert server.stats[("fast_people_search", "not_found")] == 1
+    assert server.stats[("true_people_search", "not_found")] == 1
+
+
+def test_injects_errors_and_latency() -> None:
+    profile = _profile(error_weight=1.0)
+    profile.latency_seconds = (0.05, 0.05)
+    with ReplayServer(profile=profile) as server:
+        started = time.monotonic()
+        with pytest.raises(urllib.error.HTTPError) as excinfo:
+            _fetch(f"{server.base_url}/name/Jane+Doe")
+        elapsed = time.monotonic() - started
+
+    assert excinfo.value.code == 503
+    assert elapsed >= 0.05
+
+
+def test_prefers_recorded_pages_from_page_cache(tmp_path) -> None:
+    cache = PageCache(tmp_path)
+    cache.store("https://www.fastpeoplesearch.com/name/Jane+Doe", "<html>recorded page</html>")
+
+    with ReplayServer(profile=_profile(result_weight=1.0), page_cache=cache) as server:
+        assert _fetch(f"{server.base_url}/name/Jane+Doe") == "<html>recorded page</html>"
+        assert "tel:" in _fetch(f"{server.base_url}/name/John+Roe")
+
+
+def test_fast_people_search_base_url_override() -> None:
+    pytest.importorskip("selenium")
+    pytest.importorskip("bs4")
+    from lead_verifier.scrapers.fast_people_search import FastPeopleSearchScraper
+
+    scraper = FastPeopleSearchScraper({"base_url": "http://127.0.0.1:8765/"})
+
+    url = scraper._build_search_url(LeadInput(first_name="Jane", last_name="Doe"))
+
+    assert url == "http://127.0.0.1:8765/name/Jane+Doe"
+    assert FastPeopleSearchScraper.BASE_URL == "https://www.fastpeoplesearch.com"
+
+    server = ReplayServer(profile=_profile(result_weight=1.0))
+    try:
+        _, body = server.respond("/name/Jane+Doe")
+    finally:
+        server.stop()
+    state, phones = scraper._parse_page_html(body)
+    assert state == "results"
+    assert [phone.label for phone in phones] == ["Jane Doe, Age 40", "Jane Doe, Age 40"]
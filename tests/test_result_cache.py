@@ -0,0 +1,88 @@
+"""Tests for :mod:`lead_verifier.result_cache`."""
+from __future__ import annotations
+
+from lead_verifier.factory import build_scrapers
+from lead_verifier.models import ContactDetail, LeadInput, LeadVerification
+from lead_verifier.rate_limit import RateLimitedScraper
+from lead_verifier.result_cache import CachedScraper, ResultCache, normalise_query
+
+
+class ScriptedScraper:
+    name = "scripted"
+
+    def __init__(self, verification: LeadVerification) -> None:
+        self.verification = verification
+        self.calls = 0
+
+    def verify(self, lead: LeadInput) -> LeadVerification:
+        self.calls += 1
+        return LeadVerification(
+            source=self.name,
+            contacts=list(self.verification.contacts),
+            raw_data=dict(self.verification.raw_data or {}),
+        )
+
+
+def test_normalise_query_ignores_case_and_whitespace() -> None:
+    first = LeadInput(name="Ada  Lovelace", metadata={"city": "London", "zip": "SW1A"})
+    second = LeadInput(first_name="ada", last_name="LOVELACE", metadata={"city": " london ", "zip": "sw1a"})
+
+    assert normalise_query(first) == normalise_query(second) == "ada lovelace|london||sw1a"
+
+
+def test_not_found_outcomes_are_reused_until_negative_ttl(tmp_path) -> None:
+    cache = ResultCache(tmp_path / "cache.sqlite3", negative_ttl_seconds=3600)
+    inner = ScriptedScraper(LeadVerification(source="scripted", raw_data={"not_found": True}))
+    scraper = CachedScraper(inner, cache)
+    lead = LeadInput(name="Grace Hopper")
+
+    first = scraper.verify(lead)
+    second = scraper.verify(LeadInput(name="grace hopper"))
+
+    assert inner.calls == 1
+    assert first.raw_data == {"not_found": True}
+    assert second.raw_data["not_found"] is True
+    assert "cached_at" in second.raw_data
+
+    cache.negative_ttl_seconds = 0
+    scraper.verify(lead)
+    assert inner.calls == 2
+
+
+def test_positive_results_and_errors_follow_their_own_rules(tmp_path) -> None:
+    cache = ResultCache(tmp_path / "cache.sqlite3")
+    found = ScriptedScraper(
+        LeadVerification(source="scripted", contacts=[ContactDetail(type="email", value="ada@example.com")])
+    )
+    scraper = CachedScraper(found, cache)
+    scraper.verify(LeadInput(name="Ada"))
+    scraper.verify(LeadInput(name="Ada"))
+    assert found.calls == 2
+
+    cache.positive_ttl_seconds = 3600
+    scraper.verify(LeadInput(name="Ada"))
+    hit = scraper.verify(LeadInput(name="Ada"))
+    assert found.calls == 3
+    assert [contact.value for contact in hit.contacts] == ["ada@example.com"]
+
+    failing = ScriptedScraper(LeadVerification(source="scripted", raw_data={"not_found": True, "errors": ["boom"]}))
+    failing_scraper = CachedScraper(failing, cache)
+    failing_scraper.verify(LeadInput(name="Linus"))
+    failing_scraper.verify(LeadInput(name="Linus"))
+    assert failing.calls == 2
+
+
+def test_factory_wraps_scrapers_when_result_cache_configured(tmp_path) -> None:
+    config = {
+        "result_cache": {"path": str(tmp_path / "cache.sqlite3"), "negative_ttl_hours": 24},
+        "scrapers": [
+            {"name": "echo", "class": "lead_verifier.scrapers.sample.EchoScraper"},
+            {"name": "uncached", "class": "lead_verifier.scrapers.sample.EchoScraper", "cache": False},
+        ],
+    }
+
+    cached, uncached = build_scrapers(config)
+
+    assert isinstance(cached, CachedScraper)
+    assert cached.name == "echo"
+    assert isinstance(uncached, RateLimitedScraper)
@@ -0,0 +1,99 @@
+"""Tests for :mod:`lead_verifier.scheduling`."""
+from __future__ import annotations
+
+import queue
+
+import pytest
+
+from lead_verifier.scheduling import (
+    FairShareScheduler,
+    PriorityScheduler,
+    estimate_eta,
+    parse_deadline,
+    parse_priority,
+    priority_weight,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_high_priority_items_overtake_queued_bulk_work() -> None:
+    scheduler = PriorityScheduler(clock=_Clock())
+    for index in range(3):
+        scheduler.put(f"bulk-{index}", priority=-10)
+    scheduler.put("urgent", priority=20)
+
+    assert [scheduler.get_nowait() for _ in range(4)] == ["urgent", "bulk-0", "bulk-1", "bulk-2"]
+    with pytest.raises(queue.Empty):
+        scheduler.get_nowait()
+
+
+def test_waiting_items_age_ahead_of_newer_higher_priority_work() -> None:
+    clock = _Clock()
+    scheduler = PriorityScheduler(aging_seconds=60, clock=clock)
+    scheduler.put("bulk", priority=-1)
+    clock.now += 180
+    scheduler.put("high", priority=1)
+
+    assert scheduler.get_nowait() == "bulk"
+
+
+def test_items_near_their_deadline_are_served_first() -> None:
+    clock = _Clock()
+    scheduler = PriorityScheduler(deadline_slack_seconds=30, clock=clock)
+    scheduler.put("urgent", priority=20)
+    scheduler.put("later", deadline=clock.now + 600)
+    scheduler.put("due", deadline=clock.now + 10)
+
+    assert scheduler.get_nowait() == "due"
+    assert scheduler.get_nowait() == "urgent"
+    clock.now += 590
+    scheduler.put("new-urgent", priority=20)
+    assert scheduler.get_nowait() == "later"
+    assert len(scheduler) == 1
+
+
+def test_fair_share_interleaves_jobs_by_weight() -> None:
+    scheduler = FairShareScheduler(clock=_Clock())
+    for index in range(6):
+        scheduler.put(f"big-{index}", flow="big")
+    assert scheduler.get_nowait() == "big-0"
+    for index in range(2):
+        scheduler.put(f"small-{index}", flow="small", weight=2)
+
+    served = [scheduler.get_nowait() for _ in range(4)]
+    assert served == ["small-0", "small-1", "big-1", "big-2"]
+    assert scheduler.qsize("big") == 3 and scheduler.qsize("small") == 0
+
+
+def test_fair_share_serves_due_deadlines_across_flows() -> None:
+    clock = _Clock()
+    scheduler = FairShareScheduler(clock=clock)
+    scheduler.put("a-0", flow="a")
+    scheduler.put("a-1", flow="a")
+    scheduler.put("b-due", flow="b", deadline=clock.now + 5)
+
+    assert scheduler.get_nowait() == "b-due"
+    assert [scheduler.get_nowait(), scheduler.get_nowait()] == ["a-0", "a-1"]
+    with pytest.raises(queue.Empty):
+        scheduler.get(timeout=0.01)
+
+
+def test_parse_helpers() -> None:
+    assert parse_priority("high") == 10
+    assert parse_priority(None, default=3) == 3
+    assert parse_priority("-5") == -5
+    with pytest.raises(ValueError):
+        parse_priority("soonish")
+    assert parse_deadline({"deadline_seconds": 30}, now=100.0) == 130.0
+    assert parse_deadline({"deadline": "250"}) == 250.0
+    assert parse_deadline({}) is None
+    assert priority_weight(10) == 2.0
+    assert estimate_eta(0, 10, started_at=0.0, now=30.0) is None
+    assert estimate_eta(5, 10, started_at=0.0, now=30.0) == 30.0
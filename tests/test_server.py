@@ -0,0 +1,93 @@
+"""Tests for the local HTTP verification service."""
+from __future__ import annotations
+
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+
+from lead_verifier.merge import merge_lead_results
+from lead_verifier.models import ContactDetail, LeadInput, LeadVerification
+from lead_verifier.orchestrator import VerificationOrchestrator
+from lead_verifier.scrapers.sample import EchoScraper
+from lead_verifier.server import ServiceJob, VerificationServer, lead_from_payload
+
+
+def _request(url: str, payload=None):
+    data = json.dumps(payload).encode("utf-8") if payload is not None else None
+    request = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(request, timeout=10) as response:
+        return response.status, response.headers.get("Content-Type"), response.read().decode("utf-8")
+
+
+class WarmCountingScraper(EchoScraper):
+    warm_ups = 0
+
+    def warm_up(self) -> None:
+        type(self).warm_ups += 1
+
+
+def test_jobs_stream_results_as_ndjson() -> None:
+    orchestrator = VerificationOrchestrator([WarmCountingScraper()])
+    with VerificationServer(orchestrator, port=0, workers=2) as server:
+        leads = [{"first_name": "Jane", "last_name": "Doe", "phone": "555-0100", "city": "Portland"}] * 3
+        status, _, body = _request(f"{server.base_url}/jobs", {"leads": leads})
+        job = json.loads(body)
+        assert status == 202 and job["total"] == 3
+
+        _, content_type, stream = _request(f"{server.base_url}{job['results_url']}")
+        lines = [json.loads(line) for line in stream.splitlines()]
+        assert content_type == "application/x-ndjson"
+        assert sorted(line["position"] for line in lines) == [0, 1, 2]
+        assert lines[0]["result"]["contacts"][0]["value"] == "555-0100"
+        assert lines[0]["result"]["lead"]["metadata"] == {"city": "Portland"}
+
+        _, _, second = _request(f"{server.base_url}/jobs", [{"name": "Ada", "email": "ada@example.com"}])
+        second_job = json.loads(second)
+        _request(f"{server.base_url}{second_job['results_url']}")
+        _, _, status_body = _request(f"{server.base_url}/jobs/{second_job['job_id']}")
+        finished = json.loads(status_body)
+        assert finished["finished"] is True and finished["eta_seconds"] == 0.0 and finished["queued"] == 0
+        assert finished["in_progress"] == []
+        _, _, active = _request(f"{server.base_url}/jobs")
+        assert json.loads(active) == {"jobs": []}
+
+    assert WarmCountingScraper.warm_ups == 1
+
+
+def test_rejects_bad_requests() -> None:
+    with VerificationServer(VerificationOrchestrator([EchoScraper()]), port=0) as server:
+        with pytest.raises(urllib.error.HTTPError) as missing:
+            _request(f"{server.base_url}/jobs/unknown")
+        with pytest.raises(urllib.error.HTTPError) as malformed:
+            _request(f"{server.base_url}/jobs", {"leads": "nope"})
+        with pytest.raises(urllib.error.HTTPError) as bad_priority:
+            _request(f"{server.base_url}/jobs", {"leads": [{"name": "Ada"}], "priority": "soonish"})
+        _, _, accepted = _request(f"{server.base_url}/jobs", {"leads": [{"name": "Ada"}], "priority": "high"})
+
+    assert missing.value.code == 404
+    assert malformed.value.code == 400
+    assert bad_priority.value.code == 400
+    assert json.loads(accepted)["priority"] == 10
+
+
+def test_lead_from_payload_accepts_structured_and_flat_rows() -> None:
+    lead = lead_from_payload({"name": "Ada", "metadata": {"zip": "SW1A"}, "city": "London"})
+
+    assert lead.name == "Ada"
+    assert lead.metadata == {"zip": "SW1A", "city": "London"}
+
+
+def test_job_status_lists_partial_contacts_until_the_lead_completes() -> None:
+    job = ServiceJob(id="job", total=1)
+    merged = merge_lead_results(
+        LeadInput(name="Ann"), [LeadVerification(source="echo", contacts=[ContactDetail(type="phone", value="555")])]
+    )
+
+    job.set_partial(0, merged)
+    assert job.status()["in_progress"] == [
+        {"position": 0, "contacts": [{"type": "phone", "value": "555", "sources": ["echo"]}]}
+    ]
+    job.add(0, merged)
+    assert job.status()["in_progress"] == []
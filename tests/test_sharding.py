@@ -0,0 +1,123 @@
+"""Tests for :mod:`lead_verifier.sharding` and the sharded CLI launcher."""
+from __future__ import annotations
+
+import csv
+import json
+import os
+import signal
+import threading
+import time
+
+import pytest
+
+from lead_verifier import cli
+from lead_verifier.cli import main
+from lead_verifier.models import LeadInput
+from lead_verifier.orchestrator import VerificationOrchestrator
+from lead_verifier.sharding import ShardSpec, merge_in_input_order, parse_shard_spec, select_shard, shard_for
+
+
+def test_parse_shard_spec_is_one_based() -> None:
+    assert parse_shard_spec("2/8") == ShardSpec(index=1, count=8)
+    assert str(parse_shard_spec("8/8")) == "8/8"
+    for invalid in ("0/4", "5/4", "3", "a/b"):
+        with pytest.raises(ValueError):
+            parse_shard_spec(invalid)
+
+
+def test_shards_partition_leads_and_merge_back_in_order() -> None:
+    leads = [LeadInput(name=f"Lead {index}", phone=str(index)) for index in range(50)]
+    parts = [select_shard(leads, ShardSpec(index=index, count=4)) for index in range(4)]
+
+    assert sum(len(part) for part in parts) == len(leads)
+    assert all(part for part in parts)
+    assert merge_in_input_order(parts) == leads
+    assert shard_for(LeadInput(name="lead 7", phone="7"), 4) == shard_for(leads[7], 4)
+
+
+def _write_inputs(tmp_path, count: int):
+    config_path = tmp_path / "config.json"
+    config_path.write_text(
+        json.dumps({"scrapers": [{"name": "Echo", "class": "lead_verifier.scrapers.sample.EchoScraper"}]}),
+        encoding="utf-8",
+    )
+    input_path = tmp_path / "input.csv"
+    rows = "".join(f"First{index},Last{index},555000{index:04d},\n" for index in range(count))
+    input_path.write_text("first_name,last_name,phone,email\n" + rows, encoding="utf-8")
+    return config_path, input_path
+
+
+def _read_first_names(path) -> list[str]:
+    with path.open(newline="", encoding="utf-8") as handle:
+        return [row["first_name"] for row in csv.DictReader(handle)]
+
+
+def test_cli_processes_merge_shards_in_input_order(tmp_path) -> None:
+    config_path, input_path = _write_inputs(tmp_path, 12)
+    output_path = tmp_path / "results.csv"
+
+    assert main([str(input_path), str(output_path), "--config", str(config_path), "--processes", "3"]) == 0
+
+    assert _read_first_names(output_path) == [f"First{index}" for index in range(12)]
+
+
+def test_cli_shard_runs_only_its_share(tmp_path) -> None:
+    config_path, input_path = _write_inputs(tmp_path, 12)
+    names = []
+    for number in (1, 2):
+        output_path = tmp_path / f"results-{number}.csv"
+        main([str(input_path), str(output_path), "--config", str(config_path), "--shard", f"{number}/2"])
+        names.append(_read_first_names(output_path))
+
+    assert sorted(names[0] + names[1], key=lambda name: int(name[5:])) == [f"First{index}" for index in range(12)]
+    assert not set(names[0]) & set(names[1])
+
+
+def test_warm_up_starts_before_the_input_is_loaded(tmp_path, monkeypatch) -> None:
+    config_path, input_path = _write_inputs(tmp_path, 4)
+    events = []
+    load_leads = cli.load_leads
+    start_warm_up = VerificationOrchestrator.start_warm_up
+    monkeypatch.setattr(cli, "load_leads", lambda path: events.append("load") or load_leads(path))
+    monkeypatch.setattr(
+        VerificationOrchestrator, "start_warm_up", lambda self: events.append("warm up") or start_warm_up(self)
+    )
+
+    main([str(input_path), str(tmp_path / "results.csv"), "--config", str(config_path), "--shard", "1/2"])
+    options = {"concurrent": 1, "lead_concurrency": 1}
+    cli._run_shard(str(config_path), str(input_path), ShardSpec(index=0, count=2), options, "INFO")
+
+    assert events == ["warm up", "load", "warm up", "load"]
+
+    events.clear()
+    iter_leads = cli.iter_leads
+    monkeypatch.setattr(cli, "iter_leads", lambda path: events.append("read") or iter_leads(path))
+    arguments = ["--config", str(config_path), "--stream", "--time-budget", "60"]
+    main([str(input_path), str(tmp_path / "streamed.csv"), *arguments])
+
+    assert events == ["warm up", "read", "read"]
+
+
+def test_cli_processes_write_completed_shard_results_on_interrupt(tmp_path) -> None:
+    config_path, input_path = _write_inputs(tmp_path, 40)
+    config_path.write_text(
+        json.dumps(
+            {
+                "verify_batch_size": 1,
+                "scrapers": [
+                    {"name": "Echo", "class": "lead_verifier.scrapers.sample.EchoScraper", "rate_limit_per_minute": 120}
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+    output_path = tmp_path / "results.csv"
+
+    threading.Timer(4.0, os.kill, (os.getpid(), signal.SIGINT)).start()
+    started = time.monotonic()
+    assert main([str(input_path), str(output_path), "--config", str(config_path), "--processes", "2"]) == 130
+
+    assert time.monotonic() - started < 8.0
+    names = _read_first_names(output_path)
+    assert 0 < len(names) < 40
+    assert names == sorted(names, key=lambda name: int(name[5:]))
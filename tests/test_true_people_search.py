@@ -74,3 +74,43 @@ def test_verify_handles_no_results(scraper: TruePeopleSearchScraper) -> None:
         "emails": [],
         "query": {"full_name": "Grace Hopper", "city_state_zip": None},
     }
+
+
+def test_planned_queries_fall_back_to_broader_variants() -> None:
+    scraper = TruePeopleSearchScraper({"plan_queries": True})
+    queries: list[str | None] = []
+
+    def fake_search(query: PersonSearch) -> ScraperResult:
+        queries.append(query.city_state_zip)
+        result = ScraperResult(provider=scraper.provider, query=query, found=query.city_state_zip is None)
+        if result.found:
+            result.add_email("ada@example.com")
+        else:
+            result.not_found = True
+        return result
+
+    scraper.search = fake_search  # type: ignore[assignment]
+
+    verification = scraper.verify(LeadInput(name="Ada Lovelace", metadata={"city": "London", "zip": "SW1A"}))
+
+    assert queries == ["SW1A", "London", None]
+    assert [contact.value for contact in verification.contacts] == ["ada@example.com"]
+    assert verification.raw_data["query_variant"] == "name"
+    assert "not_found" not in verification.raw_data
+    assert scraper.query_planner.stats_for(None)["name_zip"].attempts == 1
+
+
+def test_planned_reparse_miss_leaves_the_planner_stats_untouched(tmp_path) -> None:
+    pytest.importorskip("bs4")
+    stats_path = tmp_path / "planner.json"
+    stats_path.write_text("{}", encoding="utf-8")
+    scraper = TruePeopleSearchScraper(
+        {"plan_queries": True, "query_stats_path": str(stats_path), "page_cache_dir": str(tmp_path), "reparse": True}
+    )
+
+    verification = scraper.verify(LeadInput(name="Ada Lovelace", metadata={"city": "London", "zip": "SW1A"}))
+
+    assert verification.raw_data["errors"] == [scraper.REPARSE_MISS_NOTE]
+    assert [attempt["variant"] for attempt in verification.raw_data["query_attempts"]] == ["name_zip"]
+    assert stats_path.read_text(encoding="utf-8") == "{}"
+    assert scraper.query_planner.stats_for(None) == {}
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import threading
+import time
 
 import pytest
 
+from lead_verifier import cancellation
 from lead_verifier.io import write_results
 from lead_verifier.orchestrator import VerificationOrchestrator
 from lead_verifier.scrapers.sample import EchoScraper
@@ -40,6 +42,7 @@ def test_run_verification_job_emits_progress_and_results(tmp_path) -> None:
 
     progress_events: list[tuple[int, int]] = []
     result_events: list = []
+    partial_events: list = []
 
     aggregated = run_verification_job(
         orchestrator,
@@ -47,9 +50,11 @@ def test_run_verification_job_emits_progress_and_results(tmp_path) -> None:
         mapping,
         progress_callback=lambda current, total: progress_events.append((current, total)),
         result_callback=lambda result: result_events.append(result),
+        partial_callback=partial_events.append,
     )
 
     assert aggregated == result_events
+    assert [partial.lead for partial in partial_events] == [result.lead for result in aggregated]
     assert progress_events == [(1, 2), (2, 2)]
     assert len(aggregated) == 2
 
@@ -91,3 +96,25 @@ def test_run_verification_job_respects_cancellation() -> None:
     assert len(aggregated) == 1
     assert cancel_event.is_set()
     assert aggregated[0].lead.name == "Carol Example"
+
+
+def test_run_verification_job_cancel_interrupts_lead_in_progress() -> None:
+    class StallingScraper:
+        name = "stalling"
+
+        def verify(self, lead):
+            if lead.name != "Carol Example":
+                cancellation.sleep(30)
+            return EchoScraper().verify(lead)
+
+    rows = [{"Name": "Carol Example"}, {"Name": "Dan Example"}, {"Name": "Erin Example"}]
+    cancel_event = threading.Event()
+    threading.Timer(0.2, cancel_event.set).start()
+
+    started = time.monotonic()
+    aggregated = run_verification_job(
+        VerificationOrchestrator([StallingScraper()]), rows, {"name": "Name"}, cancel_event=cancel_event
+    )
+
+    assert time.monotonic() - started < 1.0
+    assert [result.lead.name for result in aggregated] == ["Carol Example"]